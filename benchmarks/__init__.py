@@ -0,0 +1,9 @@
+"""
+Offline benchmarks for the chat path.
+
+Everything external is replaced by local stand-ins (fake embeddings, in-memory
+or local Qdrant, fake LLMs with configurable latency), so runs cost no API quota.
+
+    python -m benchmarks.chat_load --requests 500 --concurrency 32 --output runs/base.json
+    python -m benchmarks.compare runs/base.json runs/new.json
+"""
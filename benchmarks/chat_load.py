@@ -0,0 +1,265 @@
+"""
+Load test for the chat endpoints with every external dependency replaced by a local stand-in.
+
+The app (lawgpt.main:app) runs in-process, served by uvicorn on a loopback port
+(--transport http, real HTTP and real streaming) or called through httpx's ASGI
+transport (--transport asgi, lower overhead but responses are buffered, so no TTFT).
+Embeddings are deterministic fakes, Qdrant is in-memory (or a local server with
+--qdrant-url) seeded with synthetic points, gemini/openai use a fake chat model and
+custom_llm goes through the real transport to the stand-in app from
+lawgpt.service.custom_llm_stub.
+
+    python -m benchmarks.chat_load --requests 500 --concurrency 32 --models gemini,custom_llm
+    python -m benchmarks.chat_load --endpoint stream --output runs/stream.json --compare runs/base.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.fakes import FakeChatModel, FakeEmbeddings, aseed_collection, seed_collection, synthetic_points
+from benchmarks.report import compare, counter_summary, diff_samples, format_report, latency_summary, parse_metrics, stage_summary
+
+CUSTOM_LLM_STUB_URL = "http://custom-llm.benchmark/"
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline load test for the LawGPT chat path")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests")
+    parser.add_argument("--concurrency", type=int, default=16, help="Requests in flight")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests sent first")
+    parser.add_argument("--endpoint", choices=("chat", "stream"), default="chat")
+    parser.add_argument("--models", default="gemini", help="Comma-separated llm_model_ids, used round-robin")
+    parser.add_argument("--case-rag", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--law-rag", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--unique-queries", type=int, default=None, help="Distinct messages (default: one per request, i.e. no repeats)")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="Seconds per fake gemini/openai answer")
+    parser.add_argument("--custom-llm-latency", type=float, default=None, help="Seconds before the custom_llm stand-in answers (default: --llm-latency)")
+    parser.add_argument("--embed-latency", type=float, default=0.05, help="Seconds per fake embedding call")
+    parser.add_argument("--dimension", type=int, default=768, help="Fake embedding dimension")
+    parser.add_argument("--points", type=int, default=2000, help="Synthetic points per collection")
+    parser.add_argument("--qdrant-url", default=None, help="Use a local Qdrant server instead of in-memory (benchmark_* collections are recreated)")
+    parser.add_argument("--transport", choices=("http", "asgi"), default="http")
+    parser.add_argument("--no-caches", action="store_true", help="Disable answer, retrieval and query embedding caches")
+    parser.add_argument("--output", help="Write the result as JSON")
+    parser.add_argument("--compare", help="Baseline result JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.10, help="Allowed relative regression for --compare")
+    parser.add_argument("--verbose", action="store_true", help="Keep the app's INFO logs")
+    return parser.parse_args(argv)
+
+
+def configure_settings(args: argparse.Namespace, cache_dir: str):
+    """Point settings at the stand-ins. Must run before lawgpt modules with singletons are imported."""
+    os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+    from lawgpt.core.config import settings
+
+    # Assigned after import so a developer's .env cannot point the run at real services
+    overrides: Dict[str, Any] = {
+        "CACHE_DIR": cache_dir,
+        "REDIS_URL": None,
+        "QDRANT_URL": args.qdrant_url,
+        "QDRANT_API_KEY": None,
+        "QDRANT_LEGAL_CASES_COLLECTION_NAME": "benchmark_legal_cases",
+        "QDRANT_LAW_REFERENCE_COLLECTION_NAME": "benchmark_law_reference",
+        "CUSTOM_MODEL_URL": CUSTOM_LLM_STUB_URL,
+        "CASE_EMBEDDING_DIMENSION": args.dimension,
+        "LAW_EMBEDDING_DIMENSION": args.dimension,
+        "LANGCHAIN_TRACING_V2": "false",
+    }
+    if args.no_caches:
+        overrides.update({
+            "ANSWER_CACHE_ENABLED": False,
+            "RETRIEVAL_CACHE_BACKEND": "none",
+            "QUERY_EMBEDDING_CACHE_MAX_ENTRIES": 0,
+            "QUERY_EMBEDDING_CACHE_DISK": False,
+        })
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    os.environ["LANGCHAIN_TRACING_V2"] = "false"
+
+
+async def install_stand_ins(args: argparse.Namespace, models: List[str]):
+    """Replace embeddings, Qdrant and LLM backends with local fakes"""
+    from qdrant_client import AsyncQdrantClient, QdrantClient
+
+    from lawgpt.data_pipeline.registry import pipeline_registry
+    from lawgpt.llm.workflow.agent import get_chat_agent
+    from lawgpt.llm.workflow.custom_llm_transport import CustomLLMTransport, set_custom_llm_transport
+    from lawgpt.service.custom_llm_stub import create_stub_app
+
+    embeddings = FakeEmbeddings(dimension=args.dimension, latency=args.embed_latency)
+    pipeline_registry._embeddings = embeddings
+    for kind in ("case", "law"):
+        pipeline = getattr(pipeline_registry, f"{kind}_pipeline")
+        points = synthetic_points(kind, args.points, embeddings)
+        if args.qdrant_url is None:
+            pipeline.qdrant_client = QdrantClient(":memory:")
+            pipeline.async_qdrant_client = AsyncQdrantClient(":memory:")
+            seed_collection(pipeline.qdrant_client, pipeline.collection_name, points, args.dimension)
+            await aseed_collection(pipeline.async_qdrant_client, pipeline.collection_name, points, args.dimension)
+        else:
+            seed_collection(pipeline.qdrant_client, pipeline.collection_name, points, args.dimension)
+
+    custom_latency = args.llm_latency if args.custom_llm_latency is None else args.custom_llm_latency
+    for model_id in models:
+        if model_id == "custom_llm":
+            stub = create_stub_app(latency=custom_latency)
+            set_custom_llm_transport(CustomLLMTransport(transport=httpx.ASGITransport(app=stub)))
+        else:
+            get_chat_agent(model_id).llm = FakeChatModel(latency=args.llm_latency)
+
+
+def build_requests(args: argparse.Namespace, models: List[str], count: int, prefix: str) -> List[Dict[str, Any]]:
+    unique = args.unique_queries or count
+    return [
+        {
+            "message": f"{prefix} What is the punishment for offence {i % unique} under the Penal Code?",
+            "llm_model_id": models[i % len(models)],
+            "is_case_rag": args.case_rag,
+            "is_law_rag": args.law_rag,
+        }
+        for i in range(count)
+    ]
+
+
+async def send(client: httpx.AsyncClient, endpoint: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    """One request; returns latency, time to first token (stream only) and error"""
+    start = time.perf_counter()
+    ttft = None
+    try:
+        if endpoint == "stream":
+            async with client.stream("POST", "/api/v1/chat/stream", json=body) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if line == "event: token" and ttft is None:
+                        ttft = time.perf_counter() - start
+                    elif line == "event: error":
+                        raise RuntimeError("stream error event")
+        else:
+            response = await client.post("/api/v1/chat", json=body)
+            response.raise_for_status()
+        return {"latency": time.perf_counter() - start, "ttft": ttft, "error": None}
+    except Exception as e:
+        return {"latency": time.perf_counter() - start, "ttft": ttft, "error": f"{type(e).__name__}: {e}"}
+
+
+async def drive(client: httpx.AsyncClient, args: argparse.Namespace, bodies: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Closed-loop load: `concurrency` workers each send their next request as soon as the last one finishes"""
+    queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+    for body in bodies:
+        queue.put_nowait(body)
+    results: List[Dict[str, Any]] = []
+
+    async def worker():
+        while not queue.empty():
+            body = queue.get_nowait()
+            results.append(await send(client, args.endpoint, body))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    wall_seconds = time.perf_counter() - start
+
+    ok = [result for result in results if result["error"] is None]
+    errors = [result["error"] for result in results if result["error"] is not None]
+    ttfts = [result["ttft"] for result in ok if result["ttft"] is not None]
+    return {
+        "completed": len(ok),
+        "failed": len(errors),
+        "errors": sorted(set(errors))[:10],
+        "wall_seconds": wall_seconds,
+        "rps": len(ok) / wall_seconds if wall_seconds else 0.0,
+        "latency": latency_summary([result["latency"] for result in ok]),
+        "ttft": latency_summary(ttfts) if ttfts else None,
+    }
+
+
+async def run_with_client(args: argparse.Namespace, client: httpx.AsyncClient, models: List[str]) -> Dict[str, Any]:
+    if args.warmup:
+        await drive(client, args, build_requests(args, models, args.warmup, "[warmup]"))
+    before = parse_metrics((await client.get("/metrics")).text)
+    client_result = await drive(client, args, build_requests(args, models, args.requests, ""))
+    after = parse_metrics((await client.get("/metrics")).text)
+    samples = diff_samples(before, after)
+    return {
+        "client": client_result,
+        "stages": stage_summary(samples),
+        "counters": counter_summary(samples),
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    models = [model.strip() for model in args.models.split(",") if model.strip()]
+    await install_stand_ins(args, models)
+
+    from lawgpt.main import app
+
+    limits = httpx.Limits(max_connections=args.concurrency + 4, max_keepalive_connections=args.concurrency + 4)
+    timeout = httpx.Timeout(600.0)
+    if args.transport == "asgi":
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark", timeout=timeout) as client:
+                return await run_with_client(args, client, models)
+
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", lifespan="on"))
+    serve_task = asyncio.create_task(server.serve())
+    while not server.started:
+        if serve_task.done():
+            serve_task.result()
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=timeout) as client:
+            return await run_with_client(args, client, models)
+    finally:
+        server.should_exit = True
+        await serve_task
+
+
+def quiet_app_logs():
+    """The app logs every request at INFO; keep warnings and errors only"""
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("lawgpt") or name.startswith("httpx"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="lawgpt-bench-") as cache_dir:
+        configure_settings(args, cache_dir)
+        import lawgpt.main  # noqa: F401  (configures logging on import)
+        if not args.verbose:
+            quiet_app_logs()
+
+        result = asyncio.run(run(args))
+
+    result["config"] = {key: value for key, value in vars(args).items() if key not in ("output", "compare", "verbose")}
+    result["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    print(format_report(result))
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(result, file, indent=2)
+        print(f"saved {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        report, regressed = compare(baseline, result, args.max_regression)
+        print(report)
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
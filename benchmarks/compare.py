@@ -0,0 +1,33 @@
+"""
+Compare two saved benchmark runs.
+
+    python -m benchmarks.compare runs/base.json runs/new.json --max-regression 0.1
+
+Exits with status 1 when RPS or p50/p95/p99 latency regressed by more than the threshold.
+"""
+import argparse
+import json
+import sys
+
+from benchmarks.report import compare
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--max-regression", type=float, default=0.10, help="Allowed relative regression (fraction)")
+    args = parser.parse_args()
+
+    with open(args.baseline, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, "r", encoding="utf-8") as file:
+        current = json.load(file)
+
+    report, regressed = compare(baseline, current, args.max_regression)
+    print(report)
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Recall, memory and latency of reduced embedding dimensions against the 3072-d baseline.
+
+Each reduced collection is expected to be a re-embedded copy of the baseline
+(python -m lawgpt.data_pipeline.reembed_collection, which keeps point ids and
+names it <baseline>_<dimension>). For every query the top-k ids of a reduced
+collection are compared with the baseline's top-k: recall@k = overlap / k.
+
+    python -m benchmarks.embedding_dimensions law --dimensions 768,1536 --queries queries.txt
+    python -m benchmarks.embedding_dimensions case --dimensions 768,1536 --output runs/dims.json
+    python -m benchmarks.embedding_dimensions law --dimensions 768,1536 --synthetic
+
+Without --queries, queries are cut from the text of sampled points. --synthetic
+needs no Qdrant or API key (fake embeddings, in-memory collections); its recall
+numbers come from random vectors and are only a lower bound for real text.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from qdrant_client import QdrantClient, models
+
+from benchmarks.report import latency_summary
+
+BASELINE_DIMENSION = 3072
+
+# Qdrant's sizing rule of thumb: vectors plus index and bookkeeping ~ 1.5x raw float32 data
+QDRANT_MEMORY_FACTOR = 1.5
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare reduced embedding dimensions with the 3072-d baseline")
+    parser.add_argument("kind", choices=("case", "law"), help="Which collection to measure")
+    parser.add_argument("--dimensions", default="768,1536", help="Comma-separated reduced dimensions")
+    parser.add_argument("--baseline", default=None, help="Baseline (3072-d) collection (default: the configured one)")
+    parser.add_argument("--k", type=int, default=10, help="Results per query compared for recall@k")
+    parser.add_argument("--queries", default=None, help="File with one query per line")
+    parser.add_argument("--samples", type=int, default=100, help="Queries sampled from points when --queries is not given")
+    parser.add_argument("--synthetic", action="store_true", help="Fake embeddings and in-memory collections")
+    parser.add_argument("--points", type=int, default=5000, help="Points per collection with --synthetic")
+    parser.add_argument("--output", help="Write the result as JSON")
+    return parser.parse_args(argv)
+
+
+def sample_queries(client: QdrantClient, collection_name: str, text_of, count: int, length: int = 200) -> List[str]:
+    """Leading text of the first `count` points, used as stand-in queries"""
+    records, _ = client.scroll(collection_name=collection_name, limit=count, with_payload=True, with_vectors=False)
+    return [text_of(record.payload or {})[:length] for record in records]
+
+
+def search_ids(client: QdrantClient, collection_name: str, vector: List[float], k: int) -> List[Any]:
+    response = client.query_points(collection_name=collection_name, query=vector, limit=k, with_payload=False)
+    return [point.id for point in response.points]
+
+
+def memory_estimate(points: int, dimension: int) -> Dict[str, float]:
+    raw = points * dimension * 4
+    return {
+        "vector_mib": raw / 1024 / 1024,
+        "estimated_ram_mib": raw * QDRANT_MEMORY_FACTOR / 1024 / 1024,
+    }
+
+
+def measure(client: QdrantClient, embeddings, queries: List[str], collections: Dict[int, str], k: int) -> Dict[str, Any]:
+    """
+    Embed the queries at every dimension, search each collection and score against the baseline.
+
+    Args:
+        client: Qdrant client holding all collections
+        embeddings: Embeddings supporting output_dimensionality
+        queries: Query texts
+        collections: dimension -> collection name, including BASELINE_DIMENSION
+        k: Results compared per query
+
+    Returns:
+        Per-dimension recall@k, embedding and search latency, points and memory estimate
+    """
+    baseline_ids: List[List[Any]] = []
+    results: Dict[str, Any] = {}
+    for dimension in sorted(collections, reverse=True):
+        collection_name = collections[dimension]
+        embed_latencies, search_latencies, recalls = [], [], []
+        for i, query in enumerate(queries):
+            start = time.perf_counter()
+            vector = embeddings.embed_query(query, output_dimensionality=dimension)
+            embed_latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            ids = search_ids(client, collection_name, vector, k)
+            search_latencies.append(time.perf_counter() - start)
+
+            if dimension == BASELINE_DIMENSION:
+                baseline_ids.append(ids)
+            expected = baseline_ids[i]
+            if expected:
+                recalls.append(len(set(ids) & set(expected)) / len(expected))
+
+        points = client.count(collection_name=collection_name, exact=True).count
+        results[str(dimension)] = {
+            "collection": collection_name,
+            "points": points,
+            f"recall@{k}": sum(recalls) / len(recalls) if recalls else None,
+            "embed_latency": latency_summary(embed_latencies),
+            "search_latency": latency_summary(search_latencies),
+            **memory_estimate(points, dimension),
+        }
+    return results
+
+
+def build_synthetic(client: QdrantClient, embeddings, dimensions: List[int], points: int, batch_size: int = 256) -> Dict[int, str]:
+    """In-memory collections with the same fake texts embedded at every dimension"""
+    texts = [f"synthetic point {i}" for i in range(points)]
+    collections = {}
+    for dimension in dimensions:
+        name = f"synthetic_{dimension}"
+        client.create_collection(name, vectors_config=models.VectorParams(size=dimension, distance=models.Distance.COSINE))
+        for start in range(0, points, batch_size):
+            batch = texts[start:start + batch_size]
+            vectors = embeddings.embed_documents(batch, output_dimensionality=dimension)
+            client.upsert(name, [
+                models.PointStruct(id=start + i, vector=vector, payload={"content": text})
+                for i, (text, vector) in enumerate(zip(batch, vectors))
+            ])
+        collections[dimension] = name
+    return collections
+
+
+def format_report(result: Dict[str, Any], k: int) -> str:
+    lines = [f"{'dim':>5} {'points':>8} {f'recall@{k}':>10} {'vectors':>11} {'est. RAM':>11} {'embed p50':>11} {'search p50':>11} {'search p95':>11}"]
+    for dimension, entry in result.items():
+        recall = entry[f"recall@{k}"]
+        lines.append(
+            f"{dimension:>5} {entry['points']:>8} {'-' if recall is None else f'{recall:.3f}':>10} "
+            f"{entry['vector_mib']:>7.1f} MiB {entry['estimated_ram_mib']:>7.1f} MiB "
+            f"{entry['embed_latency']['p50'] * 1000:>8.1f} ms {entry['search_latency']['p50'] * 1000:>8.1f} ms "
+            f"{entry['search_latency']['p95'] * 1000:>8.1f} ms"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    dimensions = sorted({int(d) for d in args.dimensions.split(",") if d.strip()} | {BASELINE_DIMENSION}, reverse=True)
+
+    if args.synthetic:
+        from benchmarks.fakes import FakeEmbeddings
+
+        embeddings = FakeEmbeddings(dimension=BASELINE_DIMENSION)
+        client = QdrantClient(":memory:")
+        collections = build_synthetic(client, embeddings, dimensions, args.points)
+        queries = [f"synthetic query {i}" for i in range(args.samples)]
+    else:
+        from lawgpt.data_pipeline.rag_case_pipeline import CaseRAGPipeline
+        from lawgpt.data_pipeline.rag_law_pipeline import LawRAGPipeline
+
+        pipeline_cls = CaseRAGPipeline if args.kind == "case" else LawRAGPipeline
+        baseline = pipeline_cls(search_only=True, collection_name=args.baseline)
+        embeddings, client = baseline.embeddings, baseline.qdrant_client
+        collections = {
+            dimension: baseline.collection_name if dimension == BASELINE_DIMENSION else f"{baseline.collection_name}_{dimension}"
+            for dimension in dimensions
+        }
+        missing = [name for name in collections.values() if not client.collection_exists(name)]
+        if missing:
+            print(f"❌ Missing collections: {', '.join(missing)} (create them with lawgpt.data_pipeline.reembed_collection)")
+            sys.exit(1)
+        if args.queries:
+            with open(args.queries, "r", encoding="utf-8") as file:
+                queries = [line.strip() for line in file if line.strip()]
+        else:
+            queries = sample_queries(client, baseline.collection_name, baseline.embedding_text, args.samples)
+
+    print(f"📏 {len(queries)} queries, k={args.k}, dimensions {', '.join(map(str, dimensions))}")
+    result = measure(client, embeddings, queries, collections, args.k)
+    print(format_report(result, args.k))
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"config": vars(args), "dimensions": result}, file, indent=2)
+        print(f"saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
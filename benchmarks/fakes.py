@@ -0,0 +1,141 @@
+"""
+Local stand-ins for the external services used on the chat path.
+"""
+import asyncio
+import hashlib
+import time
+from typing import Any, AsyncIterator, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
+
+
+class FakeEmbeddings(Embeddings):
+    """
+    Deterministic embeddings: each text maps to a fixed random unit vector seeded
+    by its hash. `latency` is slept once per call to mimic the embedding API.
+    output_dimensionality returns the re-normalized leading components, like a
+    Matryoshka-trained model.
+    """
+
+    def __init__(self, dimension: int = 768, latency: float = 0.0, model: str = "benchmark/fake-embedding"):
+        self.dimension = dimension
+        self.latency = latency
+        self.model = model
+        self.calls = 0
+
+    def vector(self, text: str, output_dimensionality: Optional[int] = None) -> List[float]:
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        vector = np.random.default_rng(seed).standard_normal(self.dimension).astype(np.float32)
+        vector = vector[:output_dimensionality or self.dimension]
+        return (vector / np.linalg.norm(vector)).tolist()
+
+    def embed_query(self, text: str, output_dimensionality: Optional[int] = None, **kwargs: Any) -> List[float]:
+        self.calls += 1
+        time.sleep(self.latency)
+        return self.vector(text, output_dimensionality)
+
+    def embed_documents(self, texts: List[str], output_dimensionality: Optional[int] = None, **kwargs: Any) -> List[List[float]]:
+        self.calls += 1
+        time.sleep(self.latency)
+        return [self.vector(text, output_dimensionality) for text in texts]
+
+    async def aembed_query(self, text: str, output_dimensionality: Optional[int] = None, **kwargs: Any) -> List[float]:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return self.vector(text, output_dimensionality)
+
+    async def aembed_documents(self, texts: List[str], output_dimensionality: Optional[int] = None, **kwargs: Any) -> List[List[float]]:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return [self.vector(text, output_dimensionality) for text in texts]
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model that answers after `latency` seconds; streaming spreads the latency over the tokens"""
+
+    latency: float = 0.5
+    answer: str = (
+        "Under section 379 of the Penal Code, 1860, theft is punishable with imprisonment "
+        "of either description for a term which may extend to three years, or with fine, or with both."
+    )
+
+    @property
+    def _llm_type(self) -> str:
+        return "benchmark_fake"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Optional[Any] = None, **kwargs: Any) -> ChatResult:
+        time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.answer))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Optional[Any] = None, **kwargs: Any) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.answer))])
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Optional[Any] = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        tokens = [token + " " for token in self.answer.split(" ")]
+        delay = self.latency / len(tokens)
+        for token in tokens:
+            await asyncio.sleep(delay)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+
+def synthetic_points(kind: str, count: int, embeddings: FakeEmbeddings) -> List[models.PointStruct]:
+    """Case or law points shaped like the ingestion scripts' payloads"""
+    # Imported here: lawgpt settings must not load before chat_load.configure_settings runs
+    from lawgpt.data_pipeline.law_section_store import section_id
+
+    points = []
+    for i in range(count):
+        if kind == "case":
+            payload = {
+                "case_title": f"State vs. Accused {i}",
+                "division": "High Court Division" if i % 2 else "Appellate Division",
+                "law_category": "Criminal",
+                "law_act": "The Penal Code, 1860",
+                "reference": f"Section {300 + i % 200}",
+                "case_details": f"Summary of case {i}. " * 40,
+            }
+            text = payload["case_details"]
+        else:
+            chunk_content = f"Section {i}: provisions on offence number {i}. " * 20
+            payload = {
+                "part_section": f"Part {i // 50}, Section {i}",
+                "section_id": section_id(f"Part {i // 50}, Section {i}", chunk_content * 3),
+                "chunk_content": chunk_content,
+                "chunk_index": 0,
+                "total_chunks": 1,
+                "is_chunked": False,
+            }
+            text = chunk_content
+        points.append(models.PointStruct(id=i, vector=embeddings.vector(f"{kind}:{text}"), payload=payload))
+    return points
+
+
+def _vectors_config(dimension: int) -> models.VectorParams:
+    return models.VectorParams(size=dimension, distance=models.Distance.COSINE)
+
+
+def seed_collection(client: QdrantClient, collection_name: str, points: List[models.PointStruct], dimension: int, batch_size: int = 256):
+    """(Re)create a collection and upload the points"""
+    if client.collection_exists(collection_name):
+        client.delete_collection(collection_name)
+    client.create_collection(collection_name, vectors_config=_vectors_config(dimension))
+    for start in range(0, len(points), batch_size):
+        client.upsert(collection_name, points[start:start + batch_size])
+
+
+async def aseed_collection(client: AsyncQdrantClient, collection_name: str, points: List[models.PointStruct], dimension: int, batch_size: int = 256):
+    """Async variant of seed_collection (in-memory async clients have their own storage)"""
+    if await client.collection_exists(collection_name):
+        await client.delete_collection(collection_name)
+    await client.create_collection(collection_name, vectors_config=_vectors_config(dimension))
+    for start in range(0, len(points), batch_size):
+        await client.upsert(collection_name, points[start:start + batch_size])
@@ -0,0 +1,193 @@
+"""
+Result summaries for benchmark runs: client-side latency percentiles, per-stage
+numbers scraped from /metrics, and run-to-run comparison.
+"""
+import math
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Stage histograms from lawgpt/core/metrics.py, reported per run
+STAGE_METRICS = {
+    "embedding": "lawgpt_query_embedding_seconds",
+    "case_search": "lawgpt_case_search_seconds",
+    "law_search": "lawgpt_law_search_seconds",
+    "admission_wait": "lawgpt_admission_wait_seconds",
+    "prompt_assembly": "lawgpt_prompt_assembly_seconds",
+    "llm": "lawgpt_llm_seconds",
+    "custom_llm_http": "lawgpt_custom_llm_http_seconds",
+    "request": "lawgpt_request_seconds",
+}
+COUNTER_METRICS = ("lawgpt_errors_total", "lawgpt_cache_hits_total", "lawgpt_cache_misses_total", "lawgpt_context_items_total", "lawgpt_admission_rejections_total")
+
+_SAMPLE = re.compile(r'^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(?P<labels>[^}]*)\})? (?P<value>\S+)$')
+_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+# (metric name, labels without "le") -> value
+Samples = Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float]
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile (q in 0..100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, Optional[float]]:
+    return {
+        "mean": sum(latencies) / len(latencies) if latencies else None,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies) if latencies else None,
+    }
+
+
+def parse_metrics(text: str) -> Samples:
+    """Parse Prometheus text exposition into {(name, labels): value}; bucket bounds stay in the labels"""
+    samples: Samples = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        match = _SAMPLE.match(line)
+        if match is None:
+            continue
+        labels = tuple(sorted(_LABEL.findall(match.group("labels") or "")))
+        samples[(match.group("name"), labels)] = float(match.group("value"))
+    return samples
+
+
+def diff_samples(before: Samples, after: Samples) -> Samples:
+    """Per-run deltas of cumulative samples"""
+    return {key: value - before.get(key, 0.0) for key, value in after.items()}
+
+
+def _series_label(labels: Tuple[Tuple[str, str], ...]) -> str:
+    parts = [f"{name}={value}" for name, value in labels if name != "le"]
+    return ",".join(parts)
+
+
+def _histogram_quantile(q: float, buckets: List[Tuple[float, float]]) -> Optional[float]:
+    """Linear interpolation inside cumulative buckets, like PromQL histogram_quantile"""
+    buckets = sorted(buckets)
+    total = buckets[-1][1] if buckets else 0
+    if total <= 0:
+        return None
+    target = q * total
+    previous_bound, previous_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= target:
+            if math.isinf(bound):
+                return previous_bound
+            if count == previous_count:
+                return bound
+            return previous_bound + (bound - previous_bound) * (target - previous_count) / (count - previous_count)
+        previous_bound, previous_count = bound, count
+    return previous_bound
+
+
+def stage_summary(samples: Samples) -> Dict[str, Dict[str, Any]]:
+    """Mean and estimated p95 per stage (and per label set, e.g. llm_model_id)"""
+    stages: Dict[str, Dict[str, Any]] = {}
+    for stage, metric in STAGE_METRICS.items():
+        series: Dict[str, Dict[str, Any]] = {}
+        for (name, labels), value in samples.items():
+            if not name.startswith(metric) or name[len(metric):] not in ("_sum", "_count", "_bucket"):
+                continue
+            entry = series.setdefault(_series_label(labels), {"sum": 0.0, "count": 0.0, "buckets": []})
+            if name.endswith("_sum"):
+                entry["sum"] = value
+            elif name.endswith("_count"):
+                entry["count"] = value
+            else:
+                bound = dict(labels)["le"]
+                entry["buckets"].append((float("inf") if bound == "+Inf" else float(bound), value))
+        for label, entry in series.items():
+            if entry["count"] <= 0:
+                continue
+            key = f"{stage}[{label}]" if label else stage
+            stages[key] = {
+                "count": int(entry["count"]),
+                "mean": entry["sum"] / entry["count"],
+                "p95_estimate": _histogram_quantile(0.95, entry["buckets"]),
+            }
+    return stages
+
+
+def counter_summary(samples: Samples) -> Dict[str, float]:
+    counters = {}
+    for (name, labels), value in samples.items():
+        if name in COUNTER_METRICS and value:
+            label = _series_label(labels)
+            counters[f"{name}[{label}]" if label else name] = value
+    return counters
+
+
+def _fmt_seconds(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 1000:9.1f} ms"
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    client = result["client"]
+    lines = [
+        f"requests: {client['completed']} ok, {client['failed']} failed in {client['wall_seconds']:.2f}s "
+        f"-> {client['rps']:.1f} req/s (concurrency {result['config']['concurrency']})",
+        "latency:  " + "  ".join(f"{name} {_fmt_seconds(client['latency'][name])}" for name in ("p50", "p95", "p99", "max")),
+    ]
+    if client.get("ttft"):
+        lines.append("ttft:     " + "  ".join(f"{name} {_fmt_seconds(client['ttft'][name])}" for name in ("p50", "p95", "p99")))
+    lines.append("stages (server side):")
+    for stage, entry in result["stages"].items():
+        lines.append(f"  {stage:<44} n={entry['count']:<6} mean {_fmt_seconds(entry['mean'])}  p95~ {_fmt_seconds(entry['p95_estimate'])}")
+    if result["counters"]:
+        lines.append("counters:")
+        for name, value in result["counters"].items():
+            lines.append(f"  {name:<56} {value:g}")
+    return "\n".join(lines)
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], max_regression: float = 0.10) -> Tuple[str, bool]:
+    """
+    Relative change per headline number and stage mean.
+
+    Returns the report and whether any of RPS, p50/p95/p99 regressed by more
+    than max_regression (fraction).
+    """
+    rows: List[Tuple[str, Optional[float], Optional[float], bool]] = [
+        ("rps", baseline["client"]["rps"], current["client"]["rps"], True),
+    ]
+    for name in ("p50", "p95", "p99"):
+        rows.append((f"latency {name}", baseline["client"]["latency"][name], current["client"]["latency"][name], False))
+    for stage in sorted(set(baseline["stages"]) | set(current["stages"])):
+        rows.append((
+            f"stage {stage} mean",
+            baseline["stages"].get(stage, {}).get("mean"),
+            current["stages"].get(stage, {}).get("mean"),
+            False,
+        ))
+
+    regressed = False
+    lines = []
+    config_changes = {
+        key: (baseline.get("config", {}).get(key), value)
+        for key, value in current.get("config", {}).items()
+        if baseline.get("config", {}).get(key) != value
+    }
+    if config_changes:
+        lines.append("note: runs used different settings: " + ", ".join(f"{key} {old} -> {new}" for key, (old, new) in config_changes.items()))
+    lines.append(f"{'metric':<48} {'baseline':>12} {'current':>12} {'change':>9}")
+    for index, (name, old, new, higher_is_better) in enumerate(rows):
+        if old is None or new is None or old == 0:
+            lines.append(f"{name:<48} {'-' if old is None else f'{old:.4f}':>12} {'-' if new is None else f'{new:.4f}':>12} {'-':>9}")
+            continue
+        change = (new - old) / old
+        worse = -change if higher_is_better else change
+        # Only the headline numbers gate the exit status; stage means are informational
+        flag = ""
+        if worse > max_regression:
+            flag = "  REGRESSION" if index < 4 else "  slower"
+            regressed = regressed or index < 4
+        lines.append(f"{name:<48} {old:>12.4f} {new:>12.4f} {change:>+8.1%}{flag}")
+    return "\n".join(lines), regressed
@@ -1,8 +1,24 @@
 from fastapi import APIRouter, HTTPException, Request
-from typing import Dict, Any
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, AsyncIterator
+import json
 import logging
+import time
 
-from lawgpt.api.schema.chat import ChatRequest, ChatResponse
+from langchain_core.messages import AIMessageChunk, HumanMessage
+
+from lawgpt.api.schema.chat import (
+    ChatBatchItemResponse,
+    ChatBatchRequest,
+    ChatCitation,
+    ChatRequest,
+    ChatResponse,
+)
+from lawgpt.core.config import settings
+from lawgpt.core.metrics import ERRORS, REQUEST_SECONDS
+from lawgpt.llm.workflow.admission import AdmissionRejected, admission_controller
+from lawgpt.llm.workflow.batch import ChatBatchRunner
+from lawgpt.llm.workflow.deadline import DeadlineExceeded, resolve_deadline
 from lawgpt.llm.workflow.graph import create_chat_workflow
 
 logger = logging.getLogger(__name__)
@@ -21,23 +37,15 @@ async def chat(chat_request: ChatRequest, request: Request) -> ChatResponse:
     Chat endpoint that processes user messages through LangGraph workflow - Stateless
     """
     logger.info(f"Chat endpoint received request - model: {chat_request.llm_model_id}, case_rag: {chat_request.is_case_rag}, law_rag: {chat_request.is_law_rag}, message_length: {len(chat_request.message)}")
+    _admit(chat_request)
     try:
-        # Prepare input with proper LangChain message format
-        from langchain_core.messages import HumanMessage
-        
-        # Stateless input - no thread_id or session management
-        input_data = {
-            "messages": [HumanMessage(content=chat_request.message)],
-            "is_case_rag": chat_request.is_case_rag,
-            "is_law_rag": chat_request.is_law_rag,
-            "llm_model_id": chat_request.llm_model_id,
-            "rag_context": []
-        }
+        input_data = _build_workflow_input(chat_request)
         logger.info(f"Prepared stateless workflow input data")
         
         # Run the workflow - no config needed for stateless operation
         logger.info(f"Invoking stateless workflow...")
-        result = await workflow.ainvoke(input_data)
+        with REQUEST_SECONDS.time(endpoint="chat"):
+            result = await workflow.ainvoke(input_data)
         logger.info(f"Workflow completed")
         
         # Extract the final response
@@ -46,11 +54,132 @@ async def chat(chat_request: ChatRequest, request: Request) -> ChatResponse:
         
         return ChatResponse(response=final_message)
         
+    except AdmissionRejected as e:
+        raise _rejection_response(e)
+        
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e))
+        
     except Exception as e:
+        ERRORS.inc(stage="request")
         logger.error(f"Chat endpoint error - model: {chat_request.llm_model_id}, error: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post("/chat/stream")
+async def chat_stream(chat_request: ChatRequest, request: Request) -> StreamingResponse:
+    """
+    Streaming chat endpoint (Server-Sent Events).
+    
+    Emits one `citations` event as soon as retrieval finishes, then `token` events
+    from the LLM node, then `done`. Failures are reported as an `error` event.
+    """
+    logger.info(f"Chat stream endpoint received request - model: {chat_request.llm_model_id}, case_rag: {chat_request.is_case_rag}, law_rag: {chat_request.is_law_rag}, message_length: {len(chat_request.message)}")
+    _admit(chat_request)
+    input_data = _build_workflow_input(chat_request)
+    
+    async def event_stream() -> AsyncIterator[str]:
+        streamed_tokens = False
+        start = time.perf_counter()
+        try:
+            async for mode, chunk in workflow.astream(input_data, stream_mode=["updates", "messages"]):
+                if mode == "messages":
+                    message, metadata = chunk
+                    # Only token chunks from the LLM node; full messages are handled via updates
+                    if metadata.get("langgraph_node") == "llm" and isinstance(message, AIMessageChunk) and message.content:
+                        streamed_tokens = True
+                        yield _format_sse("token", {"content": message.content})
+                    continue
+                for node, update in chunk.items():
+                    update = update or {}
+                    if node in ("rag", "cache_lookup") and "rag_context" in update:
+                        citations = [ChatCitation(**item).model_dump() for item in update["rag_context"]]
+                        yield _format_sse("citations", {"citations": citations})
+                    if node in ("llm", "cache_lookup") and update.get("messages") and not streamed_tokens:
+                        # Cache hit or backend did not stream (e.g. custom_llm, error reply) - send the whole answer
+                        yield _format_sse("token", {"content": update["messages"][-1].content})
+            yield _format_sse("done", {})
+            logger.info("Chat stream completed")
+        except AdmissionRejected as e:
+            yield _format_sse("error", {"detail": str(e), "status": e.status_code, "retry_after": e.retry_after})
+        except DeadlineExceeded as e:
+            yield _format_sse("error", {"detail": str(e), "status": 504})
+        except Exception as e:
+            ERRORS.inc(stage="request")
+            logger.error(f"Chat stream error - model: {chat_request.llm_model_id}, error: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+            yield _format_sse("error", {"detail": f"Internal server error: {str(e)}"})
+        finally:
+            REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint="chat_stream")
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/chat/batch")
+async def chat_batch(batch_request: ChatBatchRequest, request: Request) -> StreamingResponse:
+    """
+    Batch chat endpoint for evaluations and bulk workloads.
+    
+    Streams one JSON line per item (application/x-ndjson), in request order.
+    """
+    items = batch_request.items
+    logger.info(f"Chat batch endpoint received {len(items)} items")
+    if len(items) > settings.CHAT_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch too large: {len(items)} items (max {settings.CHAT_BATCH_MAX_ITEMS})")
+    
+    async def result_stream() -> AsyncIterator[str]:
+        runner = ChatBatchRunner()
+        start = time.perf_counter()
+        try:
+            async for result in runner.run([item.model_dump() for item in items]):
+                yield ChatBatchItemResponse(**result).model_dump_json() + "\n"
+            logger.info(f"Chat batch completed - {len(items)} items")
+        except Exception as e:
+            ERRORS.inc(stage="request")
+            logger.error(f"Chat batch error: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+            yield json.dumps({"error": f"Internal server error: {str(e)}"}) + "\n"
+        finally:
+            REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint="chat_batch")
+    
+    return StreamingResponse(result_stream(), media_type="application/x-ndjson")
+
+
+def _build_workflow_input(chat_request: ChatRequest) -> Dict[str, Any]:
+    """Stateless workflow input - no thread_id or session management"""
+    return {
+        "messages": [HumanMessage(content=chat_request.message)],
+        "is_case_rag": chat_request.is_case_rag,
+        "is_law_rag": chat_request.is_law_rag,
+        "llm_model_id": chat_request.llm_model_id,
+        "rag_context": [],
+        "deadline": resolve_deadline(chat_request.llm_model_id, chat_request.deadline_seconds)
+    }
+
+
+def _admit(chat_request: ChatRequest):
+    """Fail fast with 429 when the model's wait queue is already full"""
+    try:
+        admission_controller.check(chat_request.llm_model_id)
+    except AdmissionRejected as e:
+        raise _rejection_response(e)
+
+
+def _rejection_response(rejection: AdmissionRejected) -> HTTPException:
+    return HTTPException(
+        status_code=rejection.status_code,
+        detail=str(rejection),
+        headers={"Retry-After": str(rejection.retry_after)}
+    )
+
+
+def _format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Serialize one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 # @router.post("/chat/reset")
 # async def reset_chat(request: Request, thread_id: str) -> Dict[str, Any]:
 #     """
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
 
 
 class ChatRequest(BaseModel):
@@ -6,6 +8,25 @@ class ChatRequest(BaseModel):
     llm_model_id: str
     is_case_rag: bool
     is_law_rag: bool
+    # Total time budget; capped by the server's CHAT_DEADLINE_SECONDS (not used by /chat/batch)
+    deadline_seconds: Optional[float] = Field(default=None, gt=0)
 
 class ChatResponse(BaseModel):
     response: str
+
+
+class ChatCitation(BaseModel):
+    type: str
+    case_title: Optional[str] = None
+    part_section: Optional[str] = None
+    score: Optional[float] = None
+
+
+class ChatBatchRequest(BaseModel):
+    items: List[ChatRequest] = Field(min_length=1)
+
+
+class ChatBatchItemResponse(BaseModel):
+    index: int
+    response: Optional[str] = None
+    error: Optional[str] = None
@@ -1,7 +1,7 @@
 import logging
 import os
 from functools import lru_cache
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import AnyHttpUrl, PostgresDsn, RedisDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -18,10 +18,118 @@ class Settings(BaseSettings):
     QDRANT_API_KEY: Optional[str] = None
     QDRANT_LEGAL_CASES_COLLECTION_NAME: Optional[str] = "bd_legal_cases"
     QDRANT_LAW_REFERENCE_COLLECTION_NAME: Optional[str] = "bd_law_reference"
+    # Full law sections, stored once and referenced from chunks by section_id
+    QDRANT_LAW_SECTION_COLLECTION_NAME: Optional[str] = "bd_law_sections"
+
+    # Embedding output dimension per collection (gemini-embedding-001: 768, 1536 or 3072).
+    # Changing it needs a re-index: python -m lawgpt.data_pipeline.reembed_collection
+    CASE_EMBEDDING_DIMENSION: int = 3072
+    LAW_EMBEDDING_DIMENSION: int = 3072
+    # Texts per batched document-embedding call during ingestion (Gemini allows up to 100)
+    EMBEDDING_BATCH_SIZE: int = 100
+    # Persistent store of ingested chunk/case embeddings (memmapped arrays under CACHE_DIR/embeddings),
+    # so re-indexing unchanged content reads vectors from disk instead of calling Gemini
+    EMBEDDING_STORE_ENABLED: bool = True
+
+    # Case summarization during ingestion: summaries in flight, request rate limit
+    # (retries included) and retries on 429/5xx with exponential backoff
+    CASE_SUMMARY_MAX_CONCURRENCY: int = 8
+    CASE_SUMMARY_REQUESTS_PER_MINUTE: float = 120.0
+    CASE_SUMMARY_MAX_RETRIES: int = 5
+    # Persistent summary cache (SQLite under CACHE_DIR) keyed on case details + prompts + model,
+    # so re-indexing unchanged cases skips summarization
+    CASE_SUMMARY_CACHE_ENABLED: bool = True
+
+    # Vector storage for new collections (apply to existing ones with
+    # python -m lawgpt.data_pipeline.apply_collection_config). Quantization: "none",
+    # "scalar" (int8, 4x smaller) or "binary" (32x smaller); datatype "float32" or "float16".
+    QDRANT_QUANTIZATION: str = "none"
+    QDRANT_QUANTIZATION_ALWAYS_RAM: bool = True
+    QDRANT_VECTOR_DATATYPE: str = "float32"
+    QDRANT_VECTORS_ON_DISK: bool = False
+    QDRANT_HNSW_M: Optional[int] = None
+    QDRANT_HNSW_EF_CONSTRUCT: Optional[int] = None
+    QDRANT_HNSW_ON_DISK: bool = False
+
+    # Search-time defaults for quantized collections (None leaves Qdrant's defaults)
+    QDRANT_SEARCH_OVERSAMPLING: Optional[float] = None
+    QDRANT_SEARCH_RESCORE: Optional[bool] = None
+    QDRANT_SEARCH_HNSW_EF: Optional[int] = None
 
     # Custom model settings (for Modal deployment)
     CUSTOM_MODEL_URL: Optional[str] = None
     CUSTOM_MODEL_API_KEY: Optional[str] = "custom-api-key"
+    CUSTOM_MODEL_CONNECT_TIMEOUT: float = 10.0
+    CUSTOM_MODEL_READ_TIMEOUT: float = 420.0
+    CUSTOM_MODEL_MAX_CONNECTIONS: int = 20
+    CUSTOM_MODEL_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    CUSTOM_MODEL_KEEPALIVE_EXPIRY: float = 60.0
+    CUSTOM_MODEL_STREAMING: bool = False
+
+    # Local cache directory (collection versions, on-disk cache tiers). A relative path is
+    # resolved against the project root, so the API and the upload scripts share it
+    # whatever directory they are started from.
+    CACHE_DIR: str = ".cache/lawgpt"
+
+    # Query embedding cache (in-memory LRU, optional SQLite tier under CACHE_DIR)
+    QUERY_EMBEDDING_CACHE_MAX_ENTRIES: int = 10000
+    QUERY_EMBEDDING_CACHE_DISK: bool = False
+
+    # Retrieval result cache in front of Qdrant search: "memory", "redis" or "none".
+    # With REDIS_URL set, collection versions are also kept in Redis so every worker
+    # sees uploads from any host.
+    REDIS_URL: Optional[RedisDsn] = None
+    # Socket/connect timeout of the collection-version Redis clients (reads on the request path
+    # only hit a local snapshot that is refreshed in the background)
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 0.25
+    RETRIEVAL_CACHE_BACKEND: str = "memory"
+    RETRIEVAL_CACHE_MAX_ENTRIES: int = 5000
+    RETRIEVAL_CACHE_TTL_SECONDS: float = 3600.0
+
+    # Answer cache
+    ANSWER_CACHE_ENABLED: bool = True
+    ANSWER_CACHE_MAX_ENTRIES: int = 1000
+    ANSWER_CACHE_TTL_SECONDS: float = 3600.0
+    # Cosine distance for the semantic tier; None disables it
+    ANSWER_CACHE_SEMANTIC_DISTANCE: Optional[float] = None
+
+    # End-to-end request deadline per llm_model_id ("default" for other models);
+    # callers can only shorten it. Retrieval gets RAG_DEADLINE_SHARE of the time
+    # left (at most RAG_MAX_SECONDS) and drops branches that run late.
+    CHAT_DEADLINE_SECONDS: Dict[str, float] = {"default": 60.0, "custom_llm": 420.0}
+    RAG_DEADLINE_SHARE: float = 0.25
+    RAG_MAX_SECONDS: float = 10.0
+
+    # Prompt context budget per llm_model_id in estimated tokens (~4 chars each)
+    CONTEXT_TOKEN_BUDGET: Dict[str, int] = {"default": 6000, "custom_llm": 3000}
+
+    # LLM admission control per llm_model_id ("default" applies to any other model).
+    # Calls beyond max concurrency wait in a bounded queue; a full queue gets 429 and
+    # a wait past the queue timeout gets 503, both with Retry-After.
+    LLM_MAX_CONCURRENCY: Dict[str, int] = {"default": 32, "custom_llm": 4}
+    LLM_MAX_QUEUE: Dict[str, int] = {"default": 64, "custom_llm": 8}
+    LLM_QUEUE_TIMEOUT_SECONDS: Dict[str, float] = {"default": 10.0, "custom_llm": 30.0}
+
+    # Batch chat endpoint
+    CHAT_BATCH_MAX_ITEMS: int = 1000
+    CHAT_BATCH_CONCURRENCY_PER_MODEL: int = 8
+
+    @field_validator("CACHE_DIR")
+    @classmethod
+    def resolve_cache_dir(cls, value: str) -> str:
+        """Anchor a relative CACHE_DIR at the project root instead of the working directory"""
+        if os.path.isabs(value):
+            return value
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        return os.path.join(project_root, value)
+
+    @field_validator("LLM_MAX_CONCURRENCY", "LLM_MAX_QUEUE", "LLM_QUEUE_TIMEOUT_SECONDS", "CHAT_DEADLINE_SECONDS", "CONTEXT_TOKEN_BUDGET")
+    @classmethod
+    def keep_default_entry(cls, value: Dict[str, Any], info) -> Dict[str, Any]:
+        """Per-model maps from the environment may leave out "default"; keep the built-in one"""
+        if "default" not in value:
+            value = {**value, "default": cls.model_fields[info.field_name].default["default"]}
+        return value
 
 
 
@@ -0,0 +1,191 @@
+"""
+Minimal in-process metrics with Prometheus text exposition.
+
+Recording is a dict lookup and a couple of additions under a lock, so it is
+cheap enough for every request. Metrics are per process; with several uvicorn
+workers each one exposes its own series.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def _format_labels(self, values: LabelValues, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.label_names, values))
+        if extra is not None:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            lines.append(f"{self.name}{self._format_labels(key)} {value}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: "Histogram", labels: Dict[str, str]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [non-cumulative bucket counts (+Inf last), sum, count]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._label_values(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, **labels: str) -> _Timer:
+        """Context manager that observes the elapsed wall time of its block"""
+        return _Timer(self, labels)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            values = [(key, list(series[0]), series[1], series[2]) for key, series in self._values.items()]
+        for key, counts, total, count in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{self._format_labels(key, ('le', repr(float(bound))))} {cumulative}")
+            lines.append(f"{self.name}_bucket{self._format_labels(key, ('le', '+Inf'))} {count}")
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {total}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, documentation, label_names)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, documentation, label_names, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+QUERY_EMBEDDING_SECONDS = metrics_registry.histogram(
+    "lawgpt_query_embedding_seconds", "Time to embed the user query"
+)
+CASE_SEARCH_SECONDS = metrics_registry.histogram(
+    "lawgpt_case_search_seconds", "Time spent in case collection search"
+)
+LAW_SEARCH_SECONDS = metrics_registry.histogram(
+    "lawgpt_law_search_seconds", "Time spent in law collection search"
+)
+PROMPT_ASSEMBLY_SECONDS = metrics_registry.histogram(
+    "lawgpt_prompt_assembly_seconds", "Time to build the LLM prompt from RAG context", ("llm_model_id",),
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+)
+LLM_SECONDS = metrics_registry.histogram(
+    "lawgpt_llm_seconds", "Time spent waiting for the LLM", ("llm_model_id",)
+)
+CUSTOM_LLM_HTTP_SECONDS = metrics_registry.histogram(
+    "lawgpt_custom_llm_http_seconds", "HTTP round trip to the custom LLM endpoint"
+)
+REQUEST_SECONDS = metrics_registry.histogram(
+    "lawgpt_request_seconds", "Total chat request time", ("endpoint",)
+)
+ADMISSION_WAIT_SECONDS = metrics_registry.histogram(
+    "lawgpt_admission_wait_seconds", "Time queued for an LLM concurrency slot", ("llm_model_id",)
+)
+ERRORS = metrics_registry.counter(
+    "lawgpt_errors_total", "Errors by pipeline stage", ("stage",)
+)
+CACHE_HITS = metrics_registry.counter(
+    "lawgpt_cache_hits_total", "Cache hits by cache", ("cache",)
+)
+CACHE_MISSES = metrics_registry.counter(
+    "lawgpt_cache_misses_total", "Cache misses by cache", ("cache",)
+)
+CONTEXT_ITEMS = metrics_registry.counter(
+    "lawgpt_context_items_total", "RAG context items returned by retrieval", ("type",)
+)
+ADMISSION_REJECTIONS = metrics_registry.counter(
+    "lawgpt_admission_rejections_total", "Requests rejected by LLM admission control", ("llm_model_id", "status")
+)
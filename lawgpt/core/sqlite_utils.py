@@ -0,0 +1,31 @@
+import sqlite3
+from typing import Any, Iterator, Sequence, Tuple
+
+# Stay well below SQLite's bound-parameter limit
+IN_CHUNK_SIZE = 500
+
+
+def select_in(
+    db: sqlite3.Connection,
+    sql: str,
+    params: Sequence[Any],
+    values: Sequence[Any],
+    chunk_size: int = IN_CHUNK_SIZE
+) -> Iterator[Tuple[Any, ...]]:
+    """
+    Run a SELECT ending in "IN ({})" once per chunk of values and yield all rows
+
+    Args:
+        db: Open connection
+        sql: Query whose "{}" is replaced by the chunk's placeholders
+        params: Parameters bound before the IN list
+        values: Values for the IN list (duplicates are dropped)
+        chunk_size: Values bound per query
+
+    Returns:
+        Iterator over the rows of every chunk
+    """
+    unique = list(dict.fromkeys(values))
+    for start in range(0, len(unique), chunk_size):
+        chunk = unique[start:start + chunk_size]
+        yield from db.execute(sql.format(",".join("?" * len(chunk))), (*params, *chunk)).fetchall()
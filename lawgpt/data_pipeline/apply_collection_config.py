@@ -0,0 +1,91 @@
+"""
+Apply the configured quantization, HNSW and on-disk settings to existing collections.
+
+Settings come from the environment / .env (QDRANT_QUANTIZATION,
+QDRANT_VECTORS_ON_DISK, QDRANT_HNSW_*). Qdrant rebuilds quantized vectors and
+indexes in the background; search keeps working meanwhile. The vector datatype
+(float16) cannot be changed in place - re-embed into a new collection for that.
+
+    QDRANT_QUANTIZATION=scalar python -m lawgpt.data_pipeline.apply_collection_config all --dry-run
+    QDRANT_QUANTIZATION=scalar QDRANT_VECTORS_ON_DISK=true python -m lawgpt.data_pipeline.apply_collection_config law
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from qdrant_client import QdrantClient
+
+from lawgpt.core.config import settings
+from lawgpt.data_pipeline.collection_config import apply_to_collection, hnsw_config, quantization_config
+from lawgpt.data_pipeline.collection_version import collection_versions
+
+COLLECTIONS = {
+    "case": lambda: settings.QDRANT_LEGAL_CASES_COLLECTION_NAME,
+    "law": lambda: settings.QDRANT_LAW_REFERENCE_COLLECTION_NAME,
+}
+
+
+def describe(client: QdrantClient, collection_name: str) -> str:
+    config = client.get_collection(collection_name).config
+    vectors = config.params.vectors
+    quantization = type(config.quantization_config).__name__ if config.quantization_config else "none"
+    return (
+        f"size {getattr(vectors, 'size', '?')}, datatype {getattr(getattr(vectors, 'datatype', None), 'value', 'float32')}, "
+        f"vectors on_disk {bool(getattr(vectors, 'on_disk', False))}, quantization {quantization}, "
+        f"hnsw m={config.hnsw_config.m} ef_construct={config.hnsw_config.ef_construct} on_disk={bool(config.hnsw_config.on_disk)}"
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Apply Qdrant storage settings to existing collections")
+    parser.add_argument("kind", choices=("case", "law", "all"), help="Which collection(s) to update")
+    parser.add_argument("--collection", default=None, help="Explicit collection name (overrides kind)")
+    parser.add_argument("--dry-run", action="store_true", help="Only show current and wanted settings")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main function to update collection settings"""
+    args = parse_args(argv)
+    if args.collection:
+        names = [args.collection]
+    else:
+        names = [COLLECTIONS[kind]() for kind in (COLLECTIONS if args.kind == "all" else [args.kind])]
+
+    try:
+        print("⚙️  Collection Settings Tool")
+        print("=" * 40)
+        client = QdrantClient(url=settings.QDRANT_URL, api_key=settings.QDRANT_API_KEY)
+
+        quantization = quantization_config()
+        print(f"🎯 Wanted: quantization {type(quantization).__name__ if quantization else 'none'}, "
+              f"vectors on_disk {settings.QDRANT_VECTORS_ON_DISK}, datatype {settings.QDRANT_VECTOR_DATATYPE}, "
+              f"hnsw {hnsw_config() or 'unchanged'}")
+
+        for name in names:
+            if not client.collection_exists(name):
+                print(f"⚠️  {name}: not found, skipped")
+                continue
+            print(f"\n📂 {name}: {describe(client, name)}")
+            if args.dry_run:
+                continue
+            changes = apply_to_collection(client, name)
+            mismatch = changes.pop("datatype_mismatch", None)
+            if changes:
+                collection_versions.bump(name)  # scores can shift slightly; don't serve cached results
+                print(f"  ✅ Updated: {', '.join(changes)}")
+                print(f"  📂 Now: {describe(client, name)}")
+            else:
+                print("  ℹ️  Already up to date")
+            if mismatch:
+                print(f"  ⚠️  Datatype differs ({mismatch}); re-embed into a new collection to change it")
+        return 0
+
+    except Exception as e:
+        print(f"❌ Error updating collections: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
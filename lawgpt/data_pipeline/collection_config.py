@@ -0,0 +1,134 @@
+import logging
+from typing import Any, Dict, Optional
+
+from qdrant_client import QdrantClient, models
+
+from lawgpt.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+QUANTIZATION_MODES = ("none", "scalar", "binary")
+VECTOR_DATATYPES = ("float32", "float16")
+
+
+def vectors_config(dimension: int) -> models.VectorParams:
+    """Cosine vectors of `dimension`, with the storage datatype and on_disk from Settings"""
+    if settings.QDRANT_VECTOR_DATATYPE not in VECTOR_DATATYPES:
+        raise ValueError(f"QDRANT_VECTOR_DATATYPE must be one of {VECTOR_DATATYPES}, got {settings.QDRANT_VECTOR_DATATYPE!r}")
+    return models.VectorParams(
+        size=dimension,
+        distance=models.Distance.COSINE,
+        on_disk=settings.QDRANT_VECTORS_ON_DISK,
+        datatype=models.Datatype.FLOAT16 if settings.QDRANT_VECTOR_DATATYPE == "float16" else None
+    )
+
+
+def quantization_config() -> Optional[models.QuantizationConfig]:
+    """
+    Scalar (int8, 4x smaller) or binary (1 bit per dimension, 32x smaller) quantization.
+
+    The quantized vectors are kept in RAM (QDRANT_QUANTIZATION_ALWAYS_RAM) while the
+    originals can live on disk and are only read to rescore the top candidates.
+    """
+    mode = settings.QDRANT_QUANTIZATION
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(f"QDRANT_QUANTIZATION must be one of {QUANTIZATION_MODES}, got {mode!r}")
+    if mode == "scalar":
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=settings.QDRANT_QUANTIZATION_ALWAYS_RAM
+            )
+        )
+    if mode == "binary":
+        return models.BinaryQuantization(
+            binary=models.BinaryQuantizationConfig(always_ram=settings.QDRANT_QUANTIZATION_ALWAYS_RAM)
+        )
+    return None
+
+
+def hnsw_config() -> Optional[models.HnswConfigDiff]:
+    """HNSW overrides from Settings (None keeps Qdrant's defaults)"""
+    if settings.QDRANT_HNSW_M is None and settings.QDRANT_HNSW_EF_CONSTRUCT is None and not settings.QDRANT_HNSW_ON_DISK:
+        return None
+    return models.HnswConfigDiff(
+        m=settings.QDRANT_HNSW_M,
+        ef_construct=settings.QDRANT_HNSW_EF_CONSTRUCT,
+        on_disk=settings.QDRANT_HNSW_ON_DISK
+    )
+
+
+def create_collection(client: QdrantClient, collection_name: str, dimension: int):
+    """Create a vector collection with the configured storage, quantization and HNSW settings"""
+    client.create_collection(
+        collection_name=collection_name,
+        vectors_config=vectors_config(dimension),
+        quantization_config=quantization_config(),
+        hnsw_config=hnsw_config()
+    )
+
+
+def apply_to_collection(client: QdrantClient, collection_name: str) -> Dict[str, Any]:
+    """
+    Bring an existing collection in line with the configured settings.
+
+    Quantization, HNSW and on_disk are updated in place (Qdrant rebuilds in the
+    background). The storage datatype cannot change in place; a mismatch is only
+    reported - re-embed into a new collection to switch it.
+
+    Returns:
+        What was changed, plus datatype_mismatch when the datatype differs
+    """
+    current = client.get_collection(collection_name).config
+    changes: Dict[str, Any] = {}
+
+    quantization = quantization_config()
+    if quantization is not None:
+        changes["quantization_config"] = quantization
+    elif current.quantization_config is not None:
+        changes["quantization_config"] = models.Disabled.DISABLED
+
+    hnsw = hnsw_config()
+    if hnsw is not None:
+        changes["hnsw_config"] = hnsw
+
+    vectors = current.params.vectors
+    if isinstance(vectors, models.VectorParams) and bool(vectors.on_disk) != settings.QDRANT_VECTORS_ON_DISK:
+        changes["vectors_config"] = {"": models.VectorParamsDiff(on_disk=settings.QDRANT_VECTORS_ON_DISK)}
+
+    if changes:
+        client.update_collection(collection_name=collection_name, **changes)
+        logger.info(f"Updated collection {collection_name}: {', '.join(changes)}")
+
+    wanted_datatype = models.Datatype.FLOAT16 if settings.QDRANT_VECTOR_DATATYPE == "float16" else models.Datatype.FLOAT32
+    if isinstance(vectors, models.VectorParams) and (vectors.datatype or models.Datatype.FLOAT32) != wanted_datatype:
+        changes["datatype_mismatch"] = f"{(vectors.datatype or models.Datatype.FLOAT32).value} -> {wanted_datatype.value}"
+    return changes
+
+
+def search_params(
+    oversampling: Optional[float] = None,
+    rescore: Optional[bool] = None,
+    hnsw_ef: Optional[int] = None
+) -> Optional[models.SearchParams]:
+    """
+    Search parameters for quantized collections; arguments left as None use Settings.
+
+    Args:
+        oversampling: Fetch limit * oversampling candidates with quantized vectors before rescoring
+        rescore: Re-rank the candidates with the original vectors
+        hnsw_ef: HNSW beam size at search time
+
+    Returns:
+        SearchParams, or None when nothing is set (Qdrant's defaults apply)
+    """
+    oversampling = settings.QDRANT_SEARCH_OVERSAMPLING if oversampling is None else oversampling
+    rescore = settings.QDRANT_SEARCH_RESCORE if rescore is None else rescore
+    hnsw_ef = settings.QDRANT_SEARCH_HNSW_EF if hnsw_ef is None else hnsw_ef
+    if oversampling is None and rescore is None and hnsw_ef is None:
+        return None
+    quantization = None
+    if oversampling is not None or rescore is not None:
+        quantization = models.QuantizationSearchParams(oversampling=oversampling, rescore=rescore)
+    return models.SearchParams(hnsw_ef=hnsw_ef, quantization=quantization)
@@ -0,0 +1,204 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set
+
+from lawgpt.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CollectionVersionTracker:
+    """
+    Version counter per Qdrant collection, bumped whenever ingestion writes to it.
+
+    Versions live in a small JSON file under CACHE_DIR so the upload scripts (a
+    separate process) can invalidate caches held by the API workers; both must see
+    the same CACHE_DIR (a relative one is anchored at the project root). Reads are
+    served from memory and reloaded only when the file's mtime changes. With
+    REDIS_URL set, RedisCollectionVersionTracker is used instead.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._versions: Dict[str, int] = {}
+        self._mtime: float = -1.0
+        self._lock = threading.Lock()
+
+    def get(self, collection_name: str) -> int:
+        """Current version of a collection (0 if it was never bumped)"""
+        self._reload_if_changed()
+        return self._versions.get(collection_name, 0)
+
+    def bump(self, collection_name: str) -> int:
+        """Record a write to the collection and return its new version"""
+        with self._lock:
+            versions = self._read()
+            versions[collection_name] = versions.get(collection_name, 0) + 1
+            self._write(versions)
+            self._versions = versions
+            self._mtime = self._stat_mtime()
+        logger.info(f"Collection {collection_name} version bumped to {versions[collection_name]}")
+        return versions[collection_name]
+
+    async def start(self):
+        """Nothing to start: reads are a stat() of the versions file"""
+
+    async def aclose(self):
+        pass
+
+    def _reload_if_changed(self):
+        mtime = self._stat_mtime()
+        if mtime == self._mtime:
+            return
+        with self._lock:
+            self._versions = self._read()
+            self._mtime = mtime
+
+    def _stat_mtime(self) -> float:
+        try:
+            return os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    def _read(self) -> Dict[str, int]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Could not read collection versions from {self.path}: {e}")
+            return {}
+
+    def _write(self, versions: Dict[str, int]):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(versions, file)
+        os.replace(tmp_path, self.path)
+
+
+class RedisCollectionVersionTracker:
+    """
+    Collection versions kept in Redis, for API workers and upload scripts that do
+    not share a filesystem.
+
+    get() runs on the async request path (cache keys, answer cache lookups), so inside
+    an event loop it never touches the network: it reads a local snapshot that a
+    background task refreshes with redis.asyncio every `refresh_seconds` (started by
+    start(), or lazily by the first get()). Collections not seen before read as 0 until
+    the next refresh. Outside an event loop (upload scripts) get() reads Redis directly,
+    at most once per `refresh_seconds` per collection.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        refresh_seconds: float = 1.0,
+        prefix: str = "lawgpt:collection_version:",
+        socket_timeout: float = 0.25,
+        collections: Iterable[str] = ()
+    ):
+        """
+        Args:
+            url: Redis URL
+            refresh_seconds: Interval of the background refresh (and of direct reads outside an event loop)
+            prefix: Key prefix of the version counters
+            socket_timeout: Socket/connect timeout of the Redis clients
+            collections: Collections to load up front; others are added on first get()
+        """
+        try:
+            import redis
+            import redis.asyncio
+        except ImportError as e:
+            raise ImportError("REDIS_URL requires the 'redis' package (pip install redis)") from e
+        self.refresh_seconds = refresh_seconds
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url, socket_timeout=socket_timeout, socket_connect_timeout=socket_timeout)
+        self._async_client = redis.asyncio.Redis.from_url(url, socket_timeout=socket_timeout, socket_connect_timeout=socket_timeout)
+        self._tracked: Set[str] = {name for name in collections if name}
+        self._versions: Dict[str, int] = {}
+        self._read_at: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def get(self, collection_name: str) -> int:
+        """Current version of a collection (0 if it was never bumped)"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self._get_blocking(collection_name)
+        self._tracked.add(collection_name)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._refresh_loop())
+        return self._versions.get(collection_name, 0)
+
+    def bump(self, collection_name: str) -> int:
+        """Record a write to the collection and return its new version"""
+        version = int(self._client.incr(self.prefix + collection_name))
+        self._versions[collection_name] = version
+        self._read_at[collection_name] = time.monotonic()
+        logger.info(f"Collection {collection_name} version bumped to {version}")
+        return version
+
+    async def start(self):
+        """Load the tracked versions, then keep refreshing them in the background"""
+        await self.arefresh()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._refresh_loop(initial_delay=self.refresh_seconds))
+
+    async def arefresh(self):
+        """Read all tracked versions from Redis in one round trip (keeps the snapshot on failure)"""
+        names = sorted(self._tracked)
+        if not names:
+            return
+        try:
+            values = await self._async_client.mget([self.prefix + name for name in names])
+        except Exception as e:
+            logger.warning(f"Could not refresh collection versions from Redis: {e}")
+            return
+        now = time.monotonic()
+        for name, value in zip(names, values):
+            self._versions[name] = int(value or 0)
+            self._read_at[name] = now
+
+    async def aclose(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._async_client.aclose()
+
+    async def _refresh_loop(self, initial_delay: float = 0.0):
+        await asyncio.sleep(initial_delay)
+        while True:
+            await self.arefresh()
+            await asyncio.sleep(self.refresh_seconds)
+
+    def _get_blocking(self, collection_name: str) -> int:
+        read_at = self._read_at.get(collection_name)
+        if read_at is not None and time.monotonic() - read_at < self.refresh_seconds:
+            return self._versions.get(collection_name, 0)
+        try:
+            self._versions[collection_name] = int(self._client.get(self.prefix + collection_name) or 0)
+        except Exception as e:
+            logger.warning(f"Could not read collection version from Redis: {e}")
+        self._read_at[collection_name] = time.monotonic()
+        return self._versions.get(collection_name, 0)
+
+
+collection_versions = (
+    RedisCollectionVersionTracker(
+        str(settings.REDIS_URL),
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        collections=(settings.QDRANT_LEGAL_CASES_COLLECTION_NAME, settings.QDRANT_LAW_REFERENCE_COLLECTION_NAME)
+    )
+    if settings.REDIS_URL else
+    CollectionVersionTracker(os.path.join(settings.CACHE_DIR, "collection_versions.json"))
+)
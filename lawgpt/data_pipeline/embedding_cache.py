@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from lawgpt.core.config import settings
+from lawgpt.core.metrics import CACHE_HITS, CACHE_MISSES
+
+logger = logging.getLogger(__name__)
+
+# (embedding model name, task type, output dimension (0 = model default), normalized text)
+EmbeddingKey = Tuple[str, str, int, str]
+
+# Task type for every query embedding, single or batched. Without an explicit task type
+# embed_query sends RETRIEVAL_DOCUMENT, so the paths would disagree on the same cache key.
+QUERY_TASK_TYPE = "RETRIEVAL_QUERY"
+
+
+class QueryEmbeddingCache:
+    """
+    Cache for query embeddings keyed on (embedding model, task type, output dimension,
+    normalized text).
+
+    An in-memory LRU tier sits in front of an optional SQLite tier that survives
+    restarts. Vectors are stored on disk as packed float32. The async methods run
+    the SQLite tier in a worker thread so disk reads never block the event loop.
+    """
+
+    def __init__(self, max_entries: int = 10000, disk_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.disk_path = disk_path
+        self._memory: "OrderedDict[EmbeddingKey, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # SQLite access is serialized separately so memory lookups never wait on disk
+        self._disk_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Collapse whitespace; the normalized text is also what gets embedded"""
+        return re.sub(r"\s+", " ", text).strip()
+
+    def key(self, model: str, text: str, dimension: Optional[int] = None, task_type: str = QUERY_TASK_TYPE) -> EmbeddingKey:
+        return (model, task_type, dimension or 0, self.normalize(text))
+
+    def get(self, model: str, text: str, dimension: Optional[int] = None, task_type: str = QUERY_TASK_TYPE) -> Optional[List[float]]:
+        key = self.key(model, text, dimension, task_type)
+        vector = self._memory_get(key)
+        if vector is None:
+            vector = self._disk_get(key)
+            self._record_disk_lookup(key, vector)
+        return vector
+
+    async def aget(self, model: str, text: str, dimension: Optional[int] = None, task_type: str = QUERY_TASK_TYPE) -> Optional[List[float]]:
+        key = self.key(model, text, dimension, task_type)
+        vector = self._memory_get(key)
+        if vector is None:
+            vector = await asyncio.to_thread(self._disk_get, key) if self.disk_path is not None else None
+            self._record_disk_lookup(key, vector)
+        return vector
+
+    def put(self, model: str, text: str, vector: List[float], dimension: Optional[int] = None, task_type: str = QUERY_TASK_TYPE):
+        key = self.key(model, text, dimension, task_type)
+        with self._lock:
+            self._remember(key, vector)
+        self._disk_put(key, vector)
+
+    async def aput(self, model: str, text: str, vector: List[float], dimension: Optional[int] = None, task_type: str = QUERY_TASK_TYPE):
+        key = self.key(model, text, dimension, task_type)
+        with self._lock:
+            self._remember(key, vector)
+        if self.disk_path is not None:
+            await asyncio.to_thread(self._disk_put, key, vector)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+
+    def _memory_get(self, key: EmbeddingKey) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+        if vector is not None:
+            CACHE_HITS.inc(cache="query_embedding")
+        return vector
+
+    def _record_disk_lookup(self, key: EmbeddingKey, vector: Optional[List[float]]):
+        with self._lock:
+            if vector is not None:
+                self._remember(key, vector)
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+        if vector is not None:
+            CACHE_HITS.inc(cache="query_embedding")
+        else:
+            CACHE_MISSES.inc(cache="query_embedding")
+
+    def _remember(self, key: EmbeddingKey, vector: List[float]):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self.disk_path is None:
+            return None
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.disk_path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(self.disk_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS query_embeddings_by_task ("
+                "model TEXT NOT NULL, task_type TEXT NOT NULL, dimension INTEGER NOT NULL, text TEXT NOT NULL, "
+                "vector BLOB NOT NULL, PRIMARY KEY (model, task_type, dimension, text))"
+            )
+            self._db.commit()
+        return self._db
+
+    def _disk_get(self, key: EmbeddingKey) -> Optional[List[float]]:
+        try:
+            with self._disk_lock:
+                db = self._connection()
+                if db is None:
+                    return None
+                row = db.execute(
+                    "SELECT vector FROM query_embeddings_by_task WHERE model = ? AND task_type = ? AND dimension = ? AND text = ?", key
+                ).fetchone()
+            return array("f", row[0]).tolist() if row else None
+        except Exception as e:
+            logger.warning(f"Query embedding disk cache read failed: {e}")
+            return None
+
+    def _disk_put(self, key: EmbeddingKey, vector: List[float]):
+        try:
+            with self._disk_lock:
+                db = self._connection()
+                if db is None:
+                    return
+                db.execute(
+                    "INSERT OR REPLACE INTO query_embeddings_by_task (model, task_type, dimension, text, vector) VALUES (?, ?, ?, ?, ?)",
+                    (*key, array("f", vector).tobytes())
+                )
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Query embedding disk cache write failed: {e}")
+
+
+query_embedding_cache = QueryEmbeddingCache(
+    max_entries=settings.QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+    disk_path=(
+        os.path.join(settings.CACHE_DIR, "query_embeddings.sqlite3")
+        if settings.QUERY_EMBEDDING_CACHE_DISK else None
+    ),
+)
+
+
+def _model_name(embeddings: Embeddings) -> str:
+    return getattr(embeddings, "model", type(embeddings).__name__)
+
+
+def _dimension_kwargs(dimension: Optional[int]) -> Dict[str, Any]:
+    return {} if dimension is None else {"output_dimensionality": dimension}
+
+
+def fit_dimension(vector: List[float], dimension: int) -> List[float]:
+    """
+    Cut a longer embedding down to `dimension` components and re-normalize.
+    
+    gemini-embedding-001 is trained Matryoshka-style, so the leading components of
+    a 3072-d vector are a usable lower-dimension embedding of the same text.
+    """
+    if len(vector) <= dimension:
+        return vector
+    head = vector[:dimension]
+    norm = math.sqrt(sum(x * x for x in head)) or 1.0
+    return [x / norm for x in head]
+
+
+def embed_query_cached(embeddings: Embeddings, text: str, dimension: Optional[int] = None) -> List[float]:
+    """embed_query through the process-wide query embedding cache"""
+    model = _model_name(embeddings)
+    vector = query_embedding_cache.get(model, text, dimension)
+    if vector is None:
+        vector = embeddings.embed_query(
+            query_embedding_cache.normalize(text),
+            task_type=QUERY_TASK_TYPE,
+            **_dimension_kwargs(dimension)
+        )
+        query_embedding_cache.put(model, text, vector, dimension)
+    return vector
+
+
+async def aembed_query_cached(embeddings: Embeddings, text: str, dimension: Optional[int] = None) -> List[float]:
+    """Async embed_query through the process-wide query embedding cache"""
+    model = _model_name(embeddings)
+    vector = await query_embedding_cache.aget(model, text, dimension)
+    if vector is None:
+        vector = await embeddings.aembed_query(
+            query_embedding_cache.normalize(text),
+            task_type=QUERY_TASK_TYPE,
+            **_dimension_kwargs(dimension)
+        )
+        await query_embedding_cache.aput(model, text, vector, dimension)
+    return vector
+
+
+async def aembed_queries_cached(embeddings: Embeddings, texts: List[str], dimension: Optional[int] = None) -> List[List[float]]:
+    """Batched query embedding that only sends cache misses to the model"""
+    model = _model_name(embeddings)
+    vectors: List[Optional[List[float]]] = [await query_embedding_cache.aget(model, text, dimension) for text in texts]
+    missing = [i for i, vector in enumerate(vectors) if vector is None]
+    if missing:
+        embedded = await embeddings.aembed_documents(
+            [query_embedding_cache.normalize(texts[i]) for i in missing],
+            task_type=QUERY_TASK_TYPE,
+            **_dimension_kwargs(dimension)
+        )
+        for i, vector in zip(missing, embedded):
+            vectors[i] = vector
+            await query_embedding_cache.aput(model, texts[i], vector, dimension)
+    return vectors
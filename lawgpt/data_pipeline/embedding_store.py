@@ -0,0 +1,186 @@
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from lawgpt.core.config import settings
+from lawgpt.core.metrics import CACHE_HITS, CACHE_MISSES
+from lawgpt.core.sqlite_utils import select_in
+
+logger = logging.getLogger(__name__)
+
+Vector = List[float]
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingStore:
+    """
+    Persistent store of document embeddings computed during ingestion.
+
+    Vectors are keyed on (embedding model, task type, output dimension, content hash).
+    Each (model, task type, dimension) gets one append-only float32 array file that is
+    read through a numpy memmap; a sidecar SQLite index maps content hashes to rows.
+    Re-indexing unchanged chunks and cases then reads vectors from disk instead of
+    calling the embedding API. A store with no directory keeps nothing and always misses.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._maps: Dict[str, np.memmap] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    def get_many(self, model: str, task_type: str, dimension: int, texts: Sequence[str]) -> List[Optional[Vector]]:
+        """Stored vectors for texts, in input order (None where missing)"""
+        vectors: List[Optional[Vector]] = [None] * len(texts)
+        with self._lock:
+            try:
+                db = self._connection()
+                if db is not None and texts:
+                    hashes = [content_hash(text) for text in texts]
+                    rows: Dict[str, int] = dict(select_in(
+                        db,
+                        "SELECT hash, row FROM embeddings WHERE model = ? AND task_type = ? AND dimension = ? AND hash IN ({})",
+                        (model, task_type, dimension),
+                        hashes
+                    ))
+                    if rows:
+                        array = self._array(model, task_type, dimension)
+                        for i, digest in enumerate(hashes):
+                            row = rows.get(digest)
+                            if row is not None and array is not None and row < len(array):
+                                vectors[i] = array[row].tolist()
+            except Exception as e:
+                logger.warning(f"Embedding store read failed: {e}")
+            hits = sum(1 for vector in vectors if vector is not None)
+            self.hits += hits
+            self.misses += len(texts) - hits
+        if hits:
+            CACHE_HITS.inc(hits, cache="document_embedding")
+        if len(texts) - hits:
+            CACHE_MISSES.inc(len(texts) - hits, cache="document_embedding")
+        return vectors
+
+    def put_many(self, model: str, task_type: str, dimension: int, texts: Sequence[str], vectors: Sequence[Optional[Vector]]):
+        """Append vectors for texts (None entries and wrong-sized vectors are skipped)"""
+        items: Dict[str, Vector] = {}
+        for text, vector in zip(texts, vectors):
+            if vector is not None and len(vector) == dimension:
+                items[content_hash(text)] = vector
+        if not items:
+            return
+        with self._lock:
+            try:
+                db = self._connection()
+                if db is None:
+                    return
+                path = self._array_path(model, task_type, dimension)
+                row_bytes = dimension * 4
+                size = os.path.getsize(path) if os.path.exists(path) else 0
+                first_row = size // row_bytes
+                with open(path, "ab") as file:
+                    # Drop a partial row left by an interrupted write so rows stay aligned
+                    if size % row_bytes:
+                        file.truncate(first_row * row_bytes)
+                    file.write(np.asarray(list(items.values()), dtype=np.float32).tobytes())
+                # Vectors are on disk before the index points at them; rows orphaned by a crash are harmless
+                db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, task_type, dimension, hash, row) VALUES (?, ?, ?, ?, ?)",
+                    [(model, task_type, dimension, digest, first_row + i) for i, digest in enumerate(items)]
+                )
+                db.commit()
+                self._maps.pop(path, None)  # remap to see the new rows
+            except Exception as e:
+                logger.warning(f"Embedding store write failed: {e}")
+
+    def embed(
+        self,
+        model: str,
+        task_type: str,
+        dimension: int,
+        texts: Sequence[str],
+        embed_missing: Callable[[List[str]], Sequence[Optional[Vector]]]
+    ) -> List[Optional[Vector]]:
+        """
+        Vectors for texts, calling embed_missing only for those not in the store
+
+        Args:
+            model: Embedding model name
+            task_type: Embedding task type the vectors were computed with
+            dimension: Output dimension
+            texts: Texts to embed
+            embed_missing: Embeds a list of texts (may return None for failures)
+
+        Returns:
+            One vector per text, in input order
+        """
+        vectors = self.get_many(model, task_type, dimension, texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            fresh = embed_missing([texts[i] for i in missing])
+            for i, vector in zip(missing, fresh):
+                vectors[i] = vector
+            self.put_many(model, task_type, dimension, [texts[i] for i in missing], fresh)
+        return vectors
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            try:
+                db = self._connection()
+                entries = db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] if db is not None else 0
+            except Exception:
+                entries = 0
+        lookups = self.hits + self.misses
+        return {"entries": entries, "hits": self.hits, "misses": self.misses, "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def _array_path(self, model: str, task_type: str, dimension: int) -> str:
+        slug = re.sub(r"[^A-Za-z0-9.-]+", "_", f"{model}_{task_type}").strip("_")
+        return os.path.join(self.directory, f"{slug}_{dimension}.f32")
+
+    def _array(self, model: str, task_type: str, dimension: int) -> Optional[np.memmap]:
+        path = self._array_path(model, task_type, dimension)
+        array = self._maps.get(path)
+        if array is None:
+            rows = os.path.getsize(path) // (dimension * 4) if os.path.exists(path) else 0
+            if rows == 0:
+                return None
+            array = np.memmap(path, dtype=np.float32, mode="r", shape=(rows, dimension))
+            self._maps[path] = array
+        return array
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self.directory is None:
+            return None
+        if self._db is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._db = sqlite3.connect(os.path.join(self.directory, "index.sqlite3"), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, task_type TEXT NOT NULL, dimension INTEGER NOT NULL, hash TEXT NOT NULL, "
+                "row INTEGER NOT NULL, PRIMARY KEY (model, task_type, dimension, hash))"
+            )
+            self._db.commit()
+        return self._db
+
+
+embedding_store = EmbeddingStore(
+    directory=os.path.join(settings.CACHE_DIR, "embeddings") if settings.EMBEDDING_STORE_ENABLED else None
+)
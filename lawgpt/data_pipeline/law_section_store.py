@@ -0,0 +1,129 @@
+import logging
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
+
+from lawgpt.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Fixed namespace so the same section always maps to the same id (re-runs upsert, never duplicate)
+SECTION_NAMESPACE = uuid.UUID("8f4c2b7e-5d1a-4e8b-9c3f-6a2d0e7b1c94")
+
+
+def section_id(part_section: str, law_text: str) -> str:
+    """Deterministic id of a law section (uuid5 of its heading and full text)"""
+    return str(uuid.uuid5(SECTION_NAMESPACE, f"{part_section}\n{law_text}"))
+
+
+class LawSectionStore:
+    """
+    Parent-document store for law sections.
+
+    Each section's full law_text is stored once, in a vectorless Qdrant collection
+    keyed by section_id; law chunk points only carry the section_id. Sections are
+    fetched lazily and kept in a small in-process LRU.
+    """
+
+    def __init__(
+        self,
+        collection_name: Optional[str] = None,
+        qdrant_client: Optional[QdrantClient] = None,
+        async_qdrant_client: Optional[AsyncQdrantClient] = None,
+        max_cached: int = 512,
+    ):
+        """
+        Args:
+            collection_name: Section collection (QDRANT_LAW_SECTION_COLLECTION_NAME by default)
+            qdrant_client: Sync client to share; a new one is created when omitted
+            async_qdrant_client: Async client to share; a new one is created when omitted
+            max_cached: Sections kept in memory after being fetched
+        """
+        self.collection_name = collection_name or settings.QDRANT_LAW_SECTION_COLLECTION_NAME
+        self.qdrant_client = qdrant_client or QdrantClient(url=settings.QDRANT_URL, api_key=settings.QDRANT_API_KEY)
+        self.async_qdrant_client = async_qdrant_client or AsyncQdrantClient(url=settings.QDRANT_URL, api_key=settings.QDRANT_API_KEY)
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def ensure_collection(self):
+        """Create the section collection if it doesn't exist (payload only, no vectors)"""
+        if not self.qdrant_client.collection_exists(self.collection_name):
+            self.qdrant_client.create_collection(collection_name=self.collection_name, vectors_config={})
+            logger.info(f"Created collection: {self.collection_name}")
+
+    def put_sections(self, sections: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Upsert sections (dicts with part_section and law_text).
+
+        Returns:
+            Section ids in input order
+        """
+        ids = []
+        points = {}
+        for section in sections:
+            part_section = section.get("part_section", "")
+            law_text = section.get("law_text", "")
+            sid = section_id(part_section, law_text)
+            ids.append(sid)
+            points[sid] = models.PointStruct(id=sid, vector={}, payload={"part_section": part_section, "law_text": law_text})
+        if points:
+            self.qdrant_client.upsert(collection_name=self.collection_name, points=list(points.values()))
+        return ids
+
+    def get_section(self, section_id: str) -> Optional[Dict[str, Any]]:
+        """Full section (part_section, law_text) by id, or None if it isn't stored"""
+        return self.get_sections([section_id]).get(section_id)
+
+    def get_sections(self, section_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Several sections in one request; unknown ids are left out"""
+        found, missing = self._from_cache(section_ids)
+        if missing:
+            try:
+                records = self.qdrant_client.retrieve(collection_name=self.collection_name, ids=missing, with_payload=True)
+                found.update(self._remember(records))
+            except Exception as e:
+                logger.error(f"Failed to fetch law sections: {e}")
+        return found
+
+    async def aget_section(self, section_id: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_section"""
+        return (await self.aget_sections([section_id])).get(section_id)
+
+    async def aget_sections(self, section_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Async variant of get_sections"""
+        found, missing = self._from_cache(section_ids)
+        if missing:
+            try:
+                records = await self.async_qdrant_client.retrieve(collection_name=self.collection_name, ids=missing, with_payload=True)
+                found.update(self._remember(records))
+            except Exception as e:
+                logger.error(f"Failed to fetch law sections (async): {e}")
+        return found
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def _from_cache(self, section_ids: List[str]):
+        found: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for sid in dict.fromkeys(section_ids):
+            section = self._cache.get(sid)
+            if section is None:
+                missing.append(sid)
+            else:
+                self._cache.move_to_end(sid)
+                found[sid] = section
+        return found, missing
+
+    def _remember(self, records: List[models.Record]) -> Dict[str, Dict[str, Any]]:
+        sections = {}
+        for record in records:
+            sid = str(record.id)
+            sections[sid] = record.payload or {}
+            self._cache[sid] = sections[sid]
+            self._cache.move_to_end(sid)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+        return sections
@@ -0,0 +1,155 @@
+"""
+Migration script that moves full law texts out of the law chunk payloads.
+
+Older ingestions copied the section's complete law_text into every chunk. This
+script stores each distinct section once in the section collection
+(QDRANT_LAW_SECTION_COLLECTION_NAME), sets section_id on its chunks and deletes
+law_text from them. Legacy points without chunk_content get their law_text copied
+into chunk_content first, since it is their only text. It is safe to re-run;
+already migrated points are skipped.
+
+    python -m lawgpt.data_pipeline.migrate_law_sections --dry-run
+    python -m lawgpt.data_pipeline.migrate_law_sections
+"""
+
+import sys
+from typing import Dict, List
+
+from qdrant_client import models
+
+from lawgpt.data_pipeline.collection_version import collection_versions
+from lawgpt.data_pipeline.law_section_store import section_id
+from lawgpt.data_pipeline.rag_law_pipeline import LawRAGPipeline
+
+SCROLL_BATCH_SIZE = 256
+
+
+def migrate(pipeline: LawRAGPipeline, dry_run: bool = False, batch_size: int = SCROLL_BATCH_SIZE) -> Dict[str, int]:
+    """
+    Move law_text of every chunk into the section store.
+
+    Args:
+        pipeline: Law pipeline whose collection is migrated
+        dry_run: Only count what would change
+        batch_size: Points scrolled per request
+
+    Returns:
+        Counts of scanned, migrated and already migrated points, sections and law_text bytes removed
+        (law_text copied into chunk_content is not counted as removed)
+    """
+    stats = {"scanned": 0, "migrated": 0, "skipped": 0, "sections": 0, "bytes_removed": 0}
+    seen_sections = set()
+    offset = None
+
+    while True:
+        records, offset = pipeline.qdrant_client.scroll(
+            collection_name=pipeline.collection_name,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False
+        )
+        stats["scanned"] += len(records)
+
+        legacy = [record for record in records if "law_text" in (record.payload or {})]
+        stats["skipped"] += len(records) - len(legacy)
+        if legacy:
+            sections = [
+                {"part_section": record.payload.get("part_section", ""), "law_text": record.payload["law_text"]}
+                for record in legacy
+            ]
+            if dry_run:
+                section_ids = [section_id(section["part_section"], section["law_text"]) for section in sections]
+            else:
+                section_ids = pipeline.section_store.put_sections(sections)
+
+            points_by_section: Dict[str, List] = {}
+            unchunked = []
+            for record, sid in zip(legacy, section_ids):
+                points_by_section.setdefault(sid, []).append(record.id)
+                if record.payload.get("chunk_content"):
+                    stats["bytes_removed"] += len(record.payload["law_text"].encode("utf-8"))
+                else:
+                    unchunked.append(record)
+            seen_sections.update(points_by_section)
+
+            if not dry_run:
+                # law_text is the only text of unchunked points; keep it as their chunk_content
+                for record in unchunked:
+                    pipeline.qdrant_client.set_payload(
+                        collection_name=pipeline.collection_name,
+                        payload={"chunk_content": record.payload["law_text"]},
+                        points=[record.id]
+                    )
+                for sid, point_ids in points_by_section.items():
+                    pipeline.qdrant_client.set_payload(
+                        collection_name=pipeline.collection_name,
+                        payload={"section_id": sid},
+                        points=point_ids
+                    )
+                pipeline.qdrant_client.delete_payload(
+                    collection_name=pipeline.collection_name,
+                    keys=["law_text"],
+                    points=models.PointIdsList(points=[record.id for record in legacy])
+                )
+            stats["migrated"] += len(legacy)
+            print(f"  🔄 {stats['scanned']} points scanned, {stats['migrated']} migrated")
+
+        if offset is None:
+            break
+
+    stats["sections"] = len(seen_sections)
+    if stats["migrated"] and not dry_run:
+        collection_versions.bump(pipeline.collection_name)  # cached search results still carry law_text
+    return stats
+
+
+def main():
+    """Main function to migrate the law collection"""
+    dry_run = "--dry-run" in sys.argv[1:]
+
+    try:
+        print("🔄 Law Section Migration Tool")
+        print("=" * 40)
+
+        pipeline = LawRAGPipeline()
+        print(f"📂 Chunks: {pipeline.collection_name}")
+        print(f"📂 Sections: {pipeline.section_store.collection_name}")
+        if dry_run:
+            print("ℹ️  Dry run - nothing will be written")
+
+        stats = migrate(pipeline, dry_run=dry_run)
+
+        print(f"\n✅ {'Would migrate' if dry_run else 'Migrated'} {stats['migrated']} of {stats['scanned']} points "
+              f"({stats['skipped']} already migrated) into {stats['sections']} sections")
+        print(f"📉 law_text removed from chunk payloads: {stats['bytes_removed'] / 1024 / 1024:.1f} MiB")
+        return 0
+
+    except Exception as e:
+        print(f"❌ Error during migration: {e}")
+        return 1
+
+
+def show_help():
+    """Show help information"""
+    print("""
+🔄 Law Section Migration Tool
+
+Moves full law texts from the law chunk payloads into the section collection.
+
+Usage:
+    python -m lawgpt.data_pipeline.migrate_law_sections            # Migrate
+    python -m lawgpt.data_pipeline.migrate_law_sections --dry-run  # Only report what would change
+    python -m lawgpt.data_pipeline.migrate_law_sections --help     # Show this help
+
+Back up the collection (Qdrant snapshot) before migrating.
+    """)
+
+
+if __name__ == "__main__":
+    if any(arg in ["--help", "-h", "help"] for arg in sys.argv[1:]):
+        show_help()
+        sys.exit(0)
+
+    exit_code = main()
+    sys.exit(exit_code)
@@ -1,47 +1,92 @@
+import asyncio
+import concurrent.futures
 import json
 import os
 import logging
-from typing import List, Dict, Any, Optional
-from qdrant_client import QdrantClient, models
+from typing import List, Dict, Any, Optional, Sequence
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from lawgpt.core.config import settings
+from lawgpt.data_pipeline.collection_config import create_collection, search_params
+from lawgpt.data_pipeline.collection_version import collection_versions
+from lawgpt.data_pipeline.embedding_cache import _model_name, aembed_query_cached, embed_query_cached, fit_dimension
+from lawgpt.data_pipeline.embedding_store import embedding_store
+from lawgpt.data_pipeline.retrieval_cache import retrieval_cache
 from lawgpt.llm.case_summarizer.case_summarizer import CaseSummarizerAgent
+from lawgpt.llm.case_summarizer.summary_cache import case_summary_cache
 logger = logging.getLogger(__name__)
 
 
+def _run_coroutine(coroutine):
+    """Run a coroutine from sync code, also when the caller is inside a running event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    # asyncio.run refuses to nest; give the coroutine its own loop on a worker thread
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
 class CaseRAGPipeline:
     """RAG Pipeline for Legal Case References using Qdrant and Gemini Embeddings"""
     
-    def __init__(self):
-        """Initialize the CaseRAGPipeline using settings from config"""
-        self.collection_name = settings.QDRANT_LEGAL_CASES_COLLECTION_NAME
+    # Payload fields search returns by default: what _format_results and the workflow use.
+    # content / original_case_details stay in Qdrant; fetch them with retrieve() or hydrate().
+    SEARCH_PAYLOAD_FIELDS = ("case_title", "division", "law_category", "law_act", "reference", "case_details")
+    
+    # Task type of the indexed case vectors. The original per-case embed_query calls sent no
+    # task type, which langchain-google-genai turns into RETRIEVAL_DOCUMENT; keep it explicit
+    # so new and re-embedded vectors stay comparable with the existing ones.
+    DOCUMENT_TASK_TYPE = "RETRIEVAL_DOCUMENT"
+    
+    def __init__(
+        self,
+        search_only: bool = False,
+        embeddings: Optional[GoogleGenerativeAIEmbeddings] = None,
+        dimension: Optional[int] = None,
+        collection_name: Optional[str] = None
+    ):
+        """
+        Initialize the CaseRAGPipeline using settings from config
+        
+        Args:
+            search_only: Build only what search needs (no collection check, no summarizer).
+                Used by the request path, where the collection is known to exist.
+            embeddings: Shared embeddings client; a new one is created when omitted
+            dimension: Embedding output dimension (CASE_EMBEDDING_DIMENSION by default)
+            collection_name: Collection to use (QDRANT_LEGAL_CASES_COLLECTION_NAME by default)
+        """
+        self.search_only = search_only
+        self.collection_name = collection_name or settings.QDRANT_LEGAL_CASES_COLLECTION_NAME
+        self.dimension = dimension or settings.CASE_EMBEDDING_DIMENSION
         self.qdrant_client = QdrantClient(
             url=settings.QDRANT_URL,
             api_key=settings.QDRANT_API_KEY
         )
+        # Async client for the request path so searches never block the event loop
+        self.async_qdrant_client = AsyncQdrantClient(
+            url=settings.QDRANT_URL,
+            api_key=settings.QDRANT_API_KEY
+        )
         
         # Initialize Gemini embeddings
-        self.embeddings = GoogleGenerativeAIEmbeddings(
+        self.embeddings = embeddings or GoogleGenerativeAIEmbeddings(
             model="models/gemini-embedding-001"
         )
         
-        # Initialize case summarizer
-        self.case_summarizer = CaseSummarizerAgent()
+        # Initialize case summarizer (only needed for ingestion)
+        self.case_summarizer = None if search_only else CaseSummarizerAgent()
         
-        self._ensure_collection_exists()
+        if not search_only:
+            self._ensure_collection_exists()
     
     def _ensure_collection_exists(self):
         """Create collection if it doesn't exist"""
         try:
             collection_exists = self.qdrant_client.collection_exists(self.collection_name)
             if not collection_exists:
-                self.qdrant_client.create_collection(
-                    collection_name=self.collection_name,
-                    vectors_config=models.VectorParams(
-                        size=3072,  # Gemini text-embedding-004 dimension
-                        distance=models.Distance.COSINE
-                    )
-                )
+                create_collection(self.qdrant_client, self.collection_name, self.dimension)
                 logger.info(f"Created collection: {self.collection_name}")
             else:
                 logger.info(f"Collection {self.collection_name} already exists")
@@ -77,6 +122,8 @@ class CaseRAGPipeline:
                 return True
 
             processed_count = 0
+            summary_stats = {"cached": 0, "summarized": 0}
+            store_start = (embedding_store.hits, embedding_store.misses)
             
             if verbose:
                 if start_index > 0:
@@ -84,6 +131,8 @@ class CaseRAGPipeline:
                 else:
                     print(f"📋 Processing {total_cases} cases in batches of {batch_size}")
                 print(f"🤖 Using case summarizer to process case details before embedding")
+                if case_summary_cache.enabled:
+                    print(f"🗃️  Reusing cached summaries from {case_summary_cache.path}")
             
             # Process cases in batches (respect start_index)
             for batch_start in range(start_index, total_cases, batch_size):
@@ -93,7 +142,14 @@ class CaseRAGPipeline:
                 if verbose:
                     print(f"🔄 Processing batch {batch_start//batch_size + 1}/{(total_cases + batch_size - 1)//batch_size} (cases {batch_start + 1}-{batch_end})")
                 
-                points = []
+                case_ids = []
+                contents = []
+                payloads = []
+                
+                # Reuse cached summaries; summarize the rest concurrently (rate limited, retried on 429/5xx)
+                summaries = self._summarize_batch(
+                    [case.get("case-details", "") for case in batch_cases], summary_stats, verbose
+                )
                 
                 for idx, case in enumerate(batch_cases):
                     case_id = batch_start + idx
@@ -110,27 +166,17 @@ class CaseRAGPipeline:
                         "reference": case.get("reference", "")
                     }
                     
-                    # Get case details and summarize if present
+                    # Summarized case details (empty when the case has none)
                     case_details = case.get("case-details", "")
-                    summarized_details = ""
+                    summarized_details = summaries[idx]
                     
-                    if case_details:
-                        if verbose and idx == 0:  # Show summarization message only for first case in batch
-                            print(f"  🤖 Summarizing case details...")
-                        
-                        try:
-                            # Use case summarizer to get concise summary
-                            summarized_details = self.case_summarizer.summarize_case(case_details)
-                        except Exception as e:
-                            logger.warning(f"Failed to summarize case {case_id + 1}: {e}. Using original details.")
-                            summarized_details = case_details[:500]  # Fallback to truncated original
+                    if summarized_details is None:
+                        logger.warning(f"Failed to summarize case {case_id + 1}. Using original details.")
+                        summarized_details = case_details[:500]  # Fallback to truncated original
                     
                     # Create comprehensive content for embedding with summarized details
                     content = self._create_case_content_with_summary(case, summarized_details)
                     
-                    # Generate text embedding for complete content
-                    text_embedding = self.embeddings.embed_query(content)
-                    
                     # Create metadata payload
                     payload = {
                         **case_metadata,
@@ -139,13 +185,18 @@ class CaseRAGPipeline:
                         "content": content  # Store the complete content for retrieval
                     }
                     
-                    # Create point for Qdrant
-                    point = models.PointStruct(
-                        id=case_id,
-                        vector=text_embedding,
-                        payload=payload
-                    )
-                    points.append(point)
+                    case_ids.append(case_id)
+                    contents.append(content)
+                    payloads.append(payload)
+                
+                # Embed the batch (vectors already in the embedding store are read from disk)
+                text_embeddings = self.embed_documents(contents)
+                
+                # Create points for Qdrant
+                points = [
+                    models.PointStruct(id=case_id, vector=text_embedding, payload=payload)
+                    for case_id, text_embedding, payload in zip(case_ids, text_embeddings, payloads)
+                ]
                 
                 # Upload batch to collection
                 if verbose:
@@ -155,6 +206,7 @@ class CaseRAGPipeline:
                     collection_name=self.collection_name,
                     points=points
                 )
+                collection_versions.bump(self.collection_name)  # invalidate caches built on the old data
                 
                 processed_count += len(points)
                 
@@ -164,8 +216,16 @@ class CaseRAGPipeline:
                     print()
             
             logger.info(f"Successfully added {processed_count} legal cases to collection")
+            looked_up = summary_stats["cached"] + summary_stats["summarized"]
+            if looked_up:
+                logger.info(f"Case summaries: {summary_stats['cached']}/{looked_up} from cache ({summary_stats['cached'] / looked_up:.0%} hit rate)")
             if verbose:
                 print(f"🎉 All {processed_count} cases uploaded successfully!")
+                if looked_up and case_summary_cache.enabled:
+                    print(f"🗃️  Summary cache: {summary_stats['cached']}/{looked_up} hits ({summary_stats['cached'] / looked_up:.0%}), {summary_stats['summarized']} summarized")
+                if embedding_store.enabled:
+                    reused = embedding_store.hits - store_start[0]
+                    print(f"🗃️  Embedding store: {reused}/{reused + embedding_store.misses - store_start[1]} case vectors reused")
             
             return True
             
@@ -175,6 +235,60 @@ class CaseRAGPipeline:
                 print(f"❌ Error: {e}")
             return False
     
+    async def aadd_cases(self, json_file_path: str, batch_size: int = 50, verbose: bool = True, start_index: int = 0) -> bool:
+        """
+        add_cases for async callers (e.g. an upload endpoint): runs in a worker thread so
+        the event loop keeps serving while cases are summarized, embedded and uploaded
+        
+        Args:
+            json_file_path: Path to the JSON file containing legal cases
+            batch_size: Number of cases to process in each batch
+            verbose: Whether to show detailed progress
+            start_index: Index to start processing from (0-based)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return await asyncio.to_thread(self.add_cases, json_file_path, batch_size, verbose, start_index)
+    
+    def _summarize_batch(self, case_details_list: List[str], stats: Dict[str, int], verbose: bool = True) -> List[Optional[str]]:
+        """
+        Summaries for a batch of case details, taken from the summary cache where possible
+        
+        Args:
+            case_details_list: Case details, one entry per case
+            stats: Running "cached" / "summarized" counts, updated in place
+            verbose: Whether to show detailed progress
+            
+        Returns:
+            Summaries in input order; "" for empty details and None where summarization failed
+        """
+        summaries: List[Optional[str]] = ["" if not details else None for details in case_details_list]
+        keys = {i: self.case_summarizer.cache_key(details) for i, details in enumerate(case_details_list) if details}
+        cached = case_summary_cache.get_many(list(keys.values()))
+        todo = []
+        for i, key in keys.items():
+            if key in cached:
+                summaries[i] = cached[key]
+            else:
+                todo.append(i)
+        
+        stats["cached"] += len(keys) - len(todo)
+        stats["summarized"] += len(todo)
+        if verbose:
+            print(f"  🗃️  {len(keys) - len(todo)}/{len(keys)} summaries from cache")
+        
+        if todo:
+            if verbose:
+                print(f"  🤖 Summarizing {len(todo)} case details...")
+            fresh = _run_coroutine(self.case_summarizer.asummarize_cases([case_details_list[i] for i in todo]))
+            for i, summary in zip(todo, fresh):
+                summaries[i] = summary
+            # Failures (None) are not cached so the next run retries them
+            case_summary_cache.put_many({keys[i]: summary for i, summary in zip(todo, fresh) if summary is not None})
+        
+        return summaries
+    
     def _create_case_content_with_summary(self, case: Dict[str, Any], summarized_details: str) -> str:
         """
         Create comprehensive text content for a case to be embedded using summarized details
@@ -218,64 +332,290 @@ class CaseRAGPipeline:
         
         return "\n".join(content_parts)
     
-    def search_by_text(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed case contents for indexing (add_cases, re-embedding) with DOCUMENT_TASK_TYPE,
+        reading the embedding store first.
+        """
+        return embedding_store.embed(
+            _model_name(self.embeddings),
+            self.DOCUMENT_TASK_TYPE,
+            self.dimension,
+            texts,
+            lambda missing: self.embeddings.embed_documents(
+                missing,
+                task_type=self.DOCUMENT_TASK_TYPE,
+                output_dimensionality=self.dimension
+            )
+        )
+    
+    def embedding_text(self, payload: Dict[str, Any]) -> str:
+        """Text that was embedded for a stored point (used when re-embedding a collection)"""
+        return payload.get("content", "")
+    
+    def embed_query(self, query: str) -> List[float]:
+        """Embed a text query with the pipeline's embedding model (through the query embedding cache)"""
+        return embed_query_cached(self.embeddings, query, self.dimension)
+    
+    async def aembed_query(self, query: str) -> List[float]:
+        """Embed a text query without blocking the event loop (through the query embedding cache)"""
+        return await aembed_query_cached(self.embeddings, query, self.dimension)
+    
+    def search_by_text(self, query: str, limit: int = 5, oversampling: Optional[float] = None, rescore: Optional[bool] = None, payload_fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
         """
         Search for similar cases using text query.
         
         Args:
             query: Text query to search for
             limit: Maximum number of cases to return
+            oversampling: Quantized candidates fetched per result before rescoring (QDRANT_SEARCH_OVERSAMPLING by default)
+            rescore: Re-rank the candidates with the original vectors (QDRANT_SEARCH_RESCORE by default)
+            payload_fields: Payload fields to return (SEARCH_PAYLOAD_FIELDS by default)
             
         Returns:
             List of matching cases with scores
         """
         try:
-            query_embedding = self.embeddings.embed_query(query)
+            query_embedding = self.embed_query(query)
+        except Exception as e:
+            logger.error(f"Failed to search by text: {e}")
+            return []
+        
+        return self.search_by_vector(query_embedding, limit=limit, oversampling=oversampling, rescore=rescore, payload_fields=payload_fields)
+    
+    def search_by_vector(self, query_vector: List[float], limit: int = 5, oversampling: Optional[float] = None, rescore: Optional[bool] = None, payload_fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Search for similar cases using a precomputed query embedding.
+        
+        Args:
+            query_vector: Query embedding from the same embedding model as the collection
+                (longer vectors are cut down to the collection's dimension)
+            limit: Maximum number of results to return
+            oversampling: Quantized candidates fetched per result before rescoring (QDRANT_SEARCH_OVERSAMPLING by default)
+            rescore: Re-rank the candidates with the original vectors (QDRANT_SEARCH_RESCORE by default)
+            payload_fields: Payload fields to return (SEARCH_PAYLOAD_FIELDS by default)
             
+        Returns:
+            List of matching cases with scores
+        """
+        query_vector = fit_dimension(query_vector, self.dimension)
+        search = search_params(oversampling, rescore)
+        cache_key = retrieval_cache.make_key(self.collection_name, query_vector, limit, search=search, payload=self._payload_fields(payload_fields))
+        cached_results = retrieval_cache.get(cache_key)
+        if cached_results is not None:
+            return cached_results
+        
+        try:
             results = self.qdrant_client.query_points(
                 collection_name=self.collection_name,
-                query=query_embedding,
-                with_payload=True,
-                limit=limit
+                query=query_vector,
+                with_payload=self._payload_selector(payload_fields),
+                limit=limit,
+                search_params=search
             )
+            formatted_results = self._format_results(results.points)
+            retrieval_cache.set(cache_key, formatted_results)
+            return formatted_results
             
-            # Sort results by score (highest first)
-            results.points = sorted(results.points, key=lambda x: x.score, reverse=True)
+        except Exception as e:
+            logger.error(f"Failed to search by vector: {e}")
+            return []
+    
+    async def asearch_by_text(self, query: str, limit: int = 5, oversampling: Optional[float] = None, rescore: Optional[bool] = None, payload_fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Async variant of search_by_text for use on the request path.
+        
+        Args:
+            query: Text query to search for
+            limit: Maximum number of cases to return
+            oversampling: Quantized candidates fetched per result before rescoring (QDRANT_SEARCH_OVERSAMPLING by default)
+            rescore: Re-rank the candidates with the original vectors (QDRANT_SEARCH_RESCORE by default)
+            payload_fields: Payload fields to return (SEARCH_PAYLOAD_FIELDS by default)
             
-            # Format results for consumption by the LLM
-            formatted_results = []
-            for point in results.points:
-                # Use the stored content
-                content = point.payload.get("content", "")
-                if not content:
-                    # Fallback - reconstruct content from stored details
-                    content = f"Case Title: {point.payload.get('case_title', '')}\n"
-                    content += f"Division: {point.payload.get('division', '')}\n"
-                    content += f"Law Category: {point.payload.get('law_category', '')}\n"
-                    content += f"Law Act: {point.payload.get('law_act', '')}\n"
-                    content += f"Reference: {point.payload.get('reference', '')}\n"
-                    content += f"Case Details: {point.payload.get('case_details', '')}"
-                
-                formatted_results.append({
-                    "type": "case",
-                    "content": content,
-                    "metadata": {
-                        "case_title": point.payload.get("case_title", ""),
-                        "division": point.payload.get("division", ""),
-                        "law_category": point.payload.get("law_category", ""),
-                        "law_act": point.payload.get("law_act", ""),
-                        "reference": point.payload.get("reference", ""),
-                        "case_details": point.payload.get("case_details", "")  # Only summarized details
-                    },
-                    "score": point.score,
-                    "id": point.id
-                })
+        Returns:
+            List of matching cases with scores
+            
+        Embedding and Qdrant errors propagate so callers can tell a failed search from an empty one.
+        """
+        query_embedding = await self.aembed_query(query)
+        return await self.asearch_by_vector(query_embedding, limit=limit, oversampling=oversampling, rescore=rescore, payload_fields=payload_fields)
+    
+    async def asearch_by_vector(self, query_vector: List[float], limit: int = 5, oversampling: Optional[float] = None, rescore: Optional[bool] = None, payload_fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Async variant of search_by_vector using the async Qdrant client.
+        
+        Args:
+            query_vector: Query embedding from the same embedding model as the collection
+                (longer vectors are cut down to the collection's dimension)
+            limit: Maximum number of results to return
+            oversampling: Quantized candidates fetched per result before rescoring (QDRANT_SEARCH_OVERSAMPLING by default)
+            rescore: Re-rank the candidates with the original vectors (QDRANT_SEARCH_RESCORE by default)
+            payload_fields: Payload fields to return (SEARCH_PAYLOAD_FIELDS by default)
+            
+        Returns:
+            List of matching cases with scores
             
+        Qdrant errors are logged and re-raised: the workflow counts them and marks the branch
+        as failed, so an answer built without this context is not cached.
+        """
+        query_vector = fit_dimension(query_vector, self.dimension)
+        search = search_params(oversampling, rescore)
+        cache_key = retrieval_cache.make_key(self.collection_name, query_vector, limit, search=search, payload=self._payload_fields(payload_fields))
+        cached_results = await retrieval_cache.aget(cache_key)
+        if cached_results is not None:
+            return cached_results
+        
+        try:
+            results = await self.async_qdrant_client.query_points(
+                collection_name=self.collection_name,
+                query=query_vector,
+                with_payload=self._payload_selector(payload_fields),
+                limit=limit,
+                search_params=search
+            )
+            formatted_results = self._format_results(results.points)
+            await retrieval_cache.aset(cache_key, formatted_results)
             return formatted_results
             
         except Exception as e:
-            logger.error(f"Failed to search by text: {e}")
+            logger.error(f"Failed to search by vector (async): {e}")
+            raise
+    
+    async def asearch_batch_by_vectors(self, query_vectors: List[List[float]], limit: int = 5, oversampling: Optional[float] = None, rescore: Optional[bool] = None, payload_fields: Optional[Sequence[str]] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several query embeddings in one batched Qdrant request.
+        
+        Args:
+            query_vectors: Query embeddings from the same embedding model as the collection
+            limit: Maximum number of results to return per query
+            oversampling: Quantized candidates fetched per result before rescoring (QDRANT_SEARCH_OVERSAMPLING by default)
+            rescore: Re-rank the candidates with the original vectors (QDRANT_SEARCH_RESCORE by default)
+            payload_fields: Payload fields to return (SEARCH_PAYLOAD_FIELDS by default)
+            
+        Returns:
+            One list of matching cases per query vector, in input order
+            
+        Qdrant errors are logged and re-raised.
+        """
+        if not query_vectors:
             return []
+        query_vectors = [fit_dimension(query_vector, self.dimension) for query_vector in query_vectors]
+        search = search_params(oversampling, rescore)
+        cache_keys = [retrieval_cache.make_key(self.collection_name, query_vector, limit, search=search, payload=self._payload_fields(payload_fields)) for query_vector in query_vectors]
+        results = [await retrieval_cache.aget(cache_key) for cache_key in cache_keys]
+        missing = [i for i, cached_results in enumerate(results) if cached_results is None]
+        if not missing:
+            return results
+        
+        try:
+            responses = await self.async_qdrant_client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=[
+                    models.QueryRequest(query=query_vectors[i], with_payload=self._payload_selector(payload_fields), limit=limit, params=search)
+                    for i in missing
+                ]
+            )
+            for i, response in zip(missing, responses):
+                results[i] = self._format_results(response.points)
+                await retrieval_cache.aset(cache_keys[i], results[i])
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to batch search by vectors: {e}")
+            raise
+    
+    def retrieve(self, ids: List[Any], payload_fields: Optional[Sequence[str]] = None) -> Dict[Any, Dict[str, Any]]:
+        """
+        Fetch payloads of several points in one request.
+        
+        Args:
+            ids: Point ids (the "id" of search results)
+            payload_fields: Payload fields to return (all when omitted)
+            
+        Returns:
+            Payload per point id; unknown ids are left out
+        """
+        if not ids:
+            return {}
+        try:
+            records = self.qdrant_client.retrieve(
+                collection_name=self.collection_name,
+                ids=list(ids),
+                with_payload=models.PayloadSelectorInclude(include=list(payload_fields)) if payload_fields else True,
+                with_vectors=False
+            )
+            return {record.id: record.payload or {} for record in records}
+        except Exception as e:
+            logger.error(f"Failed to retrieve cases: {e}")
+            return {}
+    
+    async def aretrieve(self, ids: List[Any], payload_fields: Optional[Sequence[str]] = None) -> Dict[Any, Dict[str, Any]]:
+        """Async variant of retrieve"""
+        if not ids:
+            return {}
+        try:
+            records = await self.async_qdrant_client.retrieve(
+                collection_name=self.collection_name,
+                ids=list(ids),
+                with_payload=models.PayloadSelectorInclude(include=list(payload_fields)) if payload_fields else True,
+                with_vectors=False
+            )
+            return {record.id: record.payload or {} for record in records}
+        except Exception as e:
+            logger.error(f"Failed to retrieve cases (async): {e}")
+            return {}
+    
+    def hydrate(self, results: List[Dict[str, Any]], payload_fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Add more payload fields to search results (under result["payload"]) with one retrieve call"""
+        payloads = self.retrieve([result["id"] for result in results], payload_fields)
+        return [{**result, "payload": {**result.get("payload", {}), **payloads.get(result["id"], {})}} for result in results]
+    
+    async def ahydrate(self, results: List[Dict[str, Any]], payload_fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Async variant of hydrate"""
+        payloads = await self.aretrieve([result["id"] for result in results], payload_fields)
+        return [{**result, "payload": {**result.get("payload", {}), **payloads.get(result["id"], {})}} for result in results]
+    
+    def _payload_fields(self, payload_fields: Optional[Sequence[str]]) -> List[str]:
+        return sorted(payload_fields or self.SEARCH_PAYLOAD_FIELDS)
+    
+    def _payload_selector(self, payload_fields: Optional[Sequence[str]]) -> models.PayloadSelectorInclude:
+        return models.PayloadSelectorInclude(include=self._payload_fields(payload_fields))
+    
+    def _format_results(self, points: List[models.ScoredPoint]) -> List[Dict[str, Any]]:
+        """Sort scored points and shape them for the workflow"""
+        # Sort results by score (highest first)
+        points = sorted(points, key=lambda x: x.score, reverse=True)
+        
+        # Format results for consumption by the LLM
+        formatted_results = []
+        for point in points:
+            # Use the stored content
+            content = point.payload.get("content", "")
+            if not content:
+                # Fallback - reconstruct content from stored details
+                content = f"Case Title: {point.payload.get('case_title', '')}\n"
+                content += f"Division: {point.payload.get('division', '')}\n"
+                content += f"Law Category: {point.payload.get('law_category', '')}\n"
+                content += f"Law Act: {point.payload.get('law_act', '')}\n"
+                content += f"Reference: {point.payload.get('reference', '')}\n"
+                content += f"Case Details: {point.payload.get('case_details', '')}"
+            
+            formatted_results.append({
+                "type": "case",
+                "content": content,
+                "metadata": {
+                    "case_title": point.payload.get("case_title", ""),
+                    "division": point.payload.get("division", ""),
+                    "law_category": point.payload.get("law_category", ""),
+                    "law_act": point.payload.get("law_act", ""),
+                    "reference": point.payload.get("reference", ""),
+                    "case_details": point.payload.get("case_details", "")  # Only summarized details
+                },
+                "score": point.score,
+                "id": point.id
+            })
+        
+        return formatted_results
     
     def get_collection_info(self) -> Dict[str, Any]:
         """Get information about the collection"""
@@ -291,10 +631,26 @@ class CaseRAGPipeline:
             logger.error(f"Failed to get collection info: {e}")
             return {}
     
+    def close(self):
+        """Close the underlying Qdrant client"""
+        try:
+            self.qdrant_client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close Qdrant client: {e}")
+    
+    async def aclose(self):
+        """Close both the sync and async Qdrant clients"""
+        self.close()
+        try:
+            await self.async_qdrant_client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close async Qdrant client: {e}")
+    
     def delete_collection(self) -> bool:
         """Delete the entire collection"""
         try:
             self.qdrant_client.delete_collection(self.collection_name)
+            collection_versions.bump(self.collection_name)
             logger.info(f"Deleted collection: {self.collection_name}")
             return True
         except Exception as e:
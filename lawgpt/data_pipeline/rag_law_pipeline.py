@@ -1,11 +1,18 @@
 import json
 import os
 import logging
-from typing import List, Dict, Any, Optional
-from qdrant_client import QdrantClient, models
+import time
+from typing import List, Dict, Any, Optional, Sequence
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from lawgpt.core.config import settings
+from lawgpt.data_pipeline.collection_config import create_collection, search_params
+from lawgpt.data_pipeline.collection_version import collection_versions
+from lawgpt.data_pipeline.embedding_cache import _model_name, aembed_query_cached, embed_query_cached, fit_dimension
+from lawgpt.data_pipeline.embedding_store import embedding_store
+from lawgpt.data_pipeline.law_section_store import LawSectionStore
+from lawgpt.data_pipeline.retrieval_cache import retrieval_cache
 
 logger = logging.getLogger(__name__)
 
@@ -13,16 +20,42 @@ logger = logging.getLogger(__name__)
 class LawRAGPipeline:
     """RAG Pipeline for Law References using Qdrant and Gemini Embeddings"""
     
-    def __init__(self):
-        """Initialize the LawRAGPipeline using settings from config"""
-        self.collection_name = settings.QDRANT_LAW_REFERENCE_COLLECTION_NAME
+    # Payload fields search returns by default: what _format_results and the workflow use.
+    # Anything else (e.g. law_text on collections not yet migrated) comes from retrieve() or hydrate().
+    SEARCH_PAYLOAD_FIELDS = ("part_section", "section_id", "chunk_content", "chunk_index", "total_chunks", "is_chunked")
+    
+    def __init__(
+        self,
+        search_only: bool = False,
+        embeddings: Optional[GoogleGenerativeAIEmbeddings] = None,
+        dimension: Optional[int] = None,
+        collection_name: Optional[str] = None
+    ):
+        """
+        Initialize the LawRAGPipeline using settings from config
+        
+        Args:
+            search_only: Build only what search needs (no collection check).
+                Used by the request path, where the collection is known to exist.
+            embeddings: Shared embeddings client; a new one is created when omitted
+            dimension: Embedding output dimension (LAW_EMBEDDING_DIMENSION by default)
+            collection_name: Collection to use (QDRANT_LAW_REFERENCE_COLLECTION_NAME by default)
+        """
+        self.search_only = search_only
+        self.collection_name = collection_name or settings.QDRANT_LAW_REFERENCE_COLLECTION_NAME
+        self.dimension = dimension or settings.LAW_EMBEDDING_DIMENSION
         self.qdrant_client = QdrantClient(
             url=settings.QDRANT_URL,
             api_key=settings.QDRANT_API_KEY
         )
+        # Async client for the request path so searches never block the event loop
+        self.async_qdrant_client = AsyncQdrantClient(
+            url=settings.QDRANT_URL,
+            api_key=settings.QDRANT_API_KEY
+        )
         
         # Initialize Gemini embeddings
-        self.embeddings = GoogleGenerativeAIEmbeddings(
+        self.embeddings = embeddings or GoogleGenerativeAIEmbeddings(
             model="models/gemini-embedding-001"
         )
         
@@ -33,23 +66,25 @@ class LawRAGPipeline:
             length_function=len
         )
         
-        self._ensure_collection_exists()
+        # Full section texts live in their own collection; chunks only reference them
+        self.section_store = LawSectionStore(
+            qdrant_client=self.qdrant_client,
+            async_qdrant_client=self.async_qdrant_client
+        )
+        
+        if not search_only:
+            self._ensure_collection_exists()
     
     def _ensure_collection_exists(self):
         """Create collection if it doesn't exist"""
         try:
             collection_exists = self.qdrant_client.collection_exists(self.collection_name)
             if not collection_exists:
-                self.qdrant_client.create_collection(
-                    collection_name=self.collection_name,
-                    vectors_config=models.VectorParams(
-                        size=3072,  # Gemini text-embedding-004 dimension
-                        distance=models.Distance.COSINE
-                    )
-                )
+                create_collection(self.qdrant_client, self.collection_name, self.dimension)
                 logger.info(f"Created collection: {self.collection_name}")
             else:
                 logger.info(f"Collection {self.collection_name} already exists")
+            self.section_store.ensure_collection()
                 
         except Exception as e:
             logger.error(f"Error setting up collection: {e}")
@@ -82,6 +117,9 @@ class LawRAGPipeline:
                 return True
 
             processed_count = 0
+            ingest_start = time.perf_counter()
+            store_start = (embedding_store.hits, embedding_store.misses)
+            embed_seconds = 0.0
             
             if verbose:
                 if start_index > 0:
@@ -99,41 +137,37 @@ class LawRAGPipeline:
                 
                 points = []
                 current_point_id = batch_start
+                section_ids = self.section_store.put_sections(batch_references)
                 
+                # Collect the batch's chunks first so they are embedded in a few batched calls
+                batch_chunks = []
                 for idx, law_ref in enumerate(batch_references):
                     # Create chunks from the law reference
                     chunks = self._create_law_chunks(law_ref)
                     
                     part_section = law_ref.get('part_section', 'Unknown')[:60]
                     if verbose and (idx + 1) % 10 == 0:
-                        print(f"  📝 Processing reference {current_point_id + 1}: {part_section}... ({len(chunks)} chunks)")
+                        print(f"  📝 Processing reference {batch_start + idx + 1}: {part_section}... ({len(chunks)} chunks)")
                     
-                    # Process each chunk
-                    for chunk_idx, chunk_data in enumerate(chunks):
-                        # Generate text embedding for the chunk
-                        text_embedding = self.embeddings.embed_query(chunk_data["content"])
-                        
-                        # Create metadata payload with chunk information
-                        payload = {
-                            "part_section": chunk_data["part_section"],
-                            "law_text": law_ref.get("law_text", ""),  # Keep full text for reference
-                            "chunk_content": chunk_data["chunk_content"],  # Store actual chunk content
-                            "chunk_index": chunk_data["chunk_index"],
-                            "total_chunks": chunk_data["total_chunks"],
-                            "is_chunked": chunk_data["total_chunks"] > 1
-                        }
-                        
-                        # Create point for Qdrant
-                        point = models.PointStruct(
-                            id=current_point_id,
-                            vector=text_embedding,
-                            payload=payload
-                        )
-                        points.append(point)
-                        current_point_id += 1
-                        
-                        if verbose and chunk_data["total_chunks"] > 1:
-                            logger.debug(f"  📄 Created chunk {chunk_idx + 1}/{chunk_data['total_chunks']} for '{part_section}...'")
+                    batch_chunks.extend((chunk_data, section_ids[idx]) for chunk_data in chunks)
+                
+                embed_start = time.perf_counter()
+                text_embeddings = self.embed_documents([chunk_data["content"] for chunk_data, _ in batch_chunks])
+                batch_embed_seconds = time.perf_counter() - embed_start
+                embed_seconds += batch_embed_seconds
+                
+                for (chunk_data, section_id), text_embedding in zip(batch_chunks, text_embeddings):
+                    # Create point for Qdrant
+                    point = models.PointStruct(
+                        id=current_point_id,
+                        vector=text_embedding,
+                        payload=self._chunk_payload(chunk_data, section_id)
+                    )
+                    points.append(point)
+                    current_point_id += 1
+                
+                if verbose:
+                    print(f"  ⚡ Embedded {len(batch_chunks)} chunks in {batch_embed_seconds:.2f}s ({self._rate(len(batch_chunks), batch_embed_seconds)} chunks/s)")
                 
                 # Upload batch to collection
                 if verbose:
@@ -143,6 +177,7 @@ class LawRAGPipeline:
                     collection_name=self.collection_name,
                     points=points
                 )
+                collection_versions.bump(self.collection_name)  # invalidate caches built on the old data
                 
                 processed_count += len(points)
                 
@@ -151,9 +186,12 @@ class LawRAGPipeline:
                     print(f"  ✅ Batch uploaded! {len(points)} chunks from {len(batch_references)} law references. Progress: {batch_end}/{total_references} ({progress_percent:.1f}%)")
                     print()
             
-            logger.info(f"Successfully added {processed_count} chunks from law references to collection")
+            throughput = self._throughput_report(processed_count, time.perf_counter() - ingest_start, embed_seconds)
+            logger.info(f"Successfully added {processed_count} chunks from law references to collection ({throughput})")
             if verbose:
                 print(f"🎉 All {processed_count} chunks from law references uploaded successfully!")
+                print(f"⚡ Throughput: {throughput}")
+                print(f"🗃️  Embedding store: {self._store_report(*store_start)}")
             
             return True
             
@@ -243,6 +281,9 @@ class LawRAGPipeline:
             
             total_references = len(law_data)
             processed_count = 0
+            ingest_start = time.perf_counter()
+            store_start = (embedding_store.hits, embedding_store.misses)
+            embed_seconds = 0.0
             
             if verbose:
                 print(f"📋 Processing {total_references} law references in batches of {batch_size}")
@@ -258,7 +299,10 @@ class LawRAGPipeline:
                 points = []
                 skipped_count = 0
                 current_point_id = start_point_id + batch_start
+                section_ids = self.section_store.put_sections(batch_references)
                 
+                # Collect the batch's chunks first so they are embedded in a few batched calls
+                batch_chunks = []
                 for idx, law_ref in enumerate(batch_references):
                     try:
                         # Create chunks from the law reference
@@ -266,43 +310,9 @@ class LawRAGPipeline:
                         
                         part_section = law_ref.get('part_section', 'Unknown')[:60]
                         if verbose and (idx + 1) % 10 == 0:
-                            print(f"  📝 Processing reference {current_point_id + 1}: {part_section}... ({len(chunks)} chunks)")
+                            print(f"  📝 Processing reference {batch_start + idx + 1}: {part_section}... ({len(chunks)} chunks)")
                         
-                        # Process each chunk
-                        for chunk_idx, chunk_data in enumerate(chunks):
-                            try:
-                                # Generate text embedding for the chunk
-                                text_embedding = self.embeddings.embed_query(chunk_data["content"])
-                                
-                                # Create metadata payload with chunk information
-                                payload = {
-                                    "part_section": chunk_data["part_section"],
-                                    "law_text": law_ref.get("law_text", ""),  # Keep full text for reference
-                                    "chunk_content": chunk_data["chunk_content"],  # Store actual chunk content
-                                    "chunk_index": chunk_data["chunk_index"],
-                                    "total_chunks": chunk_data["total_chunks"],
-                                    "is_chunked": chunk_data["total_chunks"] > 1
-                                }
-                                
-                                # Create point for Qdrant
-                                point = models.PointStruct(
-                                    id=current_point_id,
-                                    vector=text_embedding,
-                                    payload=payload
-                                )
-                                points.append(point)
-                                current_point_id += 1
-                                
-                                if verbose and chunk_data["total_chunks"] > 1:
-                                    logger.debug(f"  📄 Created chunk {chunk_idx + 1}/{chunk_data['total_chunks']} for '{part_section}...'")
-                                
-                            except Exception as chunk_e:
-                                skipped_count += 1
-                                error_msg = str(chunk_e)
-                                logger.error(f"Error processing chunk {chunk_idx + 1} for '{part_section}...': {chunk_e}")
-                                if verbose:
-                                    print(f"  ❌ Error processing chunk {chunk_idx + 1} for '{part_section}...': {error_msg[:100]}")
-                                continue
+                        batch_chunks.extend((chunk_data, section_ids[idx]) for chunk_data in chunks)
                         
                     except Exception as e:
                         skipped_count += 1
@@ -314,6 +324,29 @@ class LawRAGPipeline:
                             print(f"  ❌ Error processing law reference '{part_section}...': {error_msg[:100]}")
                         continue
                 
+                # Failed chunks come back as None and are skipped
+                embed_start = time.perf_counter()
+                text_embeddings = self.embed_documents([chunk_data["content"] for chunk_data, _ in batch_chunks], skip_failures=True)
+                batch_embed_seconds = time.perf_counter() - embed_start
+                embed_seconds += batch_embed_seconds
+                
+                for (chunk_data, section_id), text_embedding in zip(batch_chunks, text_embeddings):
+                    if text_embedding is None:
+                        skipped_count += 1
+                        continue
+                    
+                    # Create point for Qdrant
+                    point = models.PointStruct(
+                        id=current_point_id,
+                        vector=text_embedding,
+                        payload=self._chunk_payload(chunk_data, section_id)
+                    )
+                    points.append(point)
+                    current_point_id += 1
+                
+                if verbose and batch_chunks:
+                    print(f"  ⚡ Embedded {len(batch_chunks)} chunks in {batch_embed_seconds:.2f}s ({self._rate(len(batch_chunks), batch_embed_seconds)} chunks/s)")
+                
                 # Upload batch to collection (only if we have points to upload)
                 if points:
                     if verbose:
@@ -323,6 +356,7 @@ class LawRAGPipeline:
                         collection_name=self.collection_name,
                         points=points
                     )
+                    collection_versions.bump(self.collection_name)  # invalidate caches built on the old data
                     
                     processed_count += len(points)
                 else:
@@ -337,13 +371,95 @@ class LawRAGPipeline:
                         print(f"  ✅ Batch uploaded! {len(points)} chunks from {len(batch_references)} law references. Progress: {batch_end}/{total_references} ({progress_percent:.1f}%)")
                     print()
             
-            logger.info(f"Successfully added {processed_count} chunks from {total_references} law references from {json_file_path}")
+            throughput = self._throughput_report(processed_count, time.perf_counter() - ingest_start, embed_seconds)
+            logger.info(f"Successfully added {processed_count} chunks from {total_references} law references from {json_file_path} ({throughput})")
+            if verbose:
+                print(f"⚡ Throughput: {throughput}")
+                print(f"🗃️  Embedding store: {self._store_report(*store_start)}")
             return True
             
         except Exception as e:
             logger.error(f"Error adding law references from {json_file_path}: {e}")
             return False
     
+    def embed_documents(self, texts: List[str], skip_failures: bool = False) -> List[Optional[List[float]]]:
+        """
+        Embed chunk texts as documents, reading the embedding store first and sending the
+        rest to the API in calls of EMBEDDING_BATCH_SIZE texts.
+        
+        Args:
+            texts: Chunk texts (the "content" built by _create_law_chunks)
+            skip_failures: When a batched call fails, retry its texts one by one and
+                return None for those that still fail instead of raising
+            
+        Returns:
+            One vector per text, in input order
+        """
+        return embedding_store.embed(
+            _model_name(self.embeddings),
+            "RETRIEVAL_DOCUMENT",
+            self.dimension,
+            texts,
+            lambda missing: self._embed_documents_uncached(missing, skip_failures)
+        )
+    
+    def _embed_documents_uncached(self, texts: List[str], skip_failures: bool) -> List[Optional[List[float]]]:
+        vectors: List[Optional[List[float]]] = []
+        step = max(1, settings.EMBEDDING_BATCH_SIZE)
+        for start in range(0, len(texts), step):
+            batch = texts[start:start + step]
+            try:
+                vectors.extend(self._embed_document_batch(batch))
+            except Exception as e:
+                if not skip_failures:
+                    raise
+                logger.warning(f"Batched embedding of {len(batch)} chunks failed, retrying one by one: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+                for text in batch:
+                    try:
+                        vectors.extend(self._embed_document_batch([text]))
+                    except Exception as chunk_e:
+                        logger.error(f"Error embedding chunk '{text[:60]}...': {chunk_e}")
+                        vectors.append(None)
+        return vectors
+    
+    def _embed_document_batch(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(
+            texts,
+            batch_size=len(texts),
+            task_type="RETRIEVAL_DOCUMENT",
+            output_dimensionality=self.dimension
+        )
+    
+    @staticmethod
+    def _chunk_payload(chunk_data: Dict[str, Any], section_id: str) -> Dict[str, Any]:
+        """Metadata payload with chunk information"""
+        return {
+            "part_section": chunk_data["part_section"],
+            "section_id": section_id,  # Full text is in the section store
+            "chunk_content": chunk_data["chunk_content"],  # Store actual chunk content
+            "chunk_index": chunk_data["chunk_index"],
+            "total_chunks": chunk_data["total_chunks"],
+            "is_chunked": chunk_data["total_chunks"] > 1
+        }
+    
+    @staticmethod
+    def _rate(count: int, seconds: float) -> str:
+        return f"{count / seconds:.1f}" if seconds > 0 else "-"
+    
+    def _throughput_report(self, chunks: int, seconds: float, embed_seconds: float) -> str:
+        """Overall chunks/s plus the share of time spent waiting on the embedding API"""
+        share = f", {embed_seconds / seconds:.0%} of it embedding" if seconds > 0 else ""
+        return f"{chunks} chunks in {seconds:.1f}s = {self._rate(chunks, seconds)} chunks/s{share}"
+    
+    @staticmethod
+    def _store_report(hits_start: int, misses_start: int) -> str:
+        """Chunk vectors read from the embedding store since the given counts"""
+        hits = embedding_store.hits - hits_start
+        lookups = hits + embedding_store.misses - misses_start
+        if not embedding_store.enabled:
+            return "disabled"
+        return f"{hits}/{lookups} chunks reused ({hits / lookups:.0%})" if lookups else "no lookups"
+    
     def _create_law_chunks(self, law_ref: Dict[str, Any]) -> List[Dict[str, str]]:
         """
         Create chunks from a law reference using RecursiveTextSplitter
@@ -361,7 +477,7 @@ class LawRAGPipeline:
         if len(law_text) <= 1000:  # If small enough, don't chunk (lowered threshold for small models)
             logger.debug(f"Law text for '{part_section[:50]}...' is small enough ({len(law_text)} chars), no chunking needed")
             return [{
-                "content": f"Part Section: {part_section}\nLaw Text: {law_text}",
+                "content": self._chunk_embedding_text(part_section, law_text, 0, 1),
                 "part_section": part_section,
                 "chunk_index": 0,
                 "total_chunks": 1,
@@ -375,7 +491,7 @@ class LawRAGPipeline:
         chunk_data = []
         for i, chunk in enumerate(chunks):
             # Create content with part_section preserved for each chunk
-            content = f"Part Section: {part_section}\nLaw Text (Chunk {i+1}/{len(chunks)}): {chunk}"
+            content = self._chunk_embedding_text(part_section, chunk, i, len(chunks))
             
             chunk_data.append({
                 "content": content,
@@ -388,57 +504,320 @@ class LawRAGPipeline:
         logger.info(f"Created {len(chunks)} chunks for '{part_section[:50]}...'")
         return chunk_data
     
-    def search_by_text(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _chunk_embedding_text(part_section: str, chunk: str, chunk_index: int, total_chunks: int) -> str:
+        """Text embedded for one chunk: the chunk with its part_section (and position when split)"""
+        if total_chunks <= 1:
+            return f"Part Section: {part_section}\nLaw Text: {chunk}"
+        return f"Part Section: {part_section}\nLaw Text (Chunk {chunk_index + 1}/{total_chunks}): {chunk}"
+    
+    def embedding_text(self, payload: Dict[str, Any]) -> str:
+        """Text that was embedded for a stored point (used when re-embedding a collection)"""
+        return self._chunk_embedding_text(
+            payload.get("part_section", ""),
+            payload.get("chunk_content") or payload.get("law_text", ""),
+            payload.get("chunk_index", 0),
+            payload.get("total_chunks", 1)
+        )
+    
+    def embed_query(self, query: str) -> List[float]:
+        """Embed a text query with the pipeline's embedding model (through the query embedding cache)"""
+        return embed_query_cached(self.embeddings, query, self.dimension)
+    
+    async def aembed_query(self, query: str) -> List[float]:
+        """Embed a text query without blocking the event loop (through the query embedding cache)"""
+        return await aembed_query_cached(self.embeddings, query, self.dimension)
+    
+    def search_by_text(self, query: str, limit: int = 5, oversampling: Optional[float] = None, rescore: Optional[bool] = None, payload_fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
         """
         Search for similar law references using text query
         
         Args:
             query: Text query to search for
             limit: Maximum number of results to return
+            oversampling: Quantized candidates fetched per result before rescoring (QDRANT_SEARCH_OVERSAMPLING by default)
+            rescore: Re-rank the candidates with the original vectors (QDRANT_SEARCH_RESCORE by default)
+            payload_fields: Payload fields to return (SEARCH_PAYLOAD_FIELDS by default)
             
         Returns:
             List of matching law references with scores
         """
         try:
-            query_embedding = self.embeddings.embed_query(query)
+            query_embedding = self.embed_query(query)
+        except Exception as e:
+            logger.error(f"Failed to search by text: {e}")
+            return []
+        
+        return self.search_by_vector(query_embedding, limit=limit, oversampling=oversampling, rescore=rescore, payload_fields=payload_fields)
+    
+    def search_by_vector(self, query_vector: List[float], limit: int = 5, oversampling: Optional[float] = None, rescore: Optional[bool] = None, payload_fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Search for similar law references using a precomputed query embedding.
+        
+        Args:
+            query_vector: Query embedding from the same embedding model as the collection
+                (longer vectors are cut down to the collection's dimension)
+            limit: Maximum number of results to return
+            oversampling: Quantized candidates fetched per result before rescoring (QDRANT_SEARCH_OVERSAMPLING by default)
+            rescore: Re-rank the candidates with the original vectors (QDRANT_SEARCH_RESCORE by default)
+            payload_fields: Payload fields to return (SEARCH_PAYLOAD_FIELDS by default)
             
+        Returns:
+            List of matching law references with scores
+        """
+        query_vector = fit_dimension(query_vector, self.dimension)
+        search = search_params(oversampling, rescore)
+        cache_key = retrieval_cache.make_key(self.collection_name, query_vector, limit, search=search, payload=self._payload_fields(payload_fields))
+        cached_results = retrieval_cache.get(cache_key)
+        if cached_results is not None:
+            return cached_results
+        
+        try:
             results = self.qdrant_client.query_points(
                 collection_name=self.collection_name,
-                query=query_embedding,
-                with_payload=True,
-                limit=limit
+                query=query_vector,
+                with_payload=self._payload_selector(payload_fields),
+                limit=limit,
+                search_params=search
             )
-            # Sort results by higher score first
-            results.points = sorted(results.points, key=lambda x: x.score, reverse=True)
-            
-            # Format results to prioritize chunk content
-            formatted_results = []
-            for point in results.points:
-                # Use chunk content if available, otherwise fall back to full law_text
-                chunk_content = point.payload.get("chunk_content", "")
-                if not chunk_content:
-                    # Fallback for legacy data without chunk_content
-                    chunk_content = point.payload.get("law_text", "")
-                
-                formatted_results.append({
-                    "type": "law",
-                    "content": chunk_content,  # Return only the relevant chunk content
-                    "metadata": {
-                        "part_section": point.payload.get("part_section", ""),
-                        "chunk_index": point.payload.get("chunk_index", 0),
-                        "total_chunks": point.payload.get("total_chunks", 1),
-                        "is_chunked": point.payload.get("is_chunked", False)
-                    },
-                    "score": point.score,
-                    "id": point.id,
-                    "payload": point.payload  # Keep for backward compatibility
-                })
+            formatted_results = self._fill_legacy_content(self._format_results(results.points))
+            retrieval_cache.set(cache_key, formatted_results)
+            return formatted_results
+            
+        except Exception as e:
+            logger.error(f"Failed to search by vector: {e}")
+            return []
+    
+    async def asearch_by_text(self, query: str, limit: int = 5, oversampling: Optional[float] = None, rescore: Optional[bool] = None, payload_fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Async variant of search_by_text for use on the request path.
+        
+        Args:
+            query: Text query to search for
+            limit: Maximum number of results to return
+            oversampling: Quantized candidates fetched per result before rescoring (QDRANT_SEARCH_OVERSAMPLING by default)
+            rescore: Re-rank the candidates with the original vectors (QDRANT_SEARCH_RESCORE by default)
+            payload_fields: Payload fields to return (SEARCH_PAYLOAD_FIELDS by default)
+            
+        Returns:
+            List of matching law references with scores
+            
+        Embedding and Qdrant errors propagate so callers can tell a failed search from an empty one.
+        """
+        query_embedding = await self.aembed_query(query)
+        return await self.asearch_by_vector(query_embedding, limit=limit, oversampling=oversampling, rescore=rescore, payload_fields=payload_fields)
+    
+    async def asearch_by_vector(self, query_vector: List[float], limit: int = 5, oversampling: Optional[float] = None, rescore: Optional[bool] = None, payload_fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Async variant of search_by_vector using the async Qdrant client.
+        
+        Args:
+            query_vector: Query embedding from the same embedding model as the collection
+                (longer vectors are cut down to the collection's dimension)
+            limit: Maximum number of results to return
+            oversampling: Quantized candidates fetched per result before rescoring (QDRANT_SEARCH_OVERSAMPLING by default)
+            rescore: Re-rank the candidates with the original vectors (QDRANT_SEARCH_RESCORE by default)
+            payload_fields: Payload fields to return (SEARCH_PAYLOAD_FIELDS by default)
+            
+        Returns:
+            List of matching law references with scores
             
+        Qdrant errors are logged and re-raised: the workflow counts them and marks the branch
+        as failed, so an answer built without this context is not cached.
+        """
+        query_vector = fit_dimension(query_vector, self.dimension)
+        search = search_params(oversampling, rescore)
+        cache_key = retrieval_cache.make_key(self.collection_name, query_vector, limit, search=search, payload=self._payload_fields(payload_fields))
+        cached_results = await retrieval_cache.aget(cache_key)
+        if cached_results is not None:
+            return cached_results
+        
+        try:
+            results = await self.async_qdrant_client.query_points(
+                collection_name=self.collection_name,
+                query=query_vector,
+                with_payload=self._payload_selector(payload_fields),
+                limit=limit,
+                search_params=search
+            )
+            formatted_results = await self._afill_legacy_content(self._format_results(results.points))
+            await retrieval_cache.aset(cache_key, formatted_results)
             return formatted_results
             
         except Exception as e:
-            logger.error(f"Failed to search by text: {e}")
+            logger.error(f"Failed to search by vector (async): {e}")
+            raise
+    
+    async def asearch_batch_by_vectors(self, query_vectors: List[List[float]], limit: int = 5, oversampling: Optional[float] = None, rescore: Optional[bool] = None, payload_fields: Optional[Sequence[str]] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several query embeddings in one batched Qdrant request.
+        
+        Args:
+            query_vectors: Query embeddings from the same embedding model as the collection
+            limit: Maximum number of results to return per query
+            oversampling: Quantized candidates fetched per result before rescoring (QDRANT_SEARCH_OVERSAMPLING by default)
+            rescore: Re-rank the candidates with the original vectors (QDRANT_SEARCH_RESCORE by default)
+            payload_fields: Payload fields to return (SEARCH_PAYLOAD_FIELDS by default)
+            
+        Returns:
+            One list of matching law references per query vector, in input order
+            
+        Qdrant errors are logged and re-raised.
+        """
+        if not query_vectors:
             return []
+        query_vectors = [fit_dimension(query_vector, self.dimension) for query_vector in query_vectors]
+        search = search_params(oversampling, rescore)
+        cache_keys = [retrieval_cache.make_key(self.collection_name, query_vector, limit, search=search, payload=self._payload_fields(payload_fields)) for query_vector in query_vectors]
+        results = [await retrieval_cache.aget(cache_key) for cache_key in cache_keys]
+        missing = [i for i, cached_results in enumerate(results) if cached_results is None]
+        if not missing:
+            return results
+        
+        try:
+            responses = await self.async_qdrant_client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=[
+                    models.QueryRequest(query=query_vectors[i], with_payload=self._payload_selector(payload_fields), limit=limit, params=search)
+                    for i in missing
+                ]
+            )
+            for i, response in zip(missing, responses):
+                results[i] = self._format_results(response.points)
+            # One retrieve for the legacy hits of all queries
+            await self._afill_legacy_content([result for i in missing for result in results[i]])
+            for i in missing:
+                await retrieval_cache.aset(cache_keys[i], results[i])
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to batch search by vectors: {e}")
+            raise
+    
+    def retrieve(self, ids: List[Any], payload_fields: Optional[Sequence[str]] = None) -> Dict[Any, Dict[str, Any]]:
+        """
+        Fetch payloads of several points in one request.
+        
+        Args:
+            ids: Point ids (the "id" of search results)
+            payload_fields: Payload fields to return (all when omitted)
+            
+        Returns:
+            Payload per point id; unknown ids are left out
+        """
+        if not ids:
+            return {}
+        try:
+            records = self.qdrant_client.retrieve(
+                collection_name=self.collection_name,
+                ids=list(ids),
+                with_payload=models.PayloadSelectorInclude(include=list(payload_fields)) if payload_fields else True,
+                with_vectors=False
+            )
+            return {record.id: record.payload or {} for record in records}
+        except Exception as e:
+            logger.error(f"Failed to retrieve law references: {e}")
+            return {}
+    
+    async def aretrieve(self, ids: List[Any], payload_fields: Optional[Sequence[str]] = None) -> Dict[Any, Dict[str, Any]]:
+        """Async variant of retrieve"""
+        if not ids:
+            return {}
+        try:
+            records = await self.async_qdrant_client.retrieve(
+                collection_name=self.collection_name,
+                ids=list(ids),
+                with_payload=models.PayloadSelectorInclude(include=list(payload_fields)) if payload_fields else True,
+                with_vectors=False
+            )
+            return {record.id: record.payload or {} for record in records}
+        except Exception as e:
+            logger.error(f"Failed to retrieve law references (async): {e}")
+            return {}
+    
+    def hydrate(self, results: List[Dict[str, Any]], payload_fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Add more payload fields to search results (under result["payload"]) with one retrieve call"""
+        payloads = self.retrieve([result["id"] for result in results], payload_fields)
+        return [{**result, "payload": {**result.get("payload", {}), **payloads.get(result["id"], {})}} for result in results]
+    
+    async def ahydrate(self, results: List[Dict[str, Any]], payload_fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Async variant of hydrate"""
+        payloads = await self.aretrieve([result["id"] for result in results], payload_fields)
+        return [{**result, "payload": {**result.get("payload", {}), **payloads.get(result["id"], {})}} for result in results]
+    
+    def _fill_legacy_content(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fetch law_text as content for legacy hits without chunk_content (in place)"""
+        legacy = [result for result in results if not result["content"]]
+        if legacy:
+            self._set_legacy_content(legacy, self.retrieve([result["id"] for result in legacy], ["law_text"]))
+        return results
+    
+    async def _afill_legacy_content(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Async variant of _fill_legacy_content"""
+        legacy = [result for result in results if not result["content"]]
+        if legacy:
+            self._set_legacy_content(legacy, await self.aretrieve([result["id"] for result in legacy], ["law_text"]))
+        return results
+    
+    def _set_legacy_content(self, legacy: List[Dict[str, Any]], payloads: Dict[Any, Dict[str, Any]]):
+        for result in legacy:
+            law_text = payloads.get(result["id"], {}).get("law_text")
+            if law_text:
+                result["content"] = law_text
+                result["payload"] = {**result["payload"], "law_text": law_text}
+    
+    def _payload_fields(self, payload_fields: Optional[Sequence[str]]) -> List[str]:
+        return sorted(payload_fields or self.SEARCH_PAYLOAD_FIELDS)
+    
+    def _payload_selector(self, payload_fields: Optional[Sequence[str]]) -> models.PayloadSelectorInclude:
+        return models.PayloadSelectorInclude(include=self._payload_fields(payload_fields))
+    
+    def _format_results(self, points: List[models.ScoredPoint]) -> List[Dict[str, Any]]:
+        """Sort scored points and shape them for the workflow"""
+        # Sort results by higher score first
+        points = sorted(points, key=lambda x: x.score, reverse=True)
+        
+        # Format results to prioritize chunk content
+        formatted_results = []
+        for point in points:
+            # Use chunk content if available, otherwise fall back to full law_text
+            chunk_content = point.payload.get("chunk_content", "")
+            if not chunk_content:
+                # Fallback for legacy data without chunk_content
+                chunk_content = point.payload.get("law_text", "")
+            
+            formatted_results.append({
+                "type": "law",
+                "content": chunk_content,  # Return only the relevant chunk content
+                "metadata": {
+                    "part_section": point.payload.get("part_section", ""),
+                    "section_id": point.payload.get("section_id"),
+                    "chunk_index": point.payload.get("chunk_index", 0),
+                    "total_chunks": point.payload.get("total_chunks", 1),
+                    "is_chunked": point.payload.get("is_chunked", False)
+                },
+                "score": point.score,
+                "id": point.id,
+                "payload": point.payload  # Keep for backward compatibility
+            })
+        
+        return formatted_results
+    
+    def get_section(self, section_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the full law section a chunk belongs to (only when it is needed).
+        
+        Args:
+            section_id: metadata["section_id"] of a search result
+            
+        Returns:
+            Dict with part_section and law_text, or None if the section isn't stored
+        """
+        return self.section_store.get_section(section_id)
+    
+    async def aget_section(self, section_id: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_section"""
+        return await self.section_store.aget_section(section_id)
     
     def get_collection_info(self) -> Dict[str, Any]:
         """Get information about the collection"""
@@ -454,10 +833,29 @@ class LawRAGPipeline:
             logger.error(f"Failed to get collection info: {e}")
             return {}
     
+    def close(self):
+        """Close the underlying Qdrant client"""
+        try:
+            self.qdrant_client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close Qdrant client: {e}")
+    
+    async def aclose(self):
+        """Close both the sync and async Qdrant clients"""
+        self.close()
+        try:
+            await self.async_qdrant_client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close async Qdrant client: {e}")
+    
     def delete_collection(self) -> bool:
-        """Delete the entire collection"""
+        """Delete the entire collection (and the law sections it references)"""
         try:
             self.qdrant_client.delete_collection(self.collection_name)
+            if self.qdrant_client.collection_exists(self.section_store.collection_name):
+                self.qdrant_client.delete_collection(self.section_store.collection_name)
+            self.section_store.clear_cache()
+            collection_versions.bump(self.collection_name)
             logger.info(f"Deleted collection: {self.collection_name}")
             return True
         except Exception as e:
@@ -0,0 +1,142 @@
+"""
+Re-embed a case or law collection into a new collection with another output dimension.
+
+Points keep their ids and payloads; only the vectors change, computed from the
+same text that was embedded at ingestion. The source collection is left as is,
+so search keeps working until settings are switched over. Re-running resumes:
+points already in the target are skipped.
+
+    python -m lawgpt.data_pipeline.reembed_collection law --dimension 768
+    python -m lawgpt.data_pipeline.reembed_collection case --dimension 1536 --target bd_legal_cases_1536
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, Optional, Union
+
+from qdrant_client import models
+
+from lawgpt.data_pipeline.collection_version import collection_versions
+from lawgpt.data_pipeline.rag_case_pipeline import CaseRAGPipeline
+from lawgpt.data_pipeline.rag_law_pipeline import LawRAGPipeline
+
+Pipeline = Union[CaseRAGPipeline, LawRAGPipeline]
+
+PIPELINES = {"case": CaseRAGPipeline, "law": LawRAGPipeline}
+SETTING_NAMES = {
+    "case": ("QDRANT_LEGAL_CASES_COLLECTION_NAME", "CASE_EMBEDDING_DIMENSION"),
+    "law": ("QDRANT_LAW_REFERENCE_COLLECTION_NAME", "LAW_EMBEDDING_DIMENSION"),
+}
+
+
+def reembed(source: Pipeline, target: Pipeline, batch_size: int = 64, verbose: bool = True) -> Dict[str, int]:
+    """
+    Copy every point of source into target with a vector at target.dimension.
+
+    Args:
+        source: Pipeline on the existing collection
+        target: Pipeline on the new collection (created if missing)
+        batch_size: Points scrolled and embedded per step
+        verbose: Whether to print progress
+
+    Returns:
+        Counts of scanned, embedded and skipped (already present) points
+    """
+    target._ensure_collection_exists()
+    stats = {"scanned": 0, "embedded": 0, "skipped": 0}
+    start = time.perf_counter()
+    offset = None
+
+    while True:
+        records, offset = source.qdrant_client.scroll(
+            collection_name=source.collection_name,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False
+        )
+        stats["scanned"] += len(records)
+
+        present = {
+            record.id for record in target.qdrant_client.retrieve(
+                collection_name=target.collection_name,
+                ids=[record.id for record in records],
+                with_payload=False
+            )
+        } if records else set()
+        todo = [record for record in records if record.id not in present]
+        stats["skipped"] += len(records) - len(todo)
+
+        if todo:
+            vectors = target.embed_documents([source.embedding_text(record.payload or {}) for record in todo])
+            target.qdrant_client.upsert(
+                collection_name=target.collection_name,
+                points=[
+                    models.PointStruct(id=record.id, vector=vector, payload=record.payload)
+                    for record, vector in zip(todo, vectors)
+                ]
+            )
+            stats["embedded"] += len(todo)
+            if verbose:
+                rate = stats["embedded"] / (time.perf_counter() - start)
+                print(f"  🔄 {stats['scanned']} points scanned, {stats['embedded']} embedded ({rate:.1f}/s)")
+
+        if offset is None:
+            break
+
+    if stats["embedded"]:
+        collection_versions.bump(target.collection_name)
+    return stats
+
+
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-embed a collection into a new collection with another embedding dimension")
+    parser.add_argument("kind", choices=sorted(PIPELINES), help="Which collection to re-embed")
+    parser.add_argument("--dimension", type=int, required=True, help="Output dimension (gemini-embedding-001: 768, 1536 or 3072)")
+    parser.add_argument("--source", default=None, help="Source collection (default: the configured one)")
+    parser.add_argument("--target", default=None, help="Target collection (default: <source>_<dimension>)")
+    parser.add_argument("--batch-size", type=int, default=64, help="Points scrolled and embedded per step")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list] = None):
+    """Main function to re-embed a collection"""
+    args = parse_args(argv)
+    pipeline_cls = PIPELINES[args.kind]
+
+    try:
+        print("🔄 Collection Re-embedding Tool")
+        print("=" * 40)
+
+        source = pipeline_cls(search_only=True, collection_name=args.source)
+        target_name = args.target or f"{source.collection_name}_{args.dimension}"
+        if target_name == source.collection_name:
+            print("❌ Target collection must differ from the source collection")
+            return 1
+        target = pipeline_cls(
+            search_only=True,
+            embeddings=source.embeddings,
+            dimension=args.dimension,
+            collection_name=target_name
+        )
+
+        print(f"📂 Source: {source.collection_name} ({source.get_collection_info().get('points_count', '?')} points)")
+        print(f"📂 Target: {target.collection_name} ({args.dimension} dimensions)")
+
+        stats = reembed(source, target, batch_size=args.batch_size)
+
+        collection_setting, dimension_setting = SETTING_NAMES[args.kind]
+        print(f"\n✅ Embedded {stats['embedded']} of {stats['scanned']} points ({stats['skipped']} already present)")
+        print("To search the new collection, set:")
+        print(f"    {collection_setting}={target.collection_name}")
+        print(f"    {dimension_setting}={args.dimension}")
+        return 0
+
+    except Exception as e:
+        print(f"❌ Error during re-embedding: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import logging
+import threading
+from typing import List, Optional
+
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+from lawgpt.core.config import settings
+from lawgpt.data_pipeline.embedding_cache import (
+    aembed_queries_cached,
+    aembed_query_cached,
+    embed_query_cached,
+)
+from lawgpt.data_pipeline.rag_case_pipeline import CaseRAGPipeline
+from lawgpt.data_pipeline.rag_law_pipeline import LawRAGPipeline
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineRegistry:
+    """
+    Process-wide holder for the search-only RAG pipelines used on the request path.
+
+    The FastAPI lifespan fills it once at startup; pipelines are also built lazily
+    on first access so the workflow keeps working outside the app (scripts, tests).
+    Both pipelines share one embeddings client, so a query is embedded once and the
+    vector is sent to both collections. It is embedded at the larger of the two
+    configured dimensions; a pipeline with a smaller one cuts it down (fit_dimension).
+    """
+
+    def __init__(self):
+        self._embeddings: Optional[GoogleGenerativeAIEmbeddings] = None
+        self._case_pipeline: Optional[CaseRAGPipeline] = None
+        self._law_pipeline: Optional[LawRAGPipeline] = None
+        self._lock = threading.Lock()
+
+    def initialize(self):
+        """Build both search pipelines, logging (not raising) on failure"""
+        for name in ("case", "law"):
+            try:
+                self._get(name)
+            except Exception as e:
+                logger.error(f"Failed to initialize {name} RAG pipeline: {e}")
+        logger.info("RAG pipeline registry initialized")
+
+    @property
+    def case_pipeline(self) -> CaseRAGPipeline:
+        return self._get("case")
+
+    @property
+    def law_pipeline(self) -> LawRAGPipeline:
+        return self._get("law")
+
+    @property
+    def embeddings(self) -> GoogleGenerativeAIEmbeddings:
+        if self._embeddings is None:
+            with self._lock:
+                if self._embeddings is None:
+                    self._embeddings = GoogleGenerativeAIEmbeddings(
+                        model="models/gemini-embedding-001"
+                    )
+        return self._embeddings
+
+    @property
+    def dimension(self) -> int:
+        """Query embedding dimension that serves both collections"""
+        return max(settings.CASE_EMBEDDING_DIMENSION, settings.LAW_EMBEDDING_DIMENSION)
+
+    def embed_query(self, query: str) -> List[float]:
+        """Embed a query once for use against both collections"""
+        return embed_query_cached(self.embeddings, query, self.dimension)
+
+    async def aembed_query(self, query: str) -> List[float]:
+        """Async variant of embed_query for the request path"""
+        return await aembed_query_cached(self.embeddings, query, self.dimension)
+
+    async def aembed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed many queries with batched embedding calls (query task type), skipping cached ones"""
+        if not queries:
+            return []
+        return await aembed_queries_cached(self.embeddings, queries, self.dimension)
+
+    def _get(self, name: str):
+        attr = f"_{name}_pipeline"
+        pipeline = getattr(self, attr)
+        if pipeline is not None:
+            return pipeline
+        embeddings = self.embeddings
+        with self._lock:
+            pipeline = getattr(self, attr)
+            if pipeline is None:
+                pipeline_cls = CaseRAGPipeline if name == "case" else LawRAGPipeline
+                pipeline = pipeline_cls(search_only=True, embeddings=embeddings)
+                setattr(self, attr, pipeline)
+                logger.info(f"Built search-only {name} RAG pipeline")
+        return pipeline
+
+    def close(self):
+        """Close pipeline clients and reset the registry"""
+        with self._lock:
+            for attr in ("_case_pipeline", "_law_pipeline"):
+                pipeline = getattr(self, attr)
+                if pipeline is not None:
+                    pipeline.close()
+                    setattr(self, attr, None)
+            self._embeddings = None
+        logger.info("RAG pipeline registry closed")
+
+    async def aclose(self):
+        """Close sync and async pipeline clients and reset the registry"""
+        with self._lock:
+            pipelines = [p for p in (self._case_pipeline, self._law_pipeline) if p is not None]
+            self._case_pipeline = None
+            self._law_pipeline = None
+            self._embeddings = None
+        for pipeline in pipelines:
+            await pipeline.aclose()
+        logger.info("RAG pipeline registry closed")
+
+
+pipeline_registry = PipelineRegistry()
@@ -0,0 +1,210 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from lawgpt.core.config import settings
+from lawgpt.core.metrics import CACHE_HITS, CACHE_MISSES
+from lawgpt.data_pipeline.collection_version import collection_versions
+
+logger = logging.getLogger(__name__)
+
+SearchResults = List[Dict[str, Any]]
+
+
+class RetrievalCacheBackend(ABC):
+    """Storage for formatted search results keyed by an opaque string"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[SearchResults]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: SearchResults):
+        ...
+
+    async def aget(self, key: str) -> Optional[SearchResults]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: SearchResults):
+        self.set(key, value)
+
+    def clear(self):
+        pass
+
+    async def aclose(self):
+        pass
+
+
+class InMemoryRetrievalCache(RetrievalCacheBackend):
+    """Per-process LRU with a TTL"""
+
+    def __init__(self, max_entries: int = 5000, ttl_seconds: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, SearchResults]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[SearchResults]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            created_at, value = entry
+            if time.monotonic() - created_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: SearchResults):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisRetrievalCache(RetrievalCacheBackend):
+    """
+    Redis-backed cache shared by all workers. Values are stored as JSON with a TTL;
+    memory is bounded by the TTL and the server's maxmemory policy. Redis errors
+    are logged and treated as misses so search keeps working without the cache.
+    """
+
+    def __init__(self, url: str, ttl_seconds: float = 3600.0, prefix: str = "lawgpt:retrieval:"):
+        try:
+            import redis
+            import redis.asyncio
+        except ImportError as e:
+            raise ImportError("RETRIEVAL_CACHE_BACKEND=redis requires the 'redis' package (pip install redis)") from e
+        self.ttl_seconds = int(ttl_seconds)
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+        self._async_client = redis.asyncio.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[SearchResults]:
+        try:
+            raw = self._client.get(self.prefix + key)
+            return json.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning(f"Redis retrieval cache read failed: {e}")
+            return None
+
+    def set(self, key: str, value: SearchResults):
+        try:
+            self._client.set(self.prefix + key, json.dumps(value, default=str), ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Redis retrieval cache write failed: {e}")
+
+    async def aget(self, key: str) -> Optional[SearchResults]:
+        try:
+            raw = await self._async_client.get(self.prefix + key)
+            return json.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning(f"Redis retrieval cache read failed: {e}")
+            return None
+
+    async def aset(self, key: str, value: SearchResults):
+        try:
+            await self._async_client.set(self.prefix + key, json.dumps(value, default=str), ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Redis retrieval cache write failed: {e}")
+
+    async def aclose(self):
+        await self._async_client.aclose()
+        self._client.close()
+
+
+class RetrievalCache:
+    """
+    Cache in front of Qdrant vector search.
+
+    Keys are (collection, collection version, query vector hash, limit, extra
+    search parameters), so entries stop matching as soon as an upload script
+    bumps the collection version.
+    """
+
+    def __init__(self, backend: Optional[RetrievalCacheBackend]):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    @staticmethod
+    def make_key(collection_name: str, query_vector: List[float], limit: int, **params: Any) -> str:
+        vector_hash = hashlib.sha1(np.asarray(query_vector, dtype=np.float32).tobytes()).hexdigest()
+        params_hash = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:16]
+        version = collection_versions.get(collection_name)
+        return f"{collection_name}:{version}:{limit}:{params_hash}:{vector_hash}"
+
+    def get(self, key: str) -> Optional[SearchResults]:
+        if not self.enabled:
+            return None
+        return self._count(self.backend.get(key))
+
+    def set(self, key: str, value: SearchResults):
+        if self.enabled:
+            self.backend.set(key, value)
+
+    async def aget(self, key: str) -> Optional[SearchResults]:
+        if not self.enabled:
+            return None
+        return self._count(await self.backend.aget(key))
+
+    async def aset(self, key: str, value: SearchResults):
+        if self.enabled:
+            await self.backend.aset(key, value)
+
+    def clear(self):
+        if self.enabled:
+            self.backend.clear()
+
+    async def aclose(self):
+        if self.enabled:
+            await self.backend.aclose()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _count(self, value: Optional[SearchResults]) -> Optional[SearchResults]:
+        if value is None:
+            self.misses += 1
+            CACHE_MISSES.inc(cache="retrieval")
+        else:
+            self.hits += 1
+            CACHE_HITS.inc(cache="retrieval")
+        return value
+
+
+def create_retrieval_cache_backend() -> Optional[RetrievalCacheBackend]:
+    """Build the backend selected by RETRIEVAL_CACHE_BACKEND ("memory", "redis" or "none")"""
+    backend = settings.RETRIEVAL_CACHE_BACKEND.lower()
+    if backend == "none":
+        return None
+    if backend == "redis":
+        if not settings.REDIS_URL:
+            raise ValueError("RETRIEVAL_CACHE_BACKEND=redis requires REDIS_URL")
+        return RedisRetrievalCache(str(settings.REDIS_URL), ttl_seconds=settings.RETRIEVAL_CACHE_TTL_SECONDS)
+    if backend == "memory":
+        return InMemoryRetrievalCache(
+            max_entries=settings.RETRIEVAL_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.RETRIEVAL_CACHE_TTL_SECONDS
+        )
+    raise ValueError(f"Unsupported RETRIEVAL_CACHE_BACKEND: {settings.RETRIEVAL_CACHE_BACKEND}")
+
+
+retrieval_cache = RetrievalCache(create_retrieval_cache_backend())
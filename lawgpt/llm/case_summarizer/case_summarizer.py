@@ -1,16 +1,27 @@
+import asyncio
+import hashlib
+import json
 import logging
+from typing import List, Optional
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.messages import SystemMessage, HumanMessage
 from lawgpt.core.config import settings
 from langchain_core.prompts import ChatPromptTemplate
+from lawgpt.llm.case_summarizer.rate_limit import TokenBucket, backoff_delay, is_retryable
 from lawgpt.llm.case_summarizer.schema.case_summarizer import CaseSummarizerSchema
 
 logger = logging.getLogger(__name__)
 import yaml
 
+# Bump when summaries should be regenerated for a reason the cache key can't see
+# (e.g. post-processing of the model output changes)
+SUMMARY_VERSION = 1
+
 class CaseSummarizerAgent:
     def __init__(self):
+        self.model_name = "gemini-2.0-flash"
         self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash",
+            model=self.model_name,
             temperature=0.5,
         )
         self.llm_with_structured_output = self.llm.with_structured_output(CaseSummarizerSchema)
@@ -24,22 +35,108 @@ class CaseSummarizerAgent:
         with open(f"lawgpt/llm/prompts/{path}.yml", "r") as file:
             return yaml.safe_load(file)[key]
 
-    def summarize_case(self, case_details: str):
-        """Summarize the case details"""
-        from langchain_core.messages import SystemMessage, HumanMessage
-        
+    def _messages(self, case_details: str):
         # Create the user prompt by safely replacing the placeholder
         user_message = self.user_prompt.replace("{case_details}", case_details)
         
         # Create messages directly without template parsing
-        messages = [
+        return [
             SystemMessage(content=self.system_prompt),
             HumanMessage(content=user_message)
         ]
-        
-        response = self.llm_with_structured_output.invoke(messages)
+
+    def _create_batch_llm(self):
+        """
+        Structured-output client for the async batch path. It does its own backoff, so the
+        client must not retry on top of it, and a new one is made per batch because the
+        async gRPC client stays bound to the event loop it was created on.
+        """
+        return ChatGoogleGenerativeAI(
+            model=self.model_name,
+            temperature=0.5,
+            max_retries=1,
+        ).with_structured_output(CaseSummarizerSchema)
+
+    def cache_key(self, case_details: str) -> str:
+        """Summary cache key: hash of the case details, prompts, output schema, model and SUMMARY_VERSION"""
+        fingerprint = json.dumps([
+            SUMMARY_VERSION,
+            self.model_name,
+            self.system_prompt,
+            self.user_prompt,
+            CaseSummarizerSchema.model_json_schema(),
+            case_details,
+        ], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def summarize_case(self, case_details: str):
+        """Summarize the case details"""
+        response = self.llm_with_structured_output.invoke(self._messages(case_details))
         return response.case_summary
 
+    async def asummarize_case(self, case_details: str, bucket: Optional[TokenBucket] = None, max_retries: Optional[int] = None, llm=None):
+        """
+        Summarize one case, retrying rate limits (429) and server errors (5xx) with exponential backoff
+        
+        Args:
+            case_details: Case details to summarize
+            bucket: Rate limiter every attempt takes a token from
+            max_retries: Retries after the first attempt (CASE_SUMMARY_MAX_RETRIES by default)
+            llm: Batch client to reuse (a new one is created when omitted)
+        """
+        max_retries = settings.CASE_SUMMARY_MAX_RETRIES if max_retries is None else max_retries
+        llm = llm or self._create_batch_llm()
+        messages = self._messages(case_details)
+        attempt = 0
+        while True:
+            if bucket is not None:
+                await bucket.acquire()
+            try:
+                response = await llm.ainvoke(messages)
+                return response.case_summary
+            except Exception as e:
+                if attempt >= max_retries or not is_retryable(e):
+                    raise
+                delay = backoff_delay(attempt)
+                attempt += 1
+                logger.warning(f"⏳ Case summary attempt {attempt} failed, retrying in {delay:.1f}s: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+                await asyncio.sleep(delay)
+
+    async def asummarize_cases(
+        self,
+        case_details_list: List[str],
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+    ) -> List[Optional[str]]:
+        """
+        Summarize many cases concurrently
+        
+        Args:
+            case_details_list: Case details, one entry per case
+            max_concurrency: Summaries in flight at once (CASE_SUMMARY_MAX_CONCURRENCY by default)
+            requests_per_minute: Request rate limit, retries included (CASE_SUMMARY_REQUESTS_PER_MINUTE by default)
+            
+        Returns:
+            Summaries in input order; "" for empty details and None where summarization failed
+        """
+        max_concurrency = max_concurrency or settings.CASE_SUMMARY_MAX_CONCURRENCY
+        requests_per_minute = requests_per_minute or settings.CASE_SUMMARY_REQUESTS_PER_MINUTE
+        semaphore = asyncio.Semaphore(max_concurrency)
+        bucket = TokenBucket(rate=requests_per_minute / 60, capacity=max_concurrency)
+        llm = self._create_batch_llm()
+
+        async def summarize(index: int, case_details: str) -> Optional[str]:
+            if not case_details:
+                return ""
+            async with semaphore:
+                try:
+                    return await self.asummarize_case(case_details, bucket=bucket, llm=llm)
+                except Exception as e:
+                    logger.warning(f"Failed to summarize case {index + 1}: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+                    return None
+
+        return await asyncio.gather(*(summarize(i, case_details) for i, case_details in enumerate(case_details_list)))
+
 def main():
     case_details = """
     "{Section 11(Ka)——The Code of Criminal Procedure} Section 342 We ﬁnd no reason not to put reliance on this postmortem examination report. The doctor who held post mortem examination on the dead body and prepared this report also has been examined by the prosecution as P.W. 14. This doctor witness also has deposed before the trial court to the effect that during postmortem examination he found some postmortem burns on the dead body and on dissection he found antimortem blood stain in the subcutaneous tissue to the anterolateral side of the neck and did not ﬁnd any sing of inﬂammation in the bum area and that in his opinion the death was due to asphyxia as a result of throttling which was anti- mortem and homicidal in nature.. (7)".
@@ -0,0 +1,60 @@
+import asyncio
+import random
+import re
+import time
+from typing import Optional
+
+# HTTP statuses worth retrying: rate limited or a server-side failure
+_RETRYABLE_NAMES = ("ResourceExhausted", "TooManyRequests", "ServiceUnavailable", "InternalServerError", "GatewayTimeout", "BadGateway")
+_STATUS_IN_MESSAGE = re.compile(r"\b(429|50[0-4])\b|RESOURCE_EXHAUSTED|UNAVAILABLE")
+
+
+class TokenBucket:
+    """Async token bucket: refills `rate` tokens per second, holds at most `capacity`"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until `tokens` are available and take them (callers are served in arrival order)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+def status_code(error: BaseException) -> Optional[int]:
+    """HTTP status of an API error (or of the error it wraps), if it carries one"""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        for attr in ("code", "status_code"):
+            value = getattr(error, attr, None)
+            if isinstance(value, int) and 100 <= value < 600:
+                return value
+        error = error.__cause__ or error.__context__
+    return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """True for rate limiting (429) and server errors (5xx), however the client wrapped them"""
+    code = status_code(error)
+    if code is not None:
+        return code == 429 or code >= 500
+    if type(error).__name__ in _RETRYABLE_NAMES:
+        return True
+    return bool(_STATUS_IN_MESSAGE.search(str(error)))
+
+
+def backoff_delay(attempt: int, base: float = 1.0, maximum: float = 60.0) -> float:
+    """Exponential backoff with jitter for the given retry attempt (0-based)"""
+    return min(maximum, base * (2 ** attempt)) * random.uniform(0.5, 1.0)
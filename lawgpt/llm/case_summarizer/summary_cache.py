@@ -0,0 +1,103 @@
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence
+
+from lawgpt.core.config import settings
+from lawgpt.core.metrics import CACHE_HITS, CACHE_MISSES
+from lawgpt.core.sqlite_utils import select_in
+
+logger = logging.getLogger(__name__)
+
+
+class CaseSummaryCache:
+    """
+    Persistent SQLite store of case summaries keyed on a content hash.
+
+    The key (see CaseSummarizerAgent.cache_key) covers the case details, the
+    prompts, the model and a summary version, so re-indexing unchanged cases skips
+    summarization while any prompt or model change misses naturally.
+    A cache with no path stores nothing and always misses.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, str]:
+        """Cached summaries for the keys that have one"""
+        found: Dict[str, str] = {}
+        with self._lock:
+            try:
+                db = self._connection()
+                if db is not None:
+                    found.update(select_in(db, "SELECT key, summary FROM case_summaries WHERE key IN ({})", (), keys))
+            except Exception as e:
+                logger.warning(f"Case summary cache read failed: {e}")
+            hits = sum(1 for key in keys if key in found)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        if hits:
+            CACHE_HITS.inc(hits, cache="case_summary")
+        if len(keys) - hits:
+            CACHE_MISSES.inc(len(keys) - hits, cache="case_summary")
+        return found
+
+    def get(self, key: str) -> Optional[str]:
+        return self.get_many([key]).get(key)
+
+    def put_many(self, summaries: Dict[str, str]):
+        if not summaries:
+            return
+        with self._lock:
+            try:
+                db = self._connection()
+                if db is None:
+                    return
+                db.executemany("INSERT OR REPLACE INTO case_summaries (key, summary) VALUES (?, ?)", summaries.items())
+                db.commit()
+            except Exception as e:
+                logger.warning(f"Case summary cache write failed: {e}")
+
+    def put(self, key: str, summary: str):
+        self.put_many({key: summary})
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            try:
+                db = self._connection()
+                entries = db.execute("SELECT COUNT(*) FROM case_summaries").fetchone()[0] if db is not None else 0
+            except Exception:
+                entries = 0
+        return {"entries": entries, "hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate()}
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self.path is None:
+            return None
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS case_summaries (key TEXT PRIMARY KEY, summary TEXT NOT NULL)")
+            self._db.commit()
+        return self._db
+
+
+case_summary_cache = CaseSummaryCache(
+    path=os.path.join(settings.CACHE_DIR, "case_summaries.sqlite3") if settings.CASE_SUMMARY_CACHE_ENABLED else None
+)
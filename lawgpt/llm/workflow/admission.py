@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional
+
+from lawgpt.core.config import settings
+from lawgpt.core.metrics import ADMISSION_REJECTIONS, ADMISSION_WAIT_SECONDS, ERRORS
+from lawgpt.llm.workflow.agent import SUPPORTED_MODEL_IDS
+from lawgpt.llm.workflow.deadline import DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """An LLM backend is saturated; carries the HTTP status and a Retry-After hint in seconds"""
+
+    def __init__(self, model_id: str, status_code: int, retry_after: int, reason: str):
+        super().__init__(f"{model_id} is busy ({reason}), retry after {retry_after}s")
+        self.model_id = model_id
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class ModelAdmission:
+    """
+    Concurrency limit with a bounded FIFO wait queue for one llm_model_id.
+
+    Up to `max_concurrency` calls run at once and up to `max_queue` more wait,
+    each for at most `queue_timeout` seconds. A full queue is rejected right away
+    (429); a wait that runs past the queue timeout is rejected with 503. Both carry
+    a Retry-After estimate from the recent average call duration. A wait cut short
+    by the caller's own (shorter) deadline raises DeadlineExceeded instead (504).
+    """
+
+    def __init__(self, model_id: str, max_concurrency: int, max_queue: int, queue_timeout: float):
+        self.model_id = model_id
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        # Exponentially weighted average time a slot is held
+        self._service_time: Optional[float] = None
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def check(self):
+        """Reject now if a new caller could not even join the queue"""
+        if self._active >= self.max_concurrency and len(self._waiters) >= self.max_queue:
+            raise self._rejection(429, "queue full")
+
+    @asynccontextmanager
+    async def slot(self, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        Hold one concurrency slot for the duration of the block
+        
+        Args:
+            timeout: Time left before the caller's deadline; the wait is capped by the
+                shorter of this and queue_timeout
+        """
+        await self._acquire(self.queue_timeout if timeout is None else min(timeout, self.queue_timeout), deadline_bound=timeout is not None and timeout < self.queue_timeout)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - start)
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely to free up for a new caller"""
+        service_time = self._service_time or 1.0
+        rounds = (len(self._waiters) + 1) / max(self.max_concurrency, 1)
+        return max(1, math.ceil(service_time * rounds))
+
+    async def _acquire(self, timeout: float, deadline_bound: bool = False):
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            ADMISSION_WAIT_SECONDS.observe(0.0, llm_model_id=self.model_id)
+            return
+        self.check()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up; pass it on
+                self._release(None)
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                if deadline_bound:
+                    ERRORS.inc(stage="deadline")
+                    logger.warning(f"⏱️ Request deadline passed while waiting for {self.model_id} ({timeout:.1f}s in queue)")
+                    raise DeadlineExceeded(f"Request deadline passed while waiting for {self.model_id}") from None
+                raise self._rejection(503, f"waited {timeout:.1f}s in queue") from None
+            raise
+        ADMISSION_WAIT_SECONDS.observe(time.monotonic() - start, llm_model_id=self.model_id)
+
+    def _release(self, held_for: Optional[float]):
+        if held_for is not None:
+            self._service_time = held_for if self._service_time is None else 0.8 * self._service_time + 0.2 * held_for
+        # Hand the slot straight to the oldest live waiter so FIFO order holds
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def _rejection(self, status_code: int, reason: str) -> AdmissionRejected:
+        ADMISSION_REJECTIONS.inc(llm_model_id=self.model_id, status=str(status_code))
+        logger.warning(f"🚦 Admission rejected - model: {self.model_id}, {reason} (active: {self._active}, waiting: {len(self._waiters)})")
+        return AdmissionRejected(self.model_id, status_code, self.retry_after(), reason)
+
+
+class AdmissionController:
+    """
+    Per-llm_model_id admission, with limits from Settings.
+
+    Supported models and models with their own limits get their own entry; any other
+    (client-supplied) id shares one "default" entry, so unknown ids cannot grow state.
+    """
+
+    def __init__(self):
+        self._models: Dict[str, ModelAdmission] = {}
+
+    def get(self, model_id: str) -> ModelAdmission:
+        if model_id not in SUPPORTED_MODEL_IDS and not any(
+            model_id in limits for limits in (settings.LLM_MAX_CONCURRENCY, settings.LLM_MAX_QUEUE, settings.LLM_QUEUE_TIMEOUT_SECONDS)
+        ):
+            model_id = "default"
+        admission = self._models.get(model_id)
+        if admission is None:
+            admission = ModelAdmission(
+                model_id,
+                max_concurrency=self._limit(settings.LLM_MAX_CONCURRENCY, model_id),
+                max_queue=self._limit(settings.LLM_MAX_QUEUE, model_id),
+                queue_timeout=self._limit(settings.LLM_QUEUE_TIMEOUT_SECONDS, model_id),
+            )
+            self._models[model_id] = admission
+        return admission
+
+    def check(self, model_id: str):
+        self.get(model_id).check()
+
+    def slot(self, model_id: str, timeout: Optional[float] = None):
+        return self.get(model_id).slot(timeout)
+
+    def reset(self):
+        """Forget all state (e.g. after settings change)"""
+        self._models.clear()
+
+    @staticmethod
+    def _limit(limits: Dict[str, float], model_id: str):
+        return limits.get(model_id, limits["default"])
+
+
+admission_controller = AdmissionController()
@@ -2,16 +2,23 @@
 import yaml
 import os
 import logging
+import threading
+import time
 from typing import Dict, Any
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage, AIMessage
 from lawgpt.core.config import settings
+from lawgpt.core.metrics import ERRORS, LLM_SECONDS, PROMPT_ASSEMBLY_SECONDS
+from lawgpt.llm.workflow.context_packer import pack_context
 from lawgpt.llm.workflow.custom_llm import CustomLLMChatAgent
 
 logger = logging.getLogger(__name__)
 
+# llm_model_id values ChatAgent can serve
+SUPPORTED_MODEL_IDS = ("gemini", "openai", "custom_llm")
+
 
 class ChatAgent:
     def __init__(self, model_id: str = "gemini"):
@@ -80,48 +87,68 @@ class ChatAgent:
     
     async def generate_response(self, user_input: str, rag_context: list = None) -> str:
         """Generate response using the configured LLM - Stateless"""
-        logger.info(f"ChatAgent processing {len(rag_context) if rag_context else 0} context items")
         try:
-            # Handle custom LLM differently 
-            if self.model_id == "custom_llm":
-                return await self.custom_agent.generate_response(
-                    user_input=user_input,
-                    rag_context=rag_context
-                )
-            
-            # Standard LLM handling (gemini, openai)
-            # Prepare context if RAG results are available
-            context_text = ""
-            if rag_context:
-                context_parts = []
-                for i, item in enumerate(rag_context):
-                    if item.get("type") == "case":
-                        content = item.get('content', '')
-                        context_parts.append(f"{content}")
-                        # Log only first case and law for brevity
-                        if i == 0:
-                            preview = content[:60] + "..." if len(content) > 60 else content
-                            logger.info(f"🔍 Context: {preview}")
-                    elif item.get("type") == "law":
-                        content = item.get('content', '')
-                        context_parts.append(f"{content}")
-                        # Log only first law if no case was logged
-                        if i == 0 and not any(item.get("type") == "case" for item in rag_context[:i]):
-                            preview = content[:60] + "..." if len(content) > 60 else content
-                            logger.info(f"🔍 Context: {preview}")
-                
-                if context_parts:
-                    context_text = f"\n\nRelevant Context:\n{chr(10).join(context_parts)}"
-            
-            # Combine user input with context
-            full_input = user_input + context_text
-            
-            # Generate response
-            prompt = self.prompt_template.format_messages(user_input=full_input)
-            response = await self.llm.ainvoke(prompt)
-            
-            return response.content
+            return await self.agenerate(user_input, rag_context)
             
         except Exception as e:
+            ERRORS.inc(stage="llm")
             logger.error(f"ChatAgent error - model: {self.model_id}, error: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
             return f"I apologize, but I encountered an error while processing your request: {str(e)}"
+    
+    async def agenerate(self, user_input: str, rag_context: list = None) -> str:
+        """Generate response like generate_response, but raise on failure instead of apologizing"""
+        logger.info(f"ChatAgent processing {len(rag_context) if rag_context else 0} context items")
+        # Handle custom LLM differently 
+        if self.model_id == "custom_llm":
+            with LLM_SECONDS.time(llm_model_id=self.model_id):
+                return await self.custom_agent.agenerate(
+                    user_input=user_input,
+                    rag_context=rag_context
+                )
+        
+        # Standard LLM handling (gemini, openai)
+        # Prepare context if RAG results are available
+        assembly_start = time.perf_counter()
+        context_text = ""
+        context_parts = pack_context(rag_context, self.model_id)
+        if context_parts:
+            preview = context_parts[0][:60] + "..." if len(context_parts[0]) > 60 else context_parts[0]
+            logger.info(f"🔍 Context: {preview}")
+            context_text = "\n\nRelevant Context:\n" + "\n\n".join(context_parts)
+        
+        # Combine user input with context
+        full_input = user_input + context_text
+        
+        # Generate response
+        prompt = self.prompt_template.format_messages(user_input=full_input)
+        PROMPT_ASSEMBLY_SECONDS.observe(time.perf_counter() - assembly_start, llm_model_id=self.model_id)
+        with LLM_SECONDS.time(llm_model_id=self.model_id):
+            response = await self.llm.ainvoke(prompt)
+        
+        return response.content
+
+
+# Long-lived agents keyed by llm_model_id so each provider keeps its SDK client
+# (and its keep-alive connection pool) across requests
+_chat_agents: Dict[str, ChatAgent] = {}
+_chat_agents_lock = threading.Lock()
+
+
+def get_chat_agent(model_id: str) -> ChatAgent:
+    """Return the cached ChatAgent for model_id, building it on first use"""
+    agent = _chat_agents.get(model_id)
+    if agent is not None:
+        return agent
+    with _chat_agents_lock:
+        agent = _chat_agents.get(model_id)
+        if agent is None:
+            agent = ChatAgent(model_id=model_id)
+            _chat_agents[model_id] = agent
+            logger.info(f"Cached ChatAgent for model_id: {model_id}")
+    return agent
+
+
+def clear_chat_agents():
+    """Drop all cached agents (e.g. after settings change)"""
+    with _chat_agents_lock:
+        _chat_agents.clear()
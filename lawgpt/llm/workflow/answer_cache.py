@@ -0,0 +1,185 @@
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from lawgpt.core.config import settings
+from lawgpt.data_pipeline.collection_version import collection_versions
+
+logger = logging.getLogger(__name__)
+
+# (llm_model_id, is_case_rag, is_law_rag)
+AnswerScope = Tuple[str, bool, bool]
+
+
+@dataclass
+class CachedAnswer:
+    answer: str
+    rag_context: List[Dict[str, Any]]
+    created_at: float
+    versions: Tuple[int, int]
+    vector: Optional[np.ndarray] = field(default=None, repr=False)
+
+
+class AnswerCache:
+    """
+    Answer cache for repeated questions, keyed on (llm_model_id, is_case_rag,
+    is_law_rag, normalized message).
+
+    Entries expire after `ttl_seconds`, the least recently used entry is evicted
+    beyond `max_entries`, and an entry is dropped once a collection it was built
+    from has been re-ingested. With `semantic_distance` set, a miss on the exact
+    key falls back to the closest cached query embedding in the same scope.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 3600.0, semantic_distance: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.semantic_distance = semantic_distance
+        self._entries: "OrderedDict[Tuple[AnswerScope, str], CachedAnswer]" = OrderedDict()
+        # Per-scope stacked unit vectors for the semantic tier, rebuilt lazily after changes
+        self._matrices: Dict[AnswerScope, Tuple[List[Tuple[AnswerScope, str]], np.ndarray]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @property
+    def semantic_enabled(self) -> bool:
+        return self.semantic_distance is not None
+
+    @staticmethod
+    def normalize(message: str) -> str:
+        """Case-fold and collapse whitespace so trivially different spellings share a key"""
+        return re.sub(r"\s+", " ", message).strip().casefold()
+
+    def get(self, scope: AnswerScope, message: str) -> Optional[CachedAnswer]:
+        """Exact-key lookup"""
+        key = (scope, self.normalize(message))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_fresh(scope, entry):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+        return None
+
+    def get_semantic(self, scope: AnswerScope, vector: List[float]) -> Optional[CachedAnswer]:
+        """
+        Closest fresh cached answer in the same scope within semantic_distance (cosine).
+        
+        Candidates are tried from closest to farthest; expired or outdated ones found on
+        the way are dropped, so a stale best match does not hide a valid runner-up.
+        """
+        if not self.semantic_enabled:
+            return None
+        query = self._unit(vector)
+        with self._lock:
+            keys, matrix = self._scope_matrix(scope)
+            if not keys:
+                return None
+            similarities = matrix @ query
+            candidates = np.flatnonzero(similarities >= 1.0 - self.semantic_distance)
+            stale = []
+            found = None
+            for index in candidates[np.argsort(-similarities[candidates])]:
+                key = keys[int(index)]
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if self._is_fresh(scope, entry):
+                    found = (key, entry)
+                    break
+                stale.append(key)
+            for key in stale:
+                self._remove(key)
+            if found is not None:
+                self._entries.move_to_end(found[0])
+                self.semantic_hits += 1
+                return found[1]
+        return None
+
+    def put(
+        self,
+        scope: AnswerScope,
+        message: str,
+        answer: str,
+        rag_context: List[Dict[str, Any]],
+        vector: Optional[List[float]] = None,
+    ):
+        """Store an answer with the collection versions it was built from"""
+        key = (scope, self.normalize(message))
+        entry = CachedAnswer(
+            answer=answer,
+            rag_context=rag_context,
+            created_at=time.monotonic(),
+            versions=self._current_versions(scope),
+            vector=self._unit(vector) if vector is not None and self.semantic_enabled else None,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._matrices.pop(scope, None)
+            while len(self._entries) > self.max_entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._matrices.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count and counters (semantic hits are a subset of exact-key misses)"""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+        }
+
+    def _is_fresh(self, scope: AnswerScope, entry: CachedAnswer) -> bool:
+        if time.monotonic() - entry.created_at > self.ttl_seconds:
+            return False
+        return entry.versions == self._current_versions(scope)
+
+    @staticmethod
+    def _current_versions(scope: AnswerScope) -> Tuple[int, int]:
+        _, is_case_rag, is_law_rag = scope
+        case_version = collection_versions.get(settings.QDRANT_LEGAL_CASES_COLLECTION_NAME) if is_case_rag else 0
+        law_version = collection_versions.get(settings.QDRANT_LAW_REFERENCE_COLLECTION_NAME) if is_law_rag else 0
+        return case_version, law_version
+
+    def _remove(self, key: Tuple[AnswerScope, str]):
+        self._entries.pop(key, None)
+        self._matrices.pop(key[0], None)
+
+    def _scope_matrix(self, scope: AnswerScope) -> Tuple[List[Tuple[AnswerScope, str]], np.ndarray]:
+        cached = self._matrices.get(scope)
+        if cached is None:
+            keys = [key for key, entry in self._entries.items() if key[0] == scope and entry.vector is not None]
+            matrix = np.stack([self._entries[key].vector for key in keys]) if keys else np.empty((0, 0), dtype=np.float32)
+            cached = (keys, matrix)
+            self._matrices[scope] = cached
+        return cached
+
+    @staticmethod
+    def _unit(vector: List[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm else array
+
+
+answer_cache = AnswerCache(
+    max_entries=settings.ANSWER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.ANSWER_CACHE_TTL_SECONDS,
+    semantic_distance=settings.ANSWER_CACHE_SEMANTIC_DISTANCE,
+)
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from lawgpt.core.config import settings
+from lawgpt.core.metrics import ERRORS
+from lawgpt.data_pipeline.registry import pipeline_registry
+from lawgpt.llm.workflow.admission import admission_controller
+from lawgpt.llm.workflow.agent import get_chat_agent
+from lawgpt.llm.workflow.custom_llm import CustomLLMError
+from lawgpt.llm.workflow.graph import RAG_RESULT_LIMIT, format_case_context, format_law_context
+
+logger = logging.getLogger(__name__)
+
+# (message, llm_model_id, is_case_rag, is_law_rag)
+BatchKey = Tuple[str, str, bool, bool]
+
+
+class ChatBatchRunner:
+    """
+    Runs many chat requests as one job.
+
+    Identical requests are answered once. All queries that need retrieval are
+    embedded in one batched embedding call and searched with one batched Qdrant
+    query per collection; LLM calls then fan out through the same per-model
+    admission control as the chat endpoints. Results are yielded in input order
+    as soon as each one is ready.
+    """
+
+    def __init__(self, concurrency_per_model: Optional[int] = None):
+        # Per-batch cap on items competing for a model's admission slots, so one large
+        # batch does not fill the shared wait queue; the per-model limit is admission's
+        self.concurrency_per_model = concurrency_per_model or settings.CHAT_BATCH_CONCURRENCY_PER_MODEL
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def run(self, items: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process items shaped like ChatRequest and yield one result per item, in order.
+
+        Each result is {"index", "response", "error"}.
+        """
+        keys: List[BatchKey] = [
+            (item["message"], item["llm_model_id"], item["is_case_rag"], item["is_law_rag"])
+            for item in items
+        ]
+        unique_keys = list(dict.fromkeys(keys))
+        logger.info(f"📦 Batch received {len(keys)} items ({len(unique_keys)} unique)")
+
+        contexts = await self._retrieve(unique_keys)
+
+        tasks = {
+            key: asyncio.create_task(self._answer(key, contexts.get(key, [])))
+            for key in unique_keys
+        }
+        try:
+            for index, key in enumerate(keys):
+                response, error = await tasks[key]
+                yield {"index": index, "response": response, "error": error}
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    async def _retrieve(self, keys: List[BatchKey]) -> Dict[BatchKey, List[Dict[str, Any]]]:
+        """Embed unique messages once and run batched case/law searches"""
+        messages = list(dict.fromkeys(key[0] for key in keys if key[2] or key[3]))
+        if not messages:
+            return {}
+
+        try:
+            vectors = dict(zip(messages, await pipeline_registry.aembed_queries(messages)))
+        except Exception as e:
+            ERRORS.inc(stage="embedding")
+            logger.error(f"Batch embedding error: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+            return {}
+
+        case_messages = list(dict.fromkeys(key[0] for key in keys if key[2]))
+        law_messages = list(dict.fromkeys(key[0] for key in keys if key[3]))
+
+        async def search(pipeline_name: str, batch_messages: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+            if not batch_messages:
+                return {}
+            try:
+                pipeline = getattr(pipeline_registry, f"{pipeline_name}_pipeline")
+                results = await pipeline.asearch_batch_by_vectors(
+                    [vectors[message] for message in batch_messages],
+                    limit=RAG_RESULT_LIMIT
+                )
+                return dict(zip(batch_messages, results))
+            except Exception as e:
+                ERRORS.inc(stage=f"{pipeline_name}_search")
+                logger.error(f"Batch {pipeline_name} RAG error: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+                return {}
+
+        case_results, law_results = await asyncio.gather(
+            search("case", case_messages),
+            search("law", law_messages)
+        )
+        logger.info(f"📦 Batch retrieval done: {len(case_results)} case queries, {len(law_results)} law queries")
+
+        contexts = {}
+        for key in keys:
+            message, _, is_case_rag, is_law_rag = key
+            rag_context = []
+            if is_case_rag:
+                rag_context.extend(format_case_context(case_results.get(message, [])))
+            if is_law_rag:
+                rag_context.extend(format_law_context(law_results.get(message, [])))
+            contexts[key] = rag_context
+        return contexts
+
+    async def _answer(self, key: BatchKey, rag_context: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
+        """Generate one answer within its model's admission limit; failures (including rejections) go to error"""
+        message, model_id = key[0], key[1]
+        semaphore = self._semaphores.setdefault(model_id, asyncio.Semaphore(self.concurrency_per_model))
+        async with semaphore:
+            try:
+                chat_agent = get_chat_agent(model_id)
+                async with admission_controller.slot(model_id):
+                    response = await chat_agent.agenerate(user_input=message, rag_context=rag_context)
+                return response, None
+            except CustomLLMError as e:
+                # Counted as custom_llm_http where it happened
+                return None, str(e)
+            except Exception as e:
+                ERRORS.inc(stage="llm")
+                logger.error(f"Batch item error - model: {model_id}, error: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+                return None, str(e)
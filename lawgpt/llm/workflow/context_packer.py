@@ -0,0 +1,135 @@
+import logging
+import math
+import re
+from typing import Any, Dict, List, Optional
+
+from lawgpt.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rough token estimate for budgeting (no tokenizer dependency); ~4 chars per token
+CHARS_PER_TOKEN = 4
+
+# Law chunks are split with ~100 chars of overlap; shorter matches are treated as coincidence
+MIN_CHUNK_OVERLAP = 20
+MAX_CHUNK_OVERLAP = 400
+
+# Don't bother appending a truncated item with less room than this
+MIN_TRUNCATED_TOKENS = 100
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def token_budget(model_id: str) -> int:
+    """Context token budget for a model (CONTEXT_TOKEN_BUDGET, "default" for other models)"""
+    return settings.CONTEXT_TOKEN_BUDGET.get(model_id, settings.CONTEXT_TOKEN_BUDGET["default"])
+
+
+def clean_text(text: str) -> str:
+    """Strip every line, collapse runs of spaces and drop blank lines"""
+    lines = (re.sub(r"[ \t]+", " ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _overlap(head: str, tail: str) -> int:
+    """Length of the longest suffix of head that is a prefix of tail"""
+    for size in range(min(len(head), len(tail), MAX_CHUNK_OVERLAP), MIN_CHUNK_OVERLAP - 1, -1):
+        if head.endswith(tail[:size]):
+            return size
+    return 0
+
+
+def merge_chunks(chunks: List[str]) -> List[str]:
+    """Merge chunks of one section that contain or overlap each other"""
+    merged: List[str] = []
+    for chunk in chunks:
+        for i, existing in enumerate(merged):
+            if chunk in existing:
+                break
+            if existing in chunk:
+                merged[i] = chunk
+                break
+            overlap = _overlap(existing, chunk)
+            if overlap:
+                merged[i] = existing + chunk[overlap:]
+                break
+            overlap = _overlap(chunk, existing)
+            if overlap:
+                merged[i] = chunk + existing[overlap:]
+                break
+        else:
+            merged.append(chunk)
+    return merged
+
+
+def _law_items(law_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Group law chunks (items carrying raw law_text) by part_section and merge the overlapping ones"""
+    sections: Dict[str, List[Dict[str, Any]]] = {}
+    for item in law_items:
+        sections.setdefault(item.get("part_section", ""), []).append(item)
+
+    packed = []
+    for part_section, items in sections.items():
+        items = sorted(items, key=lambda item: item.get("chunk_index", 0))
+        chunks = [clean_text(item["law_text"]) for item in items]
+        score = max(item.get("score") or 0.0 for item in items)
+        for chunk in merge_chunks(chunks):
+            packed.append({"type": "law", "content": f"Part Section: {part_section}\nLaw Text: {chunk}", "score": score})
+    return packed
+
+
+def _truncate(text: str, tokens: int) -> str:
+    limit = tokens * CHARS_PER_TOKEN
+    cut = text.rfind(" ", 0, limit)
+    return text[:cut if cut > limit // 2 else limit].rstrip() + " …"
+
+
+def pack_context(rag_context: Optional[List[Dict[str, Any]]], model_id: str, budget: Optional[int] = None) -> List[str]:
+    """
+    Turn rag_context items into prompt-ready text blocks.
+
+    Whitespace is stripped, overlapping law chunks of the same part_section are
+    merged, duplicates are dropped, and blocks are taken highest score first
+    until the model's token budget is spent (the last one may be truncated).
+
+    Args:
+        rag_context: Items built by format_case_context / format_law_context
+        model_id: llm_model_id whose budget applies
+        budget: Token budget override
+
+    Returns:
+        Context blocks in prompt order
+    """
+    if not rag_context:
+        return []
+    budget = token_budget(model_id) if budget is None else budget
+
+    items = [
+        {"type": item.get("type"), "content": clean_text(item.get("content", "")), "score": item.get("score") or 0.0}
+        for item in rag_context if "law_text" not in item
+    ]
+    items.extend(_law_items([item for item in rag_context if "law_text" in item]))
+    items.sort(key=lambda item: item["score"], reverse=True)
+
+    blocks: List[str] = []
+    seen = set()
+    used = 0
+    for item in items:
+        content = item["content"]
+        if not content or content in seen:
+            continue
+        seen.add(content)
+        tokens = estimate_tokens(content)
+        if used + tokens > budget:
+            room = budget - used
+            if room >= MIN_TRUNCATED_TOKENS:
+                blocks.append(_truncate(content, room))
+                used = budget
+            break
+        blocks.append(content)
+        used += tokens
+
+    logger.info(f"📦 Packed {len(blocks)}/{len(rag_context)} context items (~{used} tokens, budget {budget})")
+    return blocks
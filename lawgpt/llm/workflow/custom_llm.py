@@ -1,16 +1,24 @@
-import requests
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, AsyncIterator, List, Optional
+import httpx
 from pydantic import Field
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, AIMessageChunk, SystemMessage
 from langchain_core.language_models import BaseChatModel
-from langchain_core.outputs import ChatResult, ChatGeneration
+from langchain_core.outputs import ChatResult, ChatGeneration, ChatGenerationChunk
 from lawgpt.core.config import settings
+from lawgpt.core.metrics import CUSTOM_LLM_HTTP_SECONDS, ERRORS, PROMPT_ASSEMBLY_SECONDS
+from lawgpt.llm.workflow.context_packer import pack_context
+from lawgpt.llm.workflow.custom_llm_transport import get_custom_llm_transport
 
 logger = logging.getLogger(__name__)
 
 
+class CustomLLMError(Exception):
+    """The custom model endpoint failed; the message is the user-facing apology"""
+
+
 class CustomLLMAPI(BaseChatModel):
     """
     Custom LLM implementation that interfaces with Modal API endpoint
@@ -26,6 +34,8 @@ class CustomLLMAPI(BaseChatModel):
         self.api_url = settings.CUSTOM_MODEL_URL or ""
         self.api_key = settings.CUSTOM_MODEL_API_KEY or ""
         self.model_name = "custom-modal-llm"
+        # Only take the chunked streaming path when the deployment supports it
+        self.disable_streaming = not settings.CUSTOM_MODEL_STREAMING
         
         logger.info(f"CustomLLMAPI initialized with URL: {self.api_url[:50]}{'...' if len(self.api_url) > 50 else ''}")
     
@@ -35,7 +45,10 @@ class CustomLLMAPI(BaseChatModel):
     def _format_messages_for_api(self, messages: List[BaseMessage], rag_context: str = "") -> Dict[str, Any]:
         """
         Convert LangChain messages to the format expected by the Modal API
-        following the test_api.py pattern - No chat history
+        following the test_api.py pattern - No chat history.
+        
+        Retrieved context travels only in the payload's rag_context field; the
+        user prompt is the plain question.
         """
         system_prompt = None
         user_prompt = ""
@@ -68,81 +81,103 @@ class CustomLLMAPI(BaseChatModel):
         self, 
         messages: List[BaseMessage], 
         stop: Optional[List[str]] = None, 
+        run_manager: Optional[Any] = None,
+        rag_context: str = "",
         **kwargs: Any
     ) -> ChatResult:
         """
         Async method to generate response from custom Modal API - Stateless
         """
-        # Extract rag_context from kwargs if available
-        rag_context = kwargs.get('rag_context', "")
-        
         try:
             # Format messages for API
             payload = self._format_messages_for_api(messages, rag_context)
             
-            logger.info(f"📤 Sending to LLM API ({len(payload['user_prompt'])} chars)")
-            
-            # Make API request
-            response = requests.post(
-                self.api_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=420  # 6 minute timeout
-            )
+            logger.info(f"📤 Sending to LLM API ({len(payload['user_prompt'])} chars prompt, {len(payload['rag_context'])} chars context)")
             
-            if response.status_code == 200:
-                result = response.json()
-                assistant_response = result.get('response', '')
-                
-                logger.info(f"📥 LLM response received ({len(assistant_response)} chars)")
-                
-                # Return in LangChain format
-                generation = ChatGeneration(message=AIMessage(content=assistant_response))
-                return ChatResult(generations=[generation])
+            # Pooled keep-alive client shared by the whole process
+            with CUSTOM_LLM_HTTP_SECONDS.time():
+                result = await get_custom_llm_transport().post(self.api_url, payload)
+            assistant_response = result.get('response', '')
             
-            else:
-                error_msg = f"Custom LLM API error {response.status_code}: {response.text}"
-                logger.error(error_msg)
-                generation = ChatGeneration(message=AIMessage(content=f"I apologize, but I encountered an API error: {error_msg}"))
-                return ChatResult(generations=[generation])
-                
-        except requests.exceptions.Timeout:
-            error_msg = "Custom LLM API request timed out (>6 minutes)"
-            logger.error(error_msg)
-            generation = ChatGeneration(message=AIMessage(content=f"I apologize, but the request timed out: {error_msg}"))
-            return ChatResult(generations=[generation])
-            
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Custom LLM API network error: {e}"
-            logger.error(error_msg)
-            generation = ChatGeneration(message=AIMessage(content=f"I apologize, but I encountered a network error: {error_msg}"))
-            return ChatResult(generations=[generation])
+            logger.info(f"📥 LLM response received ({len(assistant_response)} chars)")
             
+            return self._to_chat_result(assistant_response)
+        
         except Exception as e:
-            error_msg = f"Custom LLM API unexpected error: {e}"
-            logger.error(error_msg)
-            generation = ChatGeneration(message=AIMessage(content=f"I apologize, but I encountered an unexpected error: {error_msg}"))
-            return ChatResult(generations=[generation])
+            ERRORS.inc(stage="custom_llm_http")
+            return self._to_chat_result(self._error_message(e), error=True)
+    
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[Any] = None,
+        rag_context: str = "",
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        """
+        Stream the response as chunked text from the custom Modal API
+        """
+        payload = self._format_messages_for_api(messages, rag_context)
+        
+        logger.info(f"📤 Streaming from LLM API ({len(payload['user_prompt'])} chars prompt, {len(payload['rag_context'])} chars context)")
+        
+        received = 0
+        try:
+            async for text in get_custom_llm_transport().stream(self.api_url, payload):
+                received += len(text)
+                chunk = ChatGenerationChunk(message=AIMessageChunk(content=text))
+                if run_manager:
+                    await run_manager.on_llm_new_token(text, chunk=chunk)
+                yield chunk
+            logger.info(f"📥 LLM stream finished ({received} chars)")
+        except Exception as e:
+            ERRORS.inc(stage="custom_llm_http")
+            yield ChatGenerationChunk(message=AIMessageChunk(content=self._error_message(e), response_metadata={"error": True}))
     
     def _generate(
         self, 
         messages: List[BaseMessage], 
         stop: Optional[List[str]] = None, 
+        run_manager: Optional[Any] = None,
+        rag_context: str = "",
         **kwargs: Any
     ) -> ChatResult:
         """
-        Sync method (calls async version)
+        Sync method for callers outside an event loop (uses the pooled sync client)
         """
-        import asyncio
-        
-        # Get or create event loop
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self._agenerate(messages, stop, **kwargs))
+            payload = self._format_messages_for_api(messages, rag_context)
+            result = get_custom_llm_transport().post_sync(self.api_url, payload)
+            return self._to_chat_result(result.get('response', ''))
+        except Exception as e:
+            ERRORS.inc(stage="custom_llm_http")
+            return self._to_chat_result(self._error_message(e), error=True)
+    
+    @staticmethod
+    def _to_chat_result(content: str, error: bool = False) -> ChatResult:
+        """Wrap text in LangChain's ChatResult format; error replies are flagged in response_metadata"""
+        message = AIMessage(content=content, response_metadata={"error": True} if error else {})
+        return ChatResult(generations=[ChatGeneration(message=message)])
+    
+    @staticmethod
+    def _error_message(error: Exception) -> str:
+        """Log a transport error and turn it into the user-facing apology"""
+        if isinstance(error, httpx.TimeoutException):
+            error_msg = f"Custom LLM API request timed out ({type(error).__name__})"
+            logger.error(error_msg)
+            return f"I apologize, but the request timed out: {error_msg}"
+        if isinstance(error, httpx.HTTPStatusError):
+            error_msg = f"Custom LLM API error {error.response.status_code}: {error.response.text}"
+            logger.error(error_msg)
+            return f"I apologize, but I encountered an API error: {error_msg}"
+        if isinstance(error, httpx.RequestError):
+            error_msg = f"Custom LLM API network error: {error}"
+            logger.error(error_msg)
+            return f"I apologize, but I encountered a network error: {error_msg}"
+        error_msg = f"Custom LLM API unexpected error: {error}"
+        logger.error(error_msg)
+        return f"I apologize, but I encountered an unexpected error: {error_msg}"
 
 
 class CustomLLMChatAgent:
@@ -179,46 +214,49 @@ class CustomLLMChatAgent:
         Generate response using custom LLM - Stateless, no chat history
         """
         try:
-            logger.info(f"CustomLLM processing {len(rag_context) if rag_context else 0} context items")
-            
-            # Prepare RAG context string if available
-            rag_context_text = ""
-            if rag_context:
-                context_parts = []
-                for i, item in enumerate(rag_context):
-                    if item.get("type") == "case":
-                        content = item.get('content', '')
-                        context_parts.append(f"{content}")
-                        # Log only first case and law for brevity
-                        if i == 0:
-                            preview = content[:60] + "..." if len(content) > 60 else content
-                            logger.info(f"🔍 Context: {preview}")
-                    elif item.get("type") == "law":
-                        content = item.get('content', '')
-                        context_parts.append(f"{content}")
-                        # Log only first law if no case was logged
-                        if i == 0 and not any(item.get("type") == "case" for item in rag_context[:i]):
-                            preview = content[:60] + "..." if len(content) > 60 else content
-                            logger.info(f"🔍 Context: {preview}")
-                
-                if context_parts:
-                    rag_context_text = f"\n\nRAG context:\n{chr(10).join(context_parts)}"
-            
-            # Prepare messages for the LLM
-            messages = [
-                SystemMessage(content=self.system_prompt),
-                HumanMessage(content=user_input + rag_context_text)
-            ]
-            
-            # Generate response with rag_context only (no thread_id)
-            result = await self.llm._agenerate(
-                messages, 
-                rag_context=rag_context_text
-            )
-            
-            response_content = result.generations[0].message.content
-            return response_content
+            return await self.agenerate(user_input, rag_context)
+        
+        except CustomLLMError as e:
+            return str(e)
             
         except Exception as e:
             logger.error(f"Error generating response: {e}")
-            return f"I apologize, but I encountered an error while processing your request: {str(e)}"
\ No newline at end of file
+            return f"I apologize, but I encountered an error while processing your request: {str(e)}"
+    
+    async def agenerate(
+        self, 
+        user_input: str, 
+        rag_context: List[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate response like generate_response, but raise on failure
+        """
+        logger.info(f"CustomLLM processing {len(rag_context) if rag_context else 0} context items")
+        
+        # Prepare RAG context string if available
+        assembly_start = time.perf_counter()
+        context_parts = pack_context(rag_context, "custom_llm")
+        if context_parts:
+            preview = context_parts[0][:60] + "..." if len(context_parts[0]) > 60 else context_parts[0]
+            logger.info(f"🔍 Context: {preview}")
+        rag_context_text = "\n\n".join(context_parts)
+        
+        # Prepare messages for the LLM. The question goes in the user message and the
+        # context only in rag_context, which is how the fine-tuned model was trained
+        # (see test_api.py) - sending it in both doubled the prefill.
+        messages = [
+            SystemMessage(content=self.system_prompt),
+            HumanMessage(content=user_input)
+        ]
+        PROMPT_ASSEMBLY_SECONDS.observe(time.perf_counter() - assembly_start, llm_model_id="custom_llm")
+        
+        # Generate response with rag_context only (no thread_id). Going through
+        # ainvoke lets LangGraph stream tokens when CUSTOM_MODEL_STREAMING is on.
+        result = await self.llm.ainvoke(
+            messages, 
+            rag_context=rag_context_text
+        )
+        
+        if result.response_metadata.get("error"):
+            raise CustomLLMError(result.content)
+        return result.content
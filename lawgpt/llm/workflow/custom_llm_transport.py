@@ -0,0 +1,154 @@
+import logging
+import threading
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from lawgpt.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CustomLLMTransport:
+    """
+    Shared HTTP transport for the custom (Modal) model endpoint.
+
+    One pooled keep-alive client per process (async for the request path, sync for
+    scripts), with separate connect and read timeouts. `stream` posts the payload with
+    `"stream": true` and yields the chunked response body as it arrives.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 420.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 60.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.timeout = httpx.Timeout(
+            connect=connect_timeout,
+            read=read_timeout,
+            write=connect_timeout,
+            pool=connect_timeout,
+        )
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport = transport
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._sync_client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            with self._lock:
+                if self._async_client is None:
+                    self._async_client = httpx.AsyncClient(
+                        timeout=self.timeout,
+                        limits=self.limits,
+                        transport=self._transport,
+                        headers={"Content-Type": "application/json"},
+                    )
+        return self._async_client
+
+    @property
+    def sync_client(self) -> httpx.Client:
+        if self._sync_client is None:
+            with self._lock:
+                if self._sync_client is None:
+                    self._sync_client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=self.limits,
+                        headers={"Content-Type": "application/json"},
+                    )
+        return self._sync_client
+
+    async def post(self, url: str, payload: Dict[str, Any], read_timeout: Optional[float] = None) -> Dict[str, Any]:
+        """POST the payload and return the decoded JSON body; raises httpx errors"""
+        response = await self.async_client.post(url, json=payload, timeout=self._request_timeout(read_timeout))
+        response.raise_for_status()
+        return response.json()
+
+    async def stream(self, url: str, payload: Dict[str, Any], read_timeout: Optional[float] = None) -> AsyncIterator[str]:
+        """POST the payload in streaming mode and yield decoded text chunks"""
+        async with self.async_client.stream(
+            "POST",
+            url,
+            json={**payload, "stream": True},
+            timeout=self._request_timeout(read_timeout),
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                response.raise_for_status()
+            async for chunk in response.aiter_text():
+                if chunk:
+                    yield chunk
+
+    def post_sync(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Blocking POST for callers outside an event loop"""
+        response = self.sync_client.post(url, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    def _request_timeout(self, read_timeout: Optional[float]) -> httpx.Timeout:
+        if read_timeout is None:
+            return self.timeout
+        return httpx.Timeout(
+            connect=self.timeout.connect,
+            read=read_timeout,
+            write=self.timeout.write,
+            pool=self.timeout.pool,
+        )
+
+    async def aclose(self):
+        """Close both pooled clients"""
+        with self._lock:
+            async_client, self._async_client = self._async_client, None
+            sync_client, self._sync_client = self._sync_client, None
+        if async_client is not None:
+            await async_client.aclose()
+        if sync_client is not None:
+            sync_client.close()
+
+
+_transport: Optional[CustomLLMTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_custom_llm_transport() -> CustomLLMTransport:
+    """Return the process-wide transport, built from settings on first use"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = CustomLLMTransport(
+                    connect_timeout=settings.CUSTOM_MODEL_CONNECT_TIMEOUT,
+                    read_timeout=settings.CUSTOM_MODEL_READ_TIMEOUT,
+                    max_connections=settings.CUSTOM_MODEL_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.CUSTOM_MODEL_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.CUSTOM_MODEL_KEEPALIVE_EXPIRY,
+                )
+                logger.info("Custom LLM HTTP transport initialized")
+    return _transport
+
+
+def set_custom_llm_transport(transport: Optional[CustomLLMTransport]):
+    """Replace the process-wide transport (e.g. to point at a local stand-in)"""
+    global _transport
+    with _transport_lock:
+        _transport = transport
+
+
+async def close_custom_llm_transport():
+    """Close the process-wide transport if it was created"""
+    global _transport
+    with _transport_lock:
+        transport, _transport = _transport, None
+    if transport is not None:
+        await transport.aclose()
+        logger.info("Custom LLM HTTP transport closed")
@@ -0,0 +1,34 @@
+import time
+from typing import Optional
+
+from lawgpt.core.config import settings
+
+
+class DeadlineExceeded(Exception):
+    """The request's end-to-end deadline passed before an answer was ready"""
+
+
+def resolve_deadline(model_id: str, requested_seconds: Optional[float] = None) -> float:
+    """
+    Absolute deadline (time.monotonic()) for a new request.
+
+    Callers may ask for less than the server's per-model ceiling, never more.
+    """
+    ceiling = settings.CHAT_DEADLINE_SECONDS.get(model_id, settings.CHAT_DEADLINE_SECONDS["default"])
+    seconds = ceiling if requested_seconds is None else min(requested_seconds, ceiling)
+    return time.monotonic() + seconds
+
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left before the deadline (None when there is no deadline)"""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def retrieval_deadline(deadline: Optional[float]) -> Optional[float]:
+    """Absolute deadline for retrieval: its share of what is left, capped at RAG_MAX_SECONDS"""
+    left = remaining(deadline)
+    if left is None:
+        return None
+    return time.monotonic() + min(left * settings.RAG_DEADLINE_SHARE, settings.RAG_MAX_SECONDS)
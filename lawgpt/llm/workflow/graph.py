@@ -1,21 +1,142 @@
 
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
+from langchain_core.messages import AIMessage
 from langgraph.graph import StateGraph, START, END
 
+from lawgpt.core.config import settings
+from lawgpt.core.metrics import (
+    CACHE_HITS,
+    CACHE_MISSES,
+    CASE_SEARCH_SECONDS,
+    CONTEXT_ITEMS,
+    ERRORS,
+    LAW_SEARCH_SECONDS,
+    QUERY_EMBEDDING_SECONDS,
+)
 from lawgpt.llm.workflow.state import ChatState
-from lawgpt.llm.workflow.agent import ChatAgent
-from lawgpt.data_pipeline.rag_case_pipeline import CaseRAGPipeline
-from lawgpt.data_pipeline.rag_law_pipeline import LawRAGPipeline
+from lawgpt.llm.workflow.admission import AdmissionRejected, admission_controller
+from lawgpt.llm.workflow.agent import get_chat_agent
+from lawgpt.llm.workflow.custom_llm import CustomLLMError
+from lawgpt.llm.workflow.deadline import DeadlineExceeded, remaining, retrieval_deadline
+from lawgpt.llm.workflow.answer_cache import AnswerScope, answer_cache
+from lawgpt.data_pipeline.registry import pipeline_registry
 
 logger = logging.getLogger(__name__)
 
 
+# Number of hits taken from each collection per query
+RAG_RESULT_LIMIT = 2
+
+
+def format_case_context(case_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Turn case search results into rag_context items"""
+    case_context = []
+    for i, result in enumerate(case_results):
+        metadata = result["metadata"]
+        content = "\n".join([
+            f"Case Title: {metadata.get('case_title', '')}",
+            f"Division: {metadata.get('division', '')}",
+            f"Law Category: {metadata.get('law_category', '')}",
+            f"Law Act: {metadata.get('law_act', '')}",
+            f"Reference: {metadata.get('reference', '')}",
+            f"Case Summary: {metadata.get('case_details', '')}",
+        ])
+        
+        case_context.append({
+            "type": "case",
+            "content": content,
+            "case_title": metadata.get('case_title', ''),
+            "score": result.get("score")
+        })
+        
+        # Log truncated context preview (only first result for brevity)
+        if i == 0:
+            preview = content[:80] + "..." if len(content) > 80 else content
+            logger.info(f"📋 Case RAG: {preview}")
+    return case_context
+
+
+def format_law_context(law_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Turn law search results into rag_context items"""
+    law_context = []
+    for i, result in enumerate(law_results):
+        metadata = result["metadata"]
+        content = f"Part Section: {metadata.get('part_section', '')}\nLaw Text: {result.get('content', '')}"
+        
+        law_context.append({
+            "type": "law",
+            "content": content,
+            "part_section": metadata.get('part_section', ''),
+            # Raw chunk and position so the context packer can merge overlapping chunks
+            "law_text": result.get('content', ''),
+            "chunk_index": metadata.get('chunk_index', 0),
+            "score": result.get("score")
+        })
+        
+        # Log truncated context preview (only first result for brevity)
+        if i == 0:
+            preview = content[:80] + "..." if len(content) > 80 else content
+            logger.info(f"📜 Law RAG: {preview}")
+    return law_context
+
+
+def _answer_scope(state: ChatState) -> AnswerScope:
+    """Answer cache scope for this request"""
+    return (state["llm_model_id"], state["is_case_rag"], state["is_law_rag"])
+
+
 def create_chat_workflow():
     """Create and return the chat workflow graph - Stateless, no memory"""
     logger.info("Creating stateless chat workflow graph...")
     
     # Define workflow nodes
+    async def cache_lookup_node(state: ChatState) -> Dict[str, Any]:
+        """Node to answer repeated questions from the answer cache"""
+        if not settings.ANSWER_CACHE_ENABLED:
+            return {"cache_hit": False}
+        
+        scope = _answer_scope(state)
+        user_message = state["messages"][-1].content
+        update: Dict[str, Any] = {"cache_hit": False}
+        
+        cached = answer_cache.get(scope, user_message)
+        cache_name = "answer"
+        if cached is None and answer_cache.semantic_enabled:
+            cache_name = "answer_semantic"
+            try:
+                # The vector is kept in state so rag_node does not embed again
+                with QUERY_EMBEDDING_SECONDS.time():
+                    query_vector = await asyncio.wait_for(
+                        pipeline_registry.aembed_query(user_message),
+                        remaining(retrieval_deadline(state.get("deadline")))
+                    )
+                update["query_vector"] = query_vector
+                cached = answer_cache.get_semantic(scope, query_vector)
+            except asyncio.TimeoutError:
+                ERRORS.inc(stage="embedding")
+                logger.warning("⏱️ Answer cache embedding exceeded the retrieval budget")
+            except Exception as e:
+                ERRORS.inc(stage="embedding")
+                logger.error(f"Answer cache embedding error: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+        
+        if cached is None:
+            CACHE_MISSES.inc(cache="answer")
+            return update
+        
+        CACHE_HITS.inc(cache=cache_name)
+        logger.info(f"💾 Answer cache hit ({len(cached.answer)} chars)")
+        return {
+            "cache_hit": True,
+            "rag_context": cached.rag_context,
+            "messages": [AIMessage(content=cached.answer)]
+        }
+    
+    def route_after_cache(state: ChatState) -> str:
+        """Skip retrieval and generation on a cache hit"""
+        return "end" if state.get("cache_hit") else "rag"
+    
     async def rag_node(state: ChatState) -> ChatState:
         """Node to handle RAG retrieval based on flags"""
         logger.info(f"🚀 RAG node starting - case_rag: {state['is_case_rag']}, law_rag: {state['is_law_rag']}")
@@ -24,66 +145,83 @@ def create_chat_workflow():
         user_message = state["messages"][-1].content
         logger.info(f"RAG processing: '{user_message[:50]}{'...' if len(user_message) > 50 else ''}'")
         
-        # Case RAG
-        if state["is_case_rag"]:
+        # Retrieval only gets its share of the request deadline
+        rag_deadline = retrieval_deadline(state.get("deadline"))
+        
+        # Embed the query once and share the vector across case and law search
+        query_vector = state.get("query_vector")
+        failed_branches = []
+        if query_vector is None and (state["is_case_rag"] or state["is_law_rag"]):
             try:
-                case_pipeline = CaseRAGPipeline()
-                case_results = case_pipeline.search_by_text(user_message, limit=2)
-                
-                for i, result in enumerate(case_results):
-                    metadata = result["metadata"]
-                    content = f"""
-                    Case Title: {metadata.get('case_title', '')}
-                    Division: {metadata.get('division', '')}
-                    Law Category: {metadata.get('law_category', '')}
-                    Law Act: {metadata.get('law_act', '')}
-                    Reference: {metadata.get('reference', '')}
-                    Case Summary: {metadata.get('case_details', '')}
-                    """
-                    
-                    rag_context.append({
-                        "type": "case",
-                        "content": content.strip()
-                    })
-                    
-                    # Log truncated context preview (only first result for brevity)
-                    if i == 0:
-                        preview = content.strip()[:80] + "..." if len(content.strip()) > 80 else content.strip()
-                        logger.info(f"📋 Case RAG: {preview}")
-                
+                with QUERY_EMBEDDING_SECONDS.time():
+                    query_vector = await asyncio.wait_for(
+                        pipeline_registry.aembed_query(user_message),
+                        remaining(rag_deadline)
+                    )
+            except asyncio.TimeoutError:
+                failed_branches.append("embedding")
+                ERRORS.inc(stage="embedding")
+                logger.warning("⏱️ Query embedding exceeded the retrieval budget; continuing without RAG")
+            except Exception as e:
+                failed_branches.append("embedding")
+                ERRORS.inc(stage="embedding")
+                logger.error(f"Query embedding error: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+        
+        async def case_rag() -> List[Dict[str, Any]]:
+            """Case retrieval branch"""
+            try:
+                case_pipeline = pipeline_registry.case_pipeline
+                with CASE_SEARCH_SECONDS.time():
+                    case_results = await case_pipeline.asearch_by_vector(query_vector, limit=RAG_RESULT_LIMIT)
+                CONTEXT_ITEMS.inc(len(case_results), type="case")
                 logger.info(f"📋 Found {len(case_results)} case results")
+                return format_case_context(case_results)
             except Exception as e:
+                failed_branches.append("case")
+                ERRORS.inc(stage="case_search")
                 logger.error(f"Case RAG error: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+                return []
         
-        # Law RAG
-        if state["is_law_rag"]:
+        async def law_rag() -> List[Dict[str, Any]]:
+            """Law retrieval branch"""
             try:
-                law_pipeline = LawRAGPipeline()
-                law_results = law_pipeline.search_by_text(user_message, limit=2)
-                
-                for i, result in enumerate(law_results):
-                    metadata = result["metadata"]
-                    content = f"""
-                    Part Section: {metadata.get('part_section', '')}
-                    Law Text: {result.get('content', '')}
-                    """
-                    
-                    rag_context.append({
-                        "type": "law",
-                        "content": content.strip()
-                    })
-                    
-                    # Log truncated context preview (only first result for brevity)
-                    if i == 0:
-                        preview = content.strip()[:80] + "..." if len(content.strip()) > 80 else content.strip()
-                        logger.info(f"📜 Law RAG: {preview}")
-                
+                law_pipeline = pipeline_registry.law_pipeline
+                with LAW_SEARCH_SECONDS.time():
+                    law_results = await law_pipeline.asearch_by_vector(query_vector, limit=RAG_RESULT_LIMIT)
+                CONTEXT_ITEMS.inc(len(law_results), type="law")
                 logger.info(f"📜 Found {len(law_results)} law results")
+                return format_law_context(law_results)
             except Exception as e:
+                failed_branches.append("law")
+                ERRORS.inc(stage="law_search")
                 logger.error(f"Law RAG error: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+                return []
+        
+        # Run case and law retrieval concurrently; latency is the slower branch, not the sum.
+        # A branch still running at the retrieval deadline is dropped.
+        # (The semantic answer cache sets query_vector even when both RAG flags are off.)
+        branches = {}
+        if query_vector is not None:
+            if state["is_case_rag"]:
+                branches["case"] = asyncio.create_task(case_rag())
+            if state["is_law_rag"]:
+                branches["law"] = asyncio.create_task(law_rag())
+        if branches:
+            _, pending = await asyncio.wait(branches.values(), timeout=remaining(rag_deadline))
+            for name, task in branches.items():
+                if task in pending:
+                    task.cancel()
+                    failed_branches.append(name)
+                    ERRORS.inc(stage=f"{name}_search")
+                    logger.warning(f"⏱️ {name.capitalize()} RAG exceeded the retrieval budget; continuing without it")
+                else:
+                    rag_context.extend(task.result())
+            await asyncio.gather(*pending, return_exceptions=True)
         
         # Update state with RAG context
         state["rag_context"] = rag_context
+        state["query_vector"] = query_vector
+        state["rag_degraded"] = bool(failed_branches)
         logger.info(f"✅ RAG completed: {len(rag_context)} total items")
         return state
     
@@ -92,8 +230,8 @@ def create_chat_workflow():
         logger.info(f"🤖 LLM processing ({state['llm_model_id']}) with {len(state.get('rag_context', []))} context items")
         
         try:
-            # Initialize the LLM directly
-            chat_agent = ChatAgent(model_id=state["llm_model_id"])
+            # Reuse the long-lived agent for this model
+            chat_agent = get_chat_agent(state["llm_model_id"])
             
             # Get the latest user message
             user_message = ""
@@ -102,21 +240,53 @@ def create_chat_workflow():
                     user_message = msg.content
                     break
             
-            # Generate response using chat agent (which handles custom_llm internally)
-            response_text = await chat_agent.generate_response(
-                user_input=user_message,
-                rag_context=state["rag_context"]
-            )
+            # Generate response using chat agent (which handles custom_llm internally),
+            # within the model's concurrency limit so a slow backend cannot starve the others
+            # The LLM gets whatever is left of the request deadline
+            deadline = state.get("deadline")
+            if remaining(deadline) == 0:
+                raise DeadlineExceeded("Request deadline passed before the LLM call")
+            async with admission_controller.slot(state["llm_model_id"], timeout=remaining(deadline)):
+                response_text = await asyncio.wait_for(
+                    chat_agent.agenerate(
+                        user_input=user_message,
+                        rag_context=state["rag_context"]
+                    ),
+                    remaining(deadline)
+                )
             logger.info(f"✅ Response generated ({len(response_text)} chars)")
             
+            # Only complete answers are cached; errors and degraded retrieval are not
+            if settings.ANSWER_CACHE_ENABLED and not state.get("rag_degraded"):
+                answer_cache.put(
+                    _answer_scope(state),
+                    user_message,
+                    response_text,
+                    state["rag_context"],
+                    vector=state.get("query_vector")
+                )
+            
             # Add AI response to messages
-            from langchain_core.messages import AIMessage
             return {"messages": [AIMessage(content=response_text)]}
             
+        except (AdmissionRejected, DeadlineExceeded):
+            # Surfaced to the endpoint as 429/503 (with Retry-After) or 504
+            raise
+            
+        except asyncio.TimeoutError:
+            ERRORS.inc(stage="deadline")
+            logger.warning(f"⏱️ LLM call ({state['llm_model_id']}) exceeded the request deadline")
+            raise DeadlineExceeded(f"{state['llm_model_id']} did not answer within the request deadline")
+            
+        except CustomLLMError as e:
+            # Already a user-facing apology, and already counted as custom_llm_http
+            logger.warning(f"Custom LLM returned an error response: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
+            return {"messages": [AIMessage(content=str(e))]}
+            
         except Exception as e:
+            ERRORS.inc(stage="llm")
             logger.error(f"LLM node error: {str(e)[:200]}{'...' if len(str(e)) > 200 else ''}")
             error_response = f"I apologize, but I encountered an error: {str(e)}"
-            from langchain_core.messages import AIMessage
             return {"messages": [AIMessage(content=error_response)]}
     
     def end_node(state: ChatState) -> ChatState:
@@ -128,17 +298,19 @@ def create_chat_workflow():
     logger.info("StateGraph created with ChatState schema")
     
     # Add nodes
+    workflow.add_node("cache_lookup", cache_lookup_node)
     workflow.add_node("rag", rag_node)
     workflow.add_node("llm", llm_node)
     workflow.add_node("end", end_node)
-    logger.info("Added workflow nodes: rag, llm, end")
+    logger.info("Added workflow nodes: cache_lookup, rag, llm, end")
     
     # Define edges
-    workflow.add_edge(START, "rag")
+    workflow.add_edge(START, "cache_lookup")
+    workflow.add_conditional_edges("cache_lookup", route_after_cache, {"rag": "rag", "end": "end"})
     workflow.add_edge("rag", "llm")
     workflow.add_edge("llm", "end")
     workflow.add_edge("end", END)
-    logger.info("Defined workflow edges: START->rag->llm->end->END")
+    logger.info("Defined workflow edges: START->cache_lookup->(rag->llm|hit)->end->END")
     
     # No memory saver needed for stateless workflow
     logger.info("Workflow configured as stateless - no memory checkpointer")
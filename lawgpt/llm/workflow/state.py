@@ -1,4 +1,4 @@
-from typing import Annotated, TypedDict, List, Dict, Any
+from typing import Annotated, TypedDict, List, Dict, Any, Optional
 from langchain_core.messages import AnyMessage
 from langgraph.graph import add_messages
 
@@ -9,3 +9,7 @@ class ChatState(TypedDict):
     llm_model_id: str
     messages: Annotated[List[AnyMessage], add_messages]
     rag_context: List[Dict[str, Any]]
+    query_vector: Optional[List[float]]  # shared query embedding, computed at most once per request
+    rag_degraded: bool  # a retrieval branch failed; the answer is not cached
+    cache_hit: bool
+    deadline: Optional[float]  # time.monotonic() by which the answer must be ready
@@ -4,10 +4,16 @@ Main FastAPI application for LawGPT
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from lawgpt.api.endpoint.chat import router as chat_router
 from lawgpt.core.config import settings
+from lawgpt.core.metrics import metrics_registry
+from lawgpt.data_pipeline.collection_version import collection_versions
+from lawgpt.data_pipeline.registry import pipeline_registry
+from lawgpt.data_pipeline.retrieval_cache import retrieval_cache
+from lawgpt.llm.workflow.custom_llm_transport import close_custom_llm_transport
 
 # Configure logging
 logging.basicConfig(
@@ -37,7 +43,11 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting LawGPT application...")
     logger.info("📝 Logging system initialized - RAG context logs will be visible")
     
-    # Initialize session workflows storage
+    # Build the search-only RAG pipelines once for the whole process
+    pipeline_registry.initialize()
+    
+    # Load collection versions before serving; with Redis they refresh in the background
+    await collection_versions.start()
     
     logger.info("System initialized with session-based memory management")
     
@@ -45,6 +55,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down LawGPT application...")
+    await pipeline_registry.aclose()
+    await close_custom_llm_transport()
+    await retrieval_cache.aclose()
+    await collection_versions.aclose()
 
 
 def create_app() -> FastAPI:
@@ -76,6 +90,11 @@ def create_app() -> FastAPI:
     async def health_check():
         return {"status": "healthy"}
     
+    @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+    async def metrics():
+        """Prometheus scrape endpoint (per-process metrics)"""
+        return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+    
     return app
 
 
@@ -0,0 +1,70 @@
+"""
+Local stand-in for the custom (Modal) model endpoint.
+
+Accepts the same payload as the Modal inference API and returns a deterministic
+answer, so the custom_llm transport can be exercised offline. When the payload
+has "stream": true the answer is sent as a chunked text/plain body.
+
+Usage:
+    python -m lawgpt.service.custom_llm_stub --port 8001 --latency 0.5
+    CUSTOM_MODEL_URL=http://127.0.0.1:8001 uv run uvicorn lawgpt.main:app
+"""
+
+import argparse
+import asyncio
+from typing import Any, Dict
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+def create_stub_app(latency: float = 0.0, chunk_delay: float = 0.01) -> FastAPI:
+    """Build the stand-in app; latency is added before the first byte"""
+    app = FastAPI(title="Custom LLM stand-in")
+
+    @app.post("/")
+    async def inference(request: Request):
+        payload: Dict[str, Any] = await request.json()
+        answer = _build_answer(payload)
+        await asyncio.sleep(latency)
+
+        if payload.get("stream"):
+            async def body():
+                for word in answer.split(" "):
+                    yield word + " "
+                    await asyncio.sleep(chunk_delay)
+
+            return StreamingResponse(body(), media_type="text/plain")
+
+        return JSONResponse({"response": answer})
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    return app
+
+
+def _build_answer(payload: Dict[str, Any]) -> str:
+    """Deterministic reply describing what the stand-in received"""
+    user_prompt = payload.get("user_prompt", "")
+    rag_context = payload.get("rag_context", "")
+    return (
+        f"Stub answer to: {user_prompt[:80]} "
+        f"(rag_context: {len(rag_context)} chars, max_new_tokens: {payload.get('max_new_tokens')})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the custom LLM stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before the first byte")
+    args = parser.parse_args()
+
+    import uvicorn
+    uvicorn.run(create_stub_app(latency=args.latency), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
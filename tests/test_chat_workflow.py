@@ -0,0 +1,51 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+from langchain_core.messages import HumanMessage
+
+from lawgpt.core.config import settings
+from lawgpt.llm.workflow import graph
+from lawgpt.llm.workflow.answer_cache import answer_cache
+from lawgpt.llm.workflow.deadline import resolve_deadline
+
+
+class ChatWorkflowTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        answer_cache.clear()
+        patches = [
+            mock.patch.object(settings, "ANSWER_CACHE_ENABLED", True),
+            mock.patch.object(answer_cache, "semantic_distance", 0.1),
+            mock.patch.object(graph.pipeline_registry, "aembed_query", mock.AsyncMock(return_value=[1.0, 0.0, 0.0])),
+        ]
+        self.agent = mock.Mock()
+        self.agent.agenerate = mock.AsyncMock(return_value="Section 379 answer")
+        patches.append(mock.patch.object(graph, "get_chat_agent", return_value=self.agent))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(answer_cache.clear)
+
+    async def test_semantic_cache_without_rag_flags(self):
+        """The semantic tier embeds the query; with both RAG flags off rag_node must not search"""
+        workflow = graph.create_chat_workflow()
+        result = await workflow.ainvoke({
+            "messages": [HumanMessage(content="What is the punishment for theft?")],
+            "is_case_rag": False,
+            "is_law_rag": False,
+            "llm_model_id": "gemini",
+            "rag_context": [],
+            "deadline": resolve_deadline("gemini"),
+        })
+
+        self.assertEqual(result["messages"][-1].content, "Section 379 answer")
+        self.assertEqual(result["rag_context"], [])
+        self.assertFalse(result["rag_degraded"])
+        self.agent.agenerate.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
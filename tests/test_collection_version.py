@@ -0,0 +1,77 @@
+import asyncio
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+from lawgpt.data_pipeline.collection_version import RedisCollectionVersionTracker
+
+PREFIX = "lawgpt:collection_version:"
+
+
+class FakeRedis:
+    """Sync and async client views over one dict of counters"""
+
+    def __init__(self):
+        self.values = {}
+        self.sync = mock.Mock()
+        self.sync.get.side_effect = lambda key: self.values.get(key)
+        self.sync.incr.side_effect = self.incr
+        self.aio = mock.Mock()
+        self.aio.mget = mock.AsyncMock(side_effect=lambda keys: [self.values.get(key) for key in keys])
+        self.aio.aclose = mock.AsyncMock()
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key) or 0) + 1
+        return self.values[key]
+
+    def modules(self):
+        redis = types.ModuleType("redis")
+        redis.Redis = mock.Mock(from_url=mock.Mock(return_value=self.sync))
+        redis.asyncio = types.ModuleType("redis.asyncio")
+        redis.asyncio.Redis = mock.Mock(from_url=mock.Mock(return_value=self.aio))
+        return {"redis": redis, "redis.asyncio": redis.asyncio}
+
+
+class RedisCollectionVersionTrackerTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.redis.values[PREFIX + "laws"] = b"3"
+        with mock.patch.dict(sys.modules, self.redis.modules()):
+            self.tracker = RedisCollectionVersionTracker("redis://test", refresh_seconds=0.01, collections=["laws"])
+
+    async def asyncTearDown(self):
+        await self.tracker.aclose()
+
+    async def test_get_reads_the_snapshot_inside_an_event_loop(self):
+        await self.tracker.start()
+        self.assertEqual(self.tracker.get("laws"), 3)
+        self.assertEqual(self.tracker.get("cases"), 0)
+        self.redis.sync.get.assert_not_called()
+
+    async def test_background_refresh_picks_up_bumps_from_other_processes(self):
+        await self.tracker.start()
+        self.tracker.get("cases")
+        self.redis.values[PREFIX + "laws"] = b"4"
+        self.redis.values[PREFIX + "cases"] = b"1"
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.tracker.get("laws"), 4)
+        self.assertEqual(self.tracker.get("cases"), 1)
+
+    async def test_failed_refresh_keeps_the_snapshot(self):
+        await self.tracker.start()
+        self.redis.aio.mget.side_effect = ConnectionError("down")
+        await self.tracker.arefresh()
+        self.assertEqual(self.tracker.get("laws"), 3)
+
+    def test_get_reads_redis_outside_an_event_loop(self):
+        self.assertEqual(self.tracker.get("laws"), 3)
+        self.assertEqual(self.tracker.bump("laws"), 4)
+        self.assertEqual(self.tracker.get("laws"), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
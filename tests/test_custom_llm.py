@@ -0,0 +1,55 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+from langchain_core.messages import HumanMessage
+
+from lawgpt.core.metrics import ERRORS
+from lawgpt.llm.workflow import custom_llm
+from lawgpt.llm.workflow.custom_llm import CustomLLMAPI
+
+
+def http_errors() -> float:
+    return ERRORS._values.get(("custom_llm_http",), 0.0)
+
+
+class FailingTransport:
+    async def post(self, url, payload):
+        raise ConnectionError("connection refused")
+
+    async def stream(self, url, payload):
+        raise ConnectionError("connection refused")
+        yield ""
+
+    def post_sync(self, url, payload):
+        raise ConnectionError("connection refused")
+
+
+class CustomLLMErrorTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patch = mock.patch.object(custom_llm, "get_custom_llm_transport", return_value=FailingTransport())
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.llm = CustomLLMAPI()
+        self.messages = [HumanMessage(content="What is the punishment for theft?")]
+
+    async def test_stream_error_is_counted(self):
+        before = http_errors()
+        chunks = [chunk async for chunk in self.llm._astream(self.messages)]
+
+        self.assertEqual(len(chunks), 1)
+        self.assertTrue(chunks[0].message.response_metadata["error"])
+        self.assertEqual(http_errors(), before + 1)
+
+    async def test_generate_error_is_counted(self):
+        before = http_errors()
+        result = await self.llm._agenerate(self.messages)
+
+        self.assertTrue(result.generations[0].message.response_metadata["error"])
+        self.assertEqual(http_errors(), before + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
+
+from benchmarks.fakes import FakeEmbeddings
+from lawgpt.data_pipeline import migrate_law_sections, rag_law_pipeline
+from lawgpt.data_pipeline.migrate_law_sections import migrate
+from lawgpt.data_pipeline.rag_law_pipeline import LawRAGPipeline
+
+DIMENSION = 8
+
+
+class MigrateLawSectionsTest(unittest.TestCase):
+    def setUp(self):
+        with mock.patch.object(rag_law_pipeline, "QdrantClient", lambda **kwargs: QdrantClient(":memory:")), \
+                mock.patch.object(rag_law_pipeline, "AsyncQdrantClient", lambda **kwargs: AsyncQdrantClient(":memory:")):
+            self.pipeline = LawRAGPipeline(
+                embeddings=FakeEmbeddings(dimension=DIMENSION),
+                dimension=DIMENSION,
+                collection_name="test_law_chunks"
+            )
+        patch = mock.patch.object(migrate_law_sections, "collection_versions")
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        vector = [1.0] + [0.0] * (DIMENSION - 1)
+        self.pipeline.qdrant_client.upsert(collection_name=self.pipeline.collection_name, points=[
+            models.PointStruct(id=1, vector=vector, payload={
+                "part_section": "Section 378", "chunk_content": "Theft, part one", "law_text": "Theft, full text"
+            }),
+            models.PointStruct(id=2, vector=vector, payload={
+                "part_section": "Section 379", "law_text": "Punishment for theft"
+            }),
+        ])
+
+    def payload(self, point_id):
+        return self.pipeline.qdrant_client.retrieve(self.pipeline.collection_name, [point_id])[0].payload
+
+    def test_moves_law_text_into_sections(self):
+        stats = migrate(self.pipeline)
+
+        self.assertEqual(stats["migrated"], 2)
+        self.assertEqual(stats["sections"], 2)
+        chunked = self.payload(1)
+        self.assertNotIn("law_text", chunked)
+        self.assertEqual(chunked["chunk_content"], "Theft, part one")
+        section = self.pipeline.section_store.get_section(chunked["section_id"])
+        self.assertEqual(section["law_text"], "Theft, full text")
+
+    def test_point_without_chunk_content_keeps_its_text(self):
+        stats = migrate(self.pipeline)
+
+        unchunked = self.payload(2)
+        self.assertNotIn("law_text", unchunked)
+        self.assertEqual(unchunked["chunk_content"], "Punishment for theft")
+        self.assertEqual(stats["bytes_removed"], len("Theft, full text"))
+
+    def test_rerun_skips_migrated_points(self):
+        migrate(self.pipeline)
+        stats = migrate(self.pipeline)
+
+        self.assertEqual(stats["migrated"], 0)
+        self.assertEqual(stats["skipped"], 2)
+
+    def test_dry_run_changes_nothing(self):
+        migrate(self.pipeline, dry_run=True)
+
+        self.assertEqual(self.payload(2), {"part_section": "Section 379", "law_text": "Punishment for theft"})
+
+
+if __name__ == "__main__":
+    unittest.main()
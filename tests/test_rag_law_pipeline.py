@@ -0,0 +1,67 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
+
+from benchmarks.fakes import FakeEmbeddings
+from lawgpt.data_pipeline import rag_law_pipeline
+from lawgpt.data_pipeline.rag_law_pipeline import LawRAGPipeline
+
+DIMENSION = 8
+VECTOR = [1.0] + [0.0] * (DIMENSION - 1)
+POINTS = [
+    models.PointStruct(id=1, vector=VECTOR, payload={
+        "part_section": "Section 378", "section_id": "s378", "chunk_content": "Theft, part one"
+    }),
+    models.PointStruct(id=2, vector=VECTOR, payload={
+        "part_section": "Section 379", "law_text": "Punishment for theft"
+    }),
+]
+
+
+class LegacyContentTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        with mock.patch.object(rag_law_pipeline, "QdrantClient", lambda **kwargs: QdrantClient(":memory:")), \
+                mock.patch.object(rag_law_pipeline, "AsyncQdrantClient", lambda **kwargs: AsyncQdrantClient(":memory:")):
+            self.pipeline = LawRAGPipeline(
+                embeddings=FakeEmbeddings(dimension=DIMENSION),
+                dimension=DIMENSION,
+                collection_name="test_law_chunks"
+            )
+        await self.pipeline.async_qdrant_client.create_collection(
+            collection_name=self.pipeline.collection_name,
+            vectors_config=models.VectorParams(size=DIMENSION, distance=models.Distance.COSINE)
+        )
+        self.pipeline.qdrant_client.upsert(collection_name=self.pipeline.collection_name, points=POINTS)
+        await self.pipeline.async_qdrant_client.upsert(collection_name=self.pipeline.collection_name, points=POINTS)
+        patch = mock.patch.object(rag_law_pipeline.retrieval_cache, "backend", None)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def assert_contents(self, results):
+        contents = {result["id"]: result["content"] for result in results}
+        self.assertEqual(contents, {1: "Theft, part one", 2: "Punishment for theft"})
+        self.assertNotIn("law_text", next(result for result in results if result["id"] == 1)["payload"])
+
+    def test_search_fetches_law_text_only_for_legacy_points(self):
+        self.assertNotIn("law_text", LawRAGPipeline.SEARCH_PAYLOAD_FIELDS)
+        self.assert_contents(self.pipeline.search_by_vector(VECTOR))
+
+    async def test_async_search_fetches_law_text_only_for_legacy_points(self):
+        with mock.patch.object(self.pipeline, "aretrieve", wraps=self.pipeline.aretrieve) as aretrieve:
+            self.assert_contents(await self.pipeline.asearch_by_vector(VECTOR))
+        aretrieve.assert_awaited_once_with([2], ["law_text"])
+
+    async def test_batch_search_fetches_law_text_once(self):
+        with mock.patch.object(self.pipeline, "aretrieve", wraps=self.pipeline.aretrieve) as aretrieve:
+            results = await self.pipeline.asearch_batch_by_vectors([VECTOR, VECTOR])
+        for query_results in results:
+            self.assert_contents(query_results)
+        aretrieve.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+from lawgpt.data_pipeline.embedding_store import EmbeddingStore
+from lawgpt.llm.case_summarizer.summary_cache import CaseSummaryCache
+
+# More keys than one IN (...) query binds
+COUNT = 1200
+
+
+class SqliteCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = tmp.name
+
+    def test_summary_cache_reads_more_keys_than_one_query_binds(self):
+        cache = CaseSummaryCache(os.path.join(self.directory, "summaries.sqlite3"))
+        cache.put_many({f"key-{i}": f"summary {i}" for i in range(COUNT)})
+
+        found = cache.get_many([f"key-{i}" for i in range(COUNT + 10)] + ["key-0"])
+
+        self.assertEqual(len(found), COUNT)
+        self.assertEqual(found["key-999"], "summary 999")
+        self.assertEqual(cache.misses, 10)
+
+    def test_embedding_store_reads_more_texts_than_one_query_binds(self):
+        store = EmbeddingStore(self.directory)
+        texts = [f"chunk {i}" for i in range(COUNT)]
+        store.put_many("model", "RETRIEVAL_DOCUMENT", 2, texts, [[float(i), 1.0] for i in range(COUNT)])
+
+        vectors = store.get_many("model", "RETRIEVAL_DOCUMENT", 2, texts + ["unknown", "chunk 0"])
+
+        self.assertEqual(vectors[999], [999.0, 1.0])
+        self.assertIsNone(vectors[COUNT])
+        self.assertEqual(vectors[-1], [0.0, 1.0])
+        self.assertIsNone(store.get_many("model", "RETRIEVAL_QUERY", 2, ["chunk 0"])[0])
+
+
+if __name__ == "__main__":
+    unittest.main()